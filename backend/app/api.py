@@ -2,24 +2,48 @@
 FastAPI routers matching frontend contracts exactly.
 """
 
-from fastapi import APIRouter, HTTPException, status
+import base64
+import binascii
+import hashlib
+import json
+import os
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.models import (
     VerifyArticleRequest,
     CreatePostRequest,
     VerificationReport,
+    BulkVerifyRequest,
+    JobStatus,
     Post,
 )
-from app.services.verify import run_verification
-from app.db import get_report, save_post, get_posts, clear_posts, init_db
+from app.services.verify import run_verification_async, stream_verification, verify_bulk
+from app.services.jobs import enqueue_verification
+from app.db import (
+    get_report,
+    get_report_json,
+    get_job,
+    save_post,
+    get_posts,
+    clear_posts,
+    get_feed_version,
+    init_db,
+)
+from app.utils.responses import fast_json_response, json_bytes_response, model_response
 import uuid
 from datetime import datetime
+from typing import AsyncIterator, Optional
 
 router = APIRouter(prefix="/api", tags=["api"])
 
+# Max items accepted by one /verifyArticle/bulk request
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "50000"))
+
 
 @router.post("/verifyArticle", response_model=VerificationReport)
-def verify_article(req: VerifyArticleRequest):
+async def verify_article(req: VerifyArticleRequest):
     """
     Verify an article by URL or raw text.
     Returns VerificationReport matching frontend contract.
@@ -29,25 +53,140 @@ def verify_article(req: VerifyArticleRequest):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Provide either 'url' or 'raw_text'",
         )
-    report = run_verification(url=req.url, raw_text=req.raw_text)
+    report = await run_verification_async(
+        url=req.url,
+        raw_text=req.raw_text,
+        force_refresh=req.force_refresh,
+        time_budget=req.time_budget,
+    )
     if not report:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Could not extract article content. Check URL or provide raw_text.",
         )
-    return report
+    return model_response(report)
 
 
-@router.get("/reports/{verification_id}", response_model=VerificationReport)
-def get_verification_report(verification_id: str):
-    """Return full VerificationReport for report page."""
-    report_dict = get_report(verification_id)
-    if not report_dict:
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _verification_events(req: VerifyArticleRequest) -> AsyncIterator[str]:
+    emitted = False
+    async for event, value in stream_verification(
+        url=req.url,
+        raw_text=req.raw_text,
+        force_refresh=req.force_refresh,
+        time_budget=req.time_budget,
+    ):
+        emitted = True
+        yield _sse(event, value.model_dump_json())
+    if not emitted:
+        yield _sse("error", json.dumps({
+            "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY,
+            "detail": "Could not extract article content. Check URL or provide raw_text.",
+        }))
+
+
+@router.post("/verifyArticle/stream")
+async def verify_article_stream(req: VerifyArticleRequest):
+    """
+    Server-Sent Events variant of /verifyArticle. Emits `article`, `analysis`,
+    one `claim` per ClaimResult as it resolves, then `report` (final score and
+    decision). A cached report is sent as a single `report` event; extraction
+    failure is sent as an `error` event.
+    """
+    if not req.url and not req.raw_text:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Report not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide either 'url' or 'raw_text'",
         )
-    return report_dict
+    return StreamingResponse(
+        _verification_events(req),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _bulk_lines(req: BulkVerifyRequest) -> AsyncIterator[str]:
+    async for result in verify_bulk(req.items):
+        yield result.model_dump_json(exclude_none=True) + "\n"
+
+
+@router.post("/verifyArticle/bulk")
+async def verify_article_bulk(req: BulkVerifyRequest):
+    """
+    Verify a batch of URLs / raw texts. Streams NDJSON, one line per input item
+    in completion order: {"index", "status_code": 200, "report"} or
+    {"index", "status_code", "error"}. Duplicate items are verified once.
+    """
+    if len(req.items) > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {BULK_MAX_ITEMS} items per request",
+        )
+    return StreamingResponse(
+        _bulk_lines(req),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/verifyArticle/job", response_model=JobStatus, status_code=status.HTTP_202_ACCEPTED)
+def enqueue_verify_article(req: VerifyArticleRequest):
+    """
+    Queue a verification and return its id immediately. A worker runs the
+    pipeline; poll GET /api/reports/{verification_id} for the result.
+    """
+    if not req.url and not req.raw_text:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide either 'url' or 'raw_text'",
+        )
+    verification_id = enqueue_verification(
+        url=req.url,
+        raw_text=req.raw_text,
+        force_refresh=req.force_refresh,
+        time_budget=req.time_budget,
+    )
+    return model_response(
+        JobStatus(verification_id=verification_id, status="pending"),
+        status_code=status.HTTP_202_ACCEPTED,
+    )
+
+
+@router.get(
+    "/reports/{verification_id}",
+    response_model=VerificationReport,
+    responses={
+        status.HTTP_200_OK: {"description": "The report, or for a failed job its JobStatus (status 'failed' with its error)"},
+        status.HTTP_202_ACCEPTED: {"model": JobStatus, "description": "Job still pending or running"},
+    },
+)
+def get_verification_report(verification_id: str):
+    """
+    Return full VerificationReport for report page, sent as the stored JSON
+    bytes. For a queued job that has not finished, returns 202 with its
+    JobStatus. A failed job is a finished job, not a server fault: 200 with
+    its JobStatus (status "failed" and the error); clients check status.
+    """
+    report_json = get_report_json(verification_id)
+    if report_json:
+        return json_bytes_response(report_json)
+    job = get_job(verification_id)
+    if job and job["status"] in ("pending", "running"):
+        return model_response(
+            JobStatus(verification_id=verification_id, status=job["status"]),
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+    if job and job["status"] == "failed":
+        return model_response(
+            JobStatus(verification_id=verification_id, status="failed", error=job["error"])
+        )
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Report not found",
+    )
 
 
 @router.post("/posts", response_model=Post)
@@ -94,13 +233,57 @@ def create_post(req: CreatePostRequest):
         "summary": report_dict.get("summary", ""),
     }
     save_post(post)
-    return post
+    return fast_json_response(post)
+
+
+def _encode_cursor(post: dict) -> str:
+    raw = f"{post['created_at']}|{post['id']}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, post_id = raw.split("|", 1)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return created_at, post_id
+
+
+@router.get("/posts", response_model=list[Post])
+def list_posts(
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+    since: Optional[str] = Query(None, description="X-Feed-Head of the last poll: only newer posts"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Return posts for the feed, newest first. Page deeper with `cursor`; poll for
+    new posts with `since`. Responses carry a feed-version ETag, and a matching
+    If-None-Match returns 304 without reading SQLite.
+    """
+    # Same feed version, different page -> different representation
+    page = hashlib.blake2b(f"{limit}|{cursor or ''}|{since or ''}".encode(), digest_size=6).hexdigest()
+    etag = f'W/"feed-{get_feed_version()}-{page}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match and etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
+    before = _decode_cursor(cursor) if cursor else None
+    after = _decode_cursor(since) if since else None
+    posts = get_posts(limit=limit, before=before, after=after)
 
-@router.get("/posts")
-def list_posts():
-    """Return latest posts for feed."""
-    return get_posts()
+    if posts:
+        headers["X-Feed-Head"] = _encode_cursor(posts[0])
+    elif since:
+        headers["X-Feed-Head"] = since
+    if len(posts) == limit and not since:
+        headers["X-Next-Cursor"] = _encode_cursor(posts[-1])
+    # Rows come straight from SQLite; skip response_model re-validation
+    return fast_json_response(posts, headers=headers)
 
 
 @router.delete("/posts")
@@ -3,31 +3,144 @@ SQLite persistence for posts and claim memory (Backboard fallback cache).
 """
 
 import json
-import sqlite3
 import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
 from pathlib import Path
-from contextlib import contextmanager
-from typing import Optional
+from contextlib import contextmanager, asynccontextmanager
+from typing import Iterator, Optional
+
+import aiosqlite
+
+from app.utils.metrics import STAGE_SECONDS
 
 # Default DB path (relative to backend/)
 DB_DIR = Path(__file__).resolve().parent.parent
 DB_PATH = os.getenv("SQLITE_DB_PATH", str(DB_DIR / "data" / "realorrender.db"))
+# Store report_json zlib-compressed (as a BLOB); plain-text rows stay readable either way
+REPORT_COMPRESSION = os.getenv("REPORT_COMPRESSION", "false").lower() in ("1", "true", "yes")
+# Feed version stamp, shared by every process using DB_PATH (see get_feed_version)
+FEED_VERSION_PATH = Path(DB_PATH).with_suffix(".feed-version")
+
+# Cache lifetimes, shared by the services that read the caches and by maintenance
+# How long a stored report is reused for the same canonical URL (0 disables)
+ARTICLE_CACHE_TTL = int(os.getenv("ARTICLE_CACHE_TTL", "21600"))  # seconds
+# How long a parsed Gemini analysis of identical article text is reused
+GEMINI_CACHE_TTL = int(os.getenv("GEMINI_CACHE_TTL", str(7 * 86400)))  # seconds, 0 disables
+
+
+# Connection pool + pragmas
+SQLITE_POOL_SIZE = int(os.getenv("SQLITE_POOL_SIZE", "8"))  # idle connections kept open
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "16384"))  # per connection
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024)))
+
+_PRAGMAS = (
+    # Only takes effect on a new database (before WAL writes the header); see app.services.maintenance
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+    f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}",
+    f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+    "PRAGMA temp_store=MEMORY",
+)
+
+_db_dir_ready = False
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=max(1, SQLITE_POOL_SIZE))
+_async_pool: list[aiosqlite.Connection] = []
 
 
 def _ensure_db_dir():
-    Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+    global _db_dir_ready
+    if not _db_dir_ready:
+        Path(DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+        _db_dir_ready = True
+
+
+def _connect() -> sqlite3.Connection:
+    _ensure_db_dir()
+    # Pooled connections move between threads, but only one thread uses each at a time
+    conn = sqlite3.connect(DB_PATH, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
 
 @contextmanager
 def get_connection():
+    """
+    Borrow a pooled connection. Commits on success, rolls back on error,
+    and returns the connection to the pool instead of closing it.
+    Time held (queries + commit) is recorded as the "db" stage.
+    """
+    started = time.perf_counter()
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _connect()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        try:
+            _pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="db")
+
+
+async def _connect_async() -> aiosqlite.Connection:
     _ensure_db_dir()
-    conn = sqlite3.connect(DB_PATH)
+    conn = aiosqlite.connect(DB_PATH, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000)
+    # Idle pooled connections must not keep the interpreter alive at exit
+    conn.daemon = True
+    await conn
     conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        await conn.execute(pragma)
+    return conn
+
+
+@asynccontextmanager
+async def get_async_connection():
+    """aiosqlite counterpart of get_connection for the async pipeline."""
+    started = time.perf_counter()
+    conn = _async_pool.pop() if _async_pool else await _connect_async()
     try:
         yield conn
-        conn.commit()
+        await conn.commit()
+    except BaseException:
+        await conn.rollback()
+        raise
     finally:
-        conn.close()
+        if len(_async_pool) < SQLITE_POOL_SIZE:
+            _async_pool.append(conn)
+        else:
+            await conn.close()
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="db")
+
+
+def close_pool() -> None:
+    """Close idle pooled sync connections (shutdown / tests)."""
+    while True:
+        try:
+            _pool.get_nowait().close()
+        except queue.Empty:
+            break
+
+
+async def close_async_pool() -> None:
+    """Close idle pooled aiosqlite connections."""
+    while _async_pool:
+        await _async_pool.pop().close()
 
 
 def init_db():
@@ -62,8 +175,94 @@ def init_db():
                 created_at TEXT NOT NULL
             );
 
-            CREATE INDEX IF NOT EXISTS idx_posts_created ON posts(created_at DESC);
+            -- Article cache: canonical URL -> latest report for that URL
+            CREATE TABLE IF NOT EXISTS article_cache (
+                url_key TEXT PRIMARY KEY,
+                verification_id TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            );
+
+            -- Near-duplicate claim index: similarity tokens + MinHash LSH buckets
+            CREATE TABLE IF NOT EXISTS claim_similarity (
+                claim_hash TEXT PRIMARY KEY,
+                tokens TEXT NOT NULL
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS claim_lsh (
+                bucket INTEGER NOT NULL,
+                claim_hash TEXT NOT NULL,
+                PRIMARY KEY (bucket, claim_hash)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_claim_lsh_hash ON claim_lsh(claim_hash);
+
+            -- Gemini analysis cache: hash(prompt version, model, article text) -> GeminiOutput JSON
+            CREATE TABLE IF NOT EXISTS gemini_cache (
+                content_key TEXT PRIMARY KEY,
+                output_json TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            );
+
+            -- Article fetch cache metadata; compressed HTML lives in FETCH_CACHE_DIR
+            CREATE TABLE IF NOT EXISTS fetch_cache (
+                url_key TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                article_blob BLOB,  -- zlib JSON of the extraction, NULL if nothing was extracted
+                parser_version TEXT NOT NULL,
+                size INTEGER NOT NULL,  -- compressed bytes on disk + article_blob
+                validated_at TEXT NOT NULL,
+                accessed_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_fetch_cache_accessed ON fetch_cache(accessed_at);
+
+            -- Verification job queue (POST /api/verifyArticle/job)
+            CREATE TABLE IF NOT EXISTS verification_jobs (
+                verification_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,  -- pending | running | done | failed
+                request_json TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                worker_id TEXT,
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT,
+                heartbeat_at TEXT  -- refreshed while running; stale = worker died
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON verification_jobs(status, created_at);
+
+            -- Feed order and keyset pagination on (created_at, id)
+            DROP INDEX IF EXISTS idx_posts_created;
+            CREATE INDEX IF NOT EXISTS idx_posts_created_id ON posts(created_at DESC, id DESC);
+            CREATE INDEX IF NOT EXISTS idx_claim_memory_verdict_created ON claim_memory(verdict, created_at);
+
+            -- Report retention: age scan and "referenced by a post" check
+            CREATE INDEX IF NOT EXISTS idx_reports_created ON verification_reports(created_at);
+            CREATE INDEX IF NOT EXISTS idx_posts_verification ON posts(verification_id);
         """)
+        # Added after the first release of the job queue
+        job_columns = {r["name"] for r in conn.execute("PRAGMA table_info(verification_jobs)")}
+        if "heartbeat_at" not in job_columns:
+            conn.execute("ALTER TABLE verification_jobs ADD COLUMN heartbeat_at TEXT")
+
+
+_SAVE_REPORT_SQL = """
+    INSERT OR REPLACE INTO verification_reports (verification_id, report_json, created_at)
+    VALUES (?, ?, ?)
+"""
+
+
+def _pack_report(report_json: str):
+    if REPORT_COMPRESSION:
+        return zlib.compress(report_json.encode("utf-8"))
+    return report_json
+
+
+def _unpack_report(stored) -> bytes:
+    """Stored report_json (TEXT, or zlib BLOB) as UTF-8 JSON bytes."""
+    if isinstance(stored, bytes):
+        return zlib.decompress(stored)
+    return stored.encode("utf-8")
 
 
 def save_report(verification_id: str, report_json: str):
@@ -71,24 +270,196 @@ def save_report(verification_id: str, report_json: str):
     import datetime
     with get_connection() as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO verification_reports (verification_id, report_json, created_at)
-            VALUES (?, ?, ?)
-            """,
-            (verification_id, report_json, datetime.datetime.utcnow().isoformat())
+            _SAVE_REPORT_SQL,
+            (verification_id, _pack_report(report_json), datetime.datetime.utcnow().isoformat())
         )
 
 
-def get_report(verification_id: str) -> Optional[dict]:
-    """Retrieve verification report by ID."""
+async def save_report_async(verification_id: str, report_json: str):
+    """Async variant of save_report."""
+    import datetime
+    async with get_async_connection() as conn:
+        await conn.execute(
+            _SAVE_REPORT_SQL,
+            (verification_id, _pack_report(report_json), datetime.datetime.utcnow().isoformat())
+        )
+
+
+def get_report_json(verification_id: str) -> Optional[bytes]:
+    """Stored report as JSON bytes, ready to send without parsing."""
     with get_connection() as conn:
         row = conn.execute(
             "SELECT report_json FROM verification_reports WHERE verification_id = ?",
             (verification_id,)
         ).fetchone()
-    if row:
-        return json.loads(row["report_json"])
-    return None
+    return _unpack_report(row["report_json"]) if row else None
+
+
+def get_report(verification_id: str) -> Optional[dict]:
+    """Retrieve verification report by ID."""
+    report_json = get_report_json(verification_id)
+    return json.loads(report_json) if report_json else None
+
+
+# --- Article cache (canonical URL -> stored report) ---
+
+_GET_ARTICLE_SQL = """
+    SELECT r.report_json FROM article_cache a
+    JOIN verification_reports r ON r.verification_id = a.verification_id
+    WHERE a.url_key = ? AND a.created_at >= ?
+"""
+_SAVE_ARTICLE_SQL = """
+    INSERT OR REPLACE INTO article_cache (url_key, verification_id, created_at)
+    VALUES (?, ?, ?)
+"""
+
+
+def _fresh_cutoff(max_age_seconds: float) -> str:
+    import datetime
+    return (datetime.datetime.utcnow() - datetime.timedelta(seconds=max_age_seconds)).isoformat()
+
+
+def get_cached_article(url_key: str, max_age_seconds: float) -> Optional[bytes]:
+    """Return the stored report JSON for a canonical URL if younger than max_age_seconds."""
+    with get_connection() as conn:
+        row = conn.execute(_GET_ARTICLE_SQL, (url_key, _fresh_cutoff(max_age_seconds))).fetchone()
+    return _unpack_report(row["report_json"]) if row else None
+
+
+async def get_cached_article_async(url_key: str, max_age_seconds: float) -> Optional[bytes]:
+    """Async variant of get_cached_article."""
+    async with get_async_connection() as conn:
+        async with conn.execute(_GET_ARTICLE_SQL, (url_key, _fresh_cutoff(max_age_seconds))) as cur:
+            row = await cur.fetchone()
+    return _unpack_report(row["report_json"]) if row else None
+
+
+def cache_article(url_key: str, verification_id: str):
+    """Point a canonical URL at its latest report."""
+    import datetime
+    with get_connection() as conn:
+        conn.execute(_SAVE_ARTICLE_SQL, (url_key, verification_id, datetime.datetime.utcnow().isoformat()))
+
+
+async def cache_article_async(url_key: str, verification_id: str):
+    """Async variant of cache_article."""
+    import datetime
+    async with get_async_connection() as conn:
+        await conn.execute(_SAVE_ARTICLE_SQL, (url_key, verification_id, datetime.datetime.utcnow().isoformat()))
+
+
+# --- Gemini analysis cache ---
+
+_GET_ANALYSIS_SQL = "SELECT output_json FROM gemini_cache WHERE content_key = ? AND created_at >= ?"
+_SAVE_ANALYSIS_SQL = """
+    INSERT OR REPLACE INTO gemini_cache (content_key, output_json, created_at)
+    VALUES (?, ?, ?)
+"""
+
+
+def get_cached_analysis(content_key: str, max_age_seconds: float) -> Optional[str]:
+    """Return cached GeminiOutput JSON younger than max_age_seconds (0 disables)."""
+    if max_age_seconds <= 0:
+        return None
+    with get_connection() as conn:
+        row = conn.execute(_GET_ANALYSIS_SQL, (content_key, _fresh_cutoff(max_age_seconds))).fetchone()
+    return row["output_json"] if row else None
+
+
+async def get_cached_analysis_async(content_key: str, max_age_seconds: float) -> Optional[str]:
+    """Async variant of get_cached_analysis."""
+    if max_age_seconds <= 0:
+        return None
+    async with get_async_connection() as conn:
+        async with conn.execute(_GET_ANALYSIS_SQL, (content_key, _fresh_cutoff(max_age_seconds))) as cur:
+            row = await cur.fetchone()
+    return row["output_json"] if row else None
+
+
+def cache_analysis(content_key: str, output_json: str):
+    """Store parsed GeminiOutput JSON for an analysis key."""
+    import datetime
+    with get_connection() as conn:
+        conn.execute(_SAVE_ANALYSIS_SQL, (content_key, output_json, datetime.datetime.utcnow().isoformat()))
+
+
+async def cache_analysis_async(content_key: str, output_json: str):
+    """Async variant of cache_analysis."""
+    import datetime
+    async with get_async_connection() as conn:
+        await conn.execute(_SAVE_ANALYSIS_SQL, (content_key, output_json, datetime.datetime.utcnow().isoformat()))
+
+
+# --- Article fetch cache ---
+
+def get_fetch_entry(url_key: str) -> Optional[dict]:
+    """Return fetch cache metadata (validators, article_blob, validated_at, ...) or None."""
+    with get_connection() as conn:
+        row = conn.execute("SELECT * FROM fetch_cache WHERE url_key = ?", (url_key,)).fetchone()
+    return dict(row) if row else None
+
+
+def save_fetch_entry(
+    url_key: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    content_type: str,
+    article_blob: Optional[bytes],
+    parser_version: str,
+    size: int,
+):
+    import datetime
+    now = datetime.datetime.utcnow().isoformat()
+    with get_connection() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO fetch_cache
+                (url_key, etag, last_modified, content_type, article_blob, parser_version, size, validated_at, accessed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (url_key, etag, last_modified, content_type, article_blob, parser_version, size, now, now)
+        )
+
+
+def touch_fetch_entry(url_key: str, validated: bool = False):
+    """Bump accessed_at (LRU order), and validated_at after a 304."""
+    import datetime
+    now = datetime.datetime.utcnow().isoformat()
+    with get_connection() as conn:
+        if validated:
+            conn.execute(
+                "UPDATE fetch_cache SET accessed_at = ?, validated_at = ? WHERE url_key = ?",
+                (now, now, url_key)
+            )
+        else:
+            conn.execute("UPDATE fetch_cache SET accessed_at = ? WHERE url_key = ?", (now, url_key))
+
+
+def update_fetch_article(url_key: str, article_blob: Optional[bytes], parser_version: str, size: int):
+    """Replace the stored extraction after re-parsing cached HTML."""
+    with get_connection() as conn:
+        conn.execute(
+            "UPDATE fetch_cache SET article_blob = ?, parser_version = ?, size = ? WHERE url_key = ?",
+            (article_blob, parser_version, size, url_key)
+        )
+
+
+def evict_fetch_entries(max_bytes: int) -> list[str]:
+    """Delete least recently accessed entries beyond max_bytes in total. Returns their url_keys."""
+    with get_connection() as conn:
+        rows = conn.execute(
+            """
+            DELETE FROM fetch_cache WHERE url_key IN (
+                SELECT url_key FROM (
+                    SELECT url_key, SUM(size) OVER (ORDER BY accessed_at DESC, url_key) AS running
+                    FROM fetch_cache
+                ) WHERE running > ?
+            )
+            RETURNING url_key
+            """,
+            (max_bytes,)
+        ).fetchall()
+    return [r["url_key"] for r in rows]
 
 
 def save_post(post: dict) -> dict:
@@ -113,16 +484,50 @@ def save_post(post: dict) -> dict:
                 post["summary"],
             )
         )
+    bump_feed_version()
     return post
 
 
-def get_posts(limit: int = 50) -> list[dict]:
-    """Fetch latest posts for feed."""
+_POST_COLUMNS = (
+    "id, verification_id, created_at, post_mode, decision, "
+    "credibility_score, article_title, article_url, publisher, summary"
+)
+
+
+def get_posts(
+    limit: int = 50,
+    before: Optional[tuple[str, str]] = None,
+    after: Optional[tuple[str, str]] = None,
+) -> list[dict]:
+    """
+    Fetch posts newest first, keyset-paginated on (created_at, id).
+    before: only posts older than this key (next page).
+    after: only posts newer than this key; returns the oldest `limit` of them
+    (still newest first), so a poller catches up without gaps.
+    """
     with get_connection() as conn:
-        rows = conn.execute(
-            "SELECT * FROM posts ORDER BY created_at DESC LIMIT ?",
-            (limit,)
-        ).fetchall()
+        if after:
+            rows = conn.execute(
+                f"""
+                SELECT {_POST_COLUMNS} FROM posts WHERE (created_at, id) > (?, ?)
+                ORDER BY created_at ASC, id ASC LIMIT ?
+                """,
+                (*after, limit)
+            ).fetchall()
+            rows.reverse()
+        elif before:
+            rows = conn.execute(
+                f"""
+                SELECT {_POST_COLUMNS} FROM posts WHERE (created_at, id) < (?, ?)
+                ORDER BY created_at DESC, id DESC LIMIT ?
+                """,
+                (*before, limit)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                f"SELECT {_POST_COLUMNS} FROM posts ORDER BY created_at DESC, id DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
     return [dict(r) for r in rows]
 
 
@@ -130,34 +535,417 @@ def clear_posts() -> None:
     """Clear all posts (for reset/fresh start)."""
     with get_connection() as conn:
         conn.execute("DELETE FROM posts")
+    bump_feed_version()
 
 
-# --- Claim memory (Backboard-style cache) ---
+# Last (inode, mtime) seen for FEED_VERSION_PATH and the version it held
+_feed_version_cache: tuple[Optional[tuple[int, int]], int] = (None, 0)
 
-def get_cached_claim(claim_hash: str) -> Optional[dict]:
-    """Return cached adjudication for a claim hash, or None."""
+
+def bump_feed_version() -> int:
+    """Record a feed change (called after posts are written). Returns the new version."""
+    global _feed_version_cache
+    version = time.time_ns()
+    _ensure_db_dir()
+    tmp = FEED_VERSION_PATH.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(str(version))
+    os.replace(tmp, FEED_VERSION_PATH)
+    st = FEED_VERSION_PATH.stat()
+    _feed_version_cache = ((st.st_ino, st.st_mtime_ns), version)
+    return version
+
+
+def get_feed_version() -> int:
+    """
+    Current feed version without touching SQLite: a stat() of FEED_VERSION_PATH,
+    re-read only when another process has replaced it. 0 before the first post.
+    """
+    global _feed_version_cache
+    try:
+        st = FEED_VERSION_PATH.stat()
+    except FileNotFoundError:
+        return 0
+    key = (st.st_ino, st.st_mtime_ns)
+    cached_key, version = _feed_version_cache
+    if key != cached_key:
+        try:
+            version = int(FEED_VERSION_PATH.read_text() or 0)
+        except (OSError, ValueError):
+            return 0
+        _feed_version_cache = (key, version)
+    return version
+
+
+# --- Verification jobs ---
+
+def create_job(verification_id: str, request: dict):
+    """Enqueue a pending verification job."""
+    import datetime
+    with get_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO verification_jobs (verification_id, status, request_json, created_at)
+            VALUES (?, 'pending', ?, ?)
+            """,
+            (verification_id, json.dumps(request), datetime.datetime.utcnow().isoformat())
+        )
+
+
+def get_job(verification_id: str) -> Optional[dict]:
+    """Return job row (status, error, attempts, timestamps) or None."""
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT * FROM verification_jobs WHERE verification_id = ?",
+            (verification_id,)
+        ).fetchone()
+    return dict(row) if row else None
+
+
+def claim_next_job(worker_id: str) -> Optional[dict]:
+    """Atomically move the oldest pending job to running and return it."""
+    import datetime
+    now = datetime.datetime.utcnow().isoformat()
     with get_connection() as conn:
         row = conn.execute(
-            "SELECT verdict, confidence, evidence_json FROM claim_memory WHERE claim_hash = ?",
-            (claim_hash,)
+            """
+            UPDATE verification_jobs
+            SET status = 'running', worker_id = ?, started_at = ?, heartbeat_at = ?, attempts = attempts + 1
+            WHERE verification_id = (
+                SELECT verification_id FROM verification_jobs
+                WHERE status = 'pending' ORDER BY created_at LIMIT 1
+            ) AND status = 'pending'
+            RETURNING verification_id, request_json, attempts
+            """,
+            (worker_id, now, now)
         ).fetchone()
+    if not row:
+        return None
+    return {
+        "verification_id": row["verification_id"],
+        "request": json.loads(row["request_json"]),
+        "attempts": row["attempts"],
+    }
+
+
+def finish_job(verification_id: str, error: Optional[str] = None):
+    """Mark a job done, or failed with an error message."""
+    import datetime
+    with get_connection() as conn:
+        conn.execute(
+            """
+            UPDATE verification_jobs SET status = ?, error = ?, finished_at = ?
+            WHERE verification_id = ?
+            """,
+            ("failed" if error else "done", error, datetime.datetime.utcnow().isoformat(), verification_id)
+        )
+
+
+def heartbeat_jobs(verification_ids: list[str]):
+    """Mark running jobs as still alive (called periodically by the process running them)."""
+    import datetime
+    if not verification_ids:
+        return
+    placeholders = ",".join("?" * len(verification_ids))
+    with get_connection() as conn:
+        conn.execute(
+            f"UPDATE verification_jobs SET heartbeat_at = ? WHERE status = 'running' AND verification_id IN ({placeholders})",
+            (datetime.datetime.utcnow().isoformat(), *verification_ids)
+        )
+
+
+def requeue_stale_jobs(lease_seconds: float, max_attempts: int) -> int:
+    """
+    Recover jobs left running by a dead worker: those whose heartbeat is more than
+    lease_seconds old. They go back to pending, or to failed once max_attempts is
+    reached. Returns jobs touched.
+    """
+    import datetime
+    now = datetime.datetime.utcnow()
+    cutoff = (now - datetime.timedelta(seconds=lease_seconds)).isoformat()
+    stale = "status = 'running' AND COALESCE(heartbeat_at, started_at) < ?"
+    with get_connection() as conn:
+        failed = conn.execute(
+            f"""
+            UPDATE verification_jobs
+            SET status = 'failed', error = 'Worker interrupted too many times', finished_at = ?
+            WHERE {stale} AND attempts >= ?
+            """,
+            (now.isoformat(), cutoff, max_attempts)
+        ).rowcount
+        requeued = conn.execute(
+            f"UPDATE verification_jobs SET status = 'pending', worker_id = NULL WHERE {stale}",
+            (cutoff,)
+        ).rowcount
+    return failed + requeued
+
+
+# --- Claim memory (Backboard-style cache) ---
+
+_GET_CLAIM_SQL = "SELECT verdict, confidence, evidence_json, created_at FROM claim_memory WHERE claim_hash = ?"
+_CACHE_CLAIM_SQL = """
+    INSERT OR REPLACE INTO claim_memory (claim_hash, verdict, confidence, evidence_json, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _claim_from_row(row) -> Optional[dict]:
     if row:
         return {
             "verdict": row["verdict"],
             "confidence": row["confidence"],
             "evidence": json.loads(row["evidence_json"]),
+            "created_at": row["created_at"],
         }
     return None
 
 
+def get_cached_claim(claim_hash: str) -> Optional[dict]:
+    """Return cached adjudication for a claim hash, or None."""
+    with get_connection() as conn:
+        row = conn.execute(_GET_CLAIM_SQL, (claim_hash,)).fetchone()
+    return _claim_from_row(row)
+
+
+async def get_cached_claim_async(claim_hash: str) -> Optional[dict]:
+    """Async variant of get_cached_claim."""
+    async with get_async_connection() as conn:
+        async with conn.execute(_GET_CLAIM_SQL, (claim_hash,)) as cur:
+            row = await cur.fetchone()
+    return _claim_from_row(row)
+
+
 def cache_claim(claim_hash: str, verdict: str, confidence: float, evidence: list[dict]):
     """Store claim adjudication for future lookups."""
     import datetime
     with get_connection() as conn:
         conn.execute(
-            """
-            INSERT OR REPLACE INTO claim_memory (claim_hash, verdict, confidence, evidence_json, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            _CACHE_CLAIM_SQL,
+            (claim_hash, verdict, confidence, json.dumps(evidence), datetime.datetime.utcnow().isoformat())
+        )
+
+
+async def cache_claim_async(claim_hash: str, verdict: str, confidence: float, evidence: list[dict]):
+    """Async variant of cache_claim."""
+    import datetime
+    async with get_async_connection() as conn:
+        await conn.execute(
+            _CACHE_CLAIM_SQL,
             (claim_hash, verdict, confidence, json.dumps(evidence), datetime.datetime.utcnow().isoformat())
         )
+
+
+_INDEX_SIMILARITY_SQL = "INSERT OR REPLACE INTO claim_similarity (claim_hash, tokens) VALUES (?, ?)"
+_INDEX_LSH_SQL = "INSERT OR IGNORE INTO claim_lsh (bucket, claim_hash) VALUES (?, ?)"
+
+
+def _similar_candidates_sql(n_buckets: int) -> str:
+    placeholders = ",".join("?" * n_buckets)
+    return f"""
+        SELECT DISTINCT s.claim_hash, s.tokens FROM claim_lsh l
+        JOIN claim_similarity s ON s.claim_hash = l.claim_hash
+        WHERE l.bucket IN ({placeholders})
+        LIMIT ?
+    """
+
+
+def index_claim_similarity(claim_hash: str, tokens: str, buckets: list[int]):
+    """Store a claim's similarity tokens and LSH buckets."""
+    with get_connection() as conn:
+        conn.execute(_INDEX_SIMILARITY_SQL, (claim_hash, tokens))
+        conn.executemany(_INDEX_LSH_SQL, [(b, claim_hash) for b in buckets])
+
+
+async def index_claim_similarity_async(claim_hash: str, tokens: str, buckets: list[int]):
+    """Async variant of index_claim_similarity."""
+    async with get_async_connection() as conn:
+        await conn.execute(_INDEX_SIMILARITY_SQL, (claim_hash, tokens))
+        await conn.executemany(_INDEX_LSH_SQL, [(b, claim_hash) for b in buckets])
+
+
+def find_similar_candidates(buckets: list[int], limit: int = 100) -> list[tuple[str, str]]:
+    """Return (claim_hash, tokens) of claims sharing at least one LSH bucket."""
+    with get_connection() as conn:
+        rows = conn.execute(_similar_candidates_sql(len(buckets)), (*buckets, limit)).fetchall()
+    return [(r["claim_hash"], r["tokens"]) for r in rows]
+
+
+async def find_similar_candidates_async(buckets: list[int], limit: int = 100) -> list[tuple[str, str]]:
+    """Async variant of find_similar_candidates."""
+    async with get_async_connection() as conn:
+        async with conn.execute(_similar_candidates_sql(len(buckets)), (*buckets, limit)) as cur:
+            rows = await cur.fetchall()
+    return [(r["claim_hash"], r["tokens"]) for r in rows]
+
+
+# Bulk load / snapshot (python -m app.warmup): a row only replaces an older one
+_UPSERT_CLAIM_SQL = """
+    INSERT INTO claim_memory (claim_hash, verdict, confidence, evidence_json, created_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(claim_hash) DO UPDATE SET
+        verdict = excluded.verdict,
+        confidence = excluded.confidence,
+        evidence_json = excluded.evidence_json,
+        created_at = excluded.created_at
+    WHERE excluded.created_at > claim_memory.created_at
+"""
+_EXPORT_CLAIMS_SQL = """
+    SELECT m.claim_hash, m.verdict, m.confidence, m.evidence_json, m.created_at, s.tokens,
+           (SELECT group_concat(l.bucket) FROM claim_lsh l WHERE l.claim_hash = m.claim_hash) AS buckets
+    FROM claim_memory m LEFT JOIN claim_similarity s ON s.claim_hash = m.claim_hash
+    WHERE m.claim_hash > ?
+    ORDER BY m.claim_hash
+    LIMIT ?
+"""
+
+
+def bulk_cache_claims(
+    claims: list[tuple],
+    similarity: list[tuple[str, str]],
+    lsh: list[tuple[int, str]],
+) -> int:
+    """
+    Upsert claim_memory rows (claim_hash, verdict, confidence, evidence_json, created_at)
+    and their near-duplicate index rows with executemany, in one transaction.
+    Returns claim_memory rows inserted or updated.
+    """
+    with get_connection() as conn:
+        written = conn.executemany(_UPSERT_CLAIM_SQL, claims).rowcount
+        conn.executemany(_INDEX_SIMILARITY_SQL, similarity)
+        conn.executemany(_INDEX_LSH_SQL, lsh)
+    return written
+
+
+def iter_claim_memory(batch_size: int = 5000) -> Iterator[list[sqlite3.Row]]:
+    """
+    All claim_memory rows with their similarity tokens and comma-separated LSH buckets
+    (NULL if not indexed), in claim_hash order. Each batch is a separate short read.
+    """
+    after = ""
+    while True:
+        with get_connection() as conn:
+            rows = conn.execute(_EXPORT_CLAIMS_SQL, (after, batch_size)).fetchall()
+        if not rows:
+            return
+        yield rows
+        after = rows[-1]["claim_hash"]
+
+
+def delete_expired_claims(cutoffs: dict[str, str]) -> int:
+    """
+    Delete claim_memory rows older than their verdict's cutoff, along with
+    their near-duplicate index entries.
+    cutoffs maps verdict -> ISO timestamp; rows created before it are removed.
+    """
+    deleted = 0
+    with get_connection() as conn:
+        for verdict, cutoff in cutoffs.items():
+            expired = "SELECT claim_hash FROM claim_memory WHERE verdict = ? AND created_at < ?"
+            conn.execute(f"DELETE FROM claim_lsh WHERE claim_hash IN ({expired})", (verdict, cutoff))
+            conn.execute(f"DELETE FROM claim_similarity WHERE claim_hash IN ({expired})", (verdict, cutoff))
+            cur = conn.execute(
+                "DELETE FROM claim_memory WHERE verdict = ? AND created_at < ?",
+                (verdict, cutoff),
+            )
+            deleted += cur.rowcount
+    return deleted
+
+
+# --- Retention / maintenance (app.services.maintenance) ---
+
+_ARCHIVABLE_REPORTS_SQL = """
+    SELECT r.verification_id, r.report_json, r.created_at FROM verification_reports r
+    WHERE r.created_at < ?
+      AND NOT EXISTS (SELECT 1 FROM posts p WHERE p.verification_id = r.verification_id)
+      AND NOT EXISTS (
+          SELECT 1 FROM verification_jobs j
+          WHERE j.verification_id = r.verification_id AND j.status IN ('pending', 'running')
+      )
+    ORDER BY r.created_at
+    LIMIT ?
+"""
+
+
+def get_archivable_reports(cutoff: str, limit: int) -> list[tuple[str, bytes, str]]:
+    """
+    Oldest reports created before cutoff that no post (or unfinished job) references,
+    as (verification_id, report JSON bytes, created_at).
+    """
+    with get_connection() as conn:
+        rows = conn.execute(_ARCHIVABLE_REPORTS_SQL, (cutoff, limit)).fetchall()
+    return [(r["verification_id"], _unpack_report(r["report_json"]), r["created_at"]) for r in rows]
+
+
+def delete_reports(verification_ids: list[str]) -> int:
+    """
+    Delete reports along with article_cache rows and finished jobs pointing at them,
+    skipping any a post started referencing since they were selected. Returns reports deleted.
+    """
+    if not verification_ids:
+        return 0
+    placeholders = ",".join("?" * len(verification_ids))
+    unreferenced = (
+        f"SELECT verification_id FROM verification_reports WHERE verification_id IN ({placeholders}) "
+        "AND verification_id NOT IN (SELECT verification_id FROM posts)"
+    )
+    with get_connection() as conn:
+        conn.execute(f"DELETE FROM article_cache WHERE verification_id IN ({unreferenced})", verification_ids)
+        conn.execute(
+            f"DELETE FROM verification_jobs WHERE status IN ('done', 'failed') AND verification_id IN ({unreferenced})",
+            verification_ids,
+        )
+        return conn.execute(
+            f"DELETE FROM verification_reports WHERE verification_id IN ({unreferenced})", verification_ids
+        ).rowcount
+
+
+def delete_stale_rows(table: str, cutoff: str, limit: int) -> int:
+    """Delete up to limit rows of a created_at-stamped cache table older than cutoff."""
+    if table not in ("article_cache", "gemini_cache"):
+        raise ValueError(f"not a cache table: {table}")
+    with get_connection() as conn:
+        return conn.execute(
+            f"DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} WHERE created_at < ? LIMIT ?)",
+            (cutoff, limit),
+        ).rowcount
+
+
+def delete_orphan_claim_index(limit: int) -> int:
+    """Delete up to limit near-duplicate index entries whose claim_memory row is gone."""
+    with get_connection() as conn:
+        orphans = [
+            r["claim_hash"] for r in conn.execute(
+                """
+                SELECT s.claim_hash FROM claim_similarity s
+                WHERE NOT EXISTS (SELECT 1 FROM claim_memory m WHERE m.claim_hash = s.claim_hash)
+                LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+        ]
+        if orphans:
+            placeholders = ",".join("?" * len(orphans))
+            conn.execute(f"DELETE FROM claim_lsh WHERE claim_hash IN ({placeholders})", orphans)
+            conn.execute(f"DELETE FROM claim_similarity WHERE claim_hash IN ({placeholders})", orphans)
+    return len(orphans)
+
+
+def get_auto_vacuum() -> int:
+    """PRAGMA auto_vacuum of the database: 0 none, 1 full, 2 incremental."""
+    with get_connection() as conn:
+        return conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+
+def incremental_vacuum(pages: int) -> int:
+    """Return up to `pages` free pages (all if <= 0) to the filesystem. Returns pages released."""
+    with get_connection() as conn:
+        before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        # executescript steps the pragma to completion (execute() frees a single page)
+        conn.executescript(f"PRAGMA incremental_vacuum({int(pages)})")
+        return before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+
+def enable_incremental_vacuum():
+    """Switch an existing database to auto_vacuum=INCREMENTAL with a full VACUUM (blocks writers while it runs)."""
+    with get_connection() as conn:
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
@@ -3,11 +3,19 @@ FastAPI application entry. CORS enabled for Next.js frontend.
 """
 
 import os
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import router
-from app.db import init_db
+from app.db import init_db, close_pool, close_async_pool
+from app.services import claim_memory, fetch_cache, jobs, maintenance
+from app.services.backboard import backboard_breaker
+from app.services.extract import close_parse_pool
+from app.services.gemini import gemini_breaker
+from app.utils import metrics
+from app.utils.http_client import close_async_client, close_session
+from app.utils.responses import FastJSONResponse
+from app.utils.tracing import TraceMiddleware
 
 # CORS origins from env (comma-separated), default for local Next.js
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
@@ -17,6 +25,8 @@ app = FastAPI(
     title="RealOrRender API",
     description="Pre-share verification layer for articles",
     version="0.1.0",
+    # orjson for any route still returning plain dicts (falls back to json)
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -25,7 +35,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Feed pagination / revalidation headers read by the frontend
+    expose_headers=["ETag", "X-Next-Cursor", "X-Feed-Head", "Server-Timing"],
 )
+# Outermost, so Server-Timing's total covers CORS and routing too
+app.add_middleware(TraceMiddleware)
 
 app.include_router(router)
 
@@ -33,8 +47,49 @@ app.include_router(router)
 @app.on_event("startup")
 def startup():
     init_db()
+    claim_memory.start_sweeper()
+    maintenance.start_maintenance()
+    # Optional in-process job workers (otherwise run python -m app.worker)
+    jobs.start_workers(jobs.JOB_EMBEDDED_WORKERS)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    claim_memory.stop_sweeper()
+    maintenance.stop_maintenance()
+    jobs.stop_workers(timeout=5)
+    await close_async_client()
+    close_session()
+    await close_async_pool()
+    close_pool()
+    close_parse_pool()
 
 
 @app.get("/health")
 def health():
-    return {"status": "ok"}
+    return {
+        "status": "ok",
+        "claim_memory": claim_memory.stats(),
+        "fetch_cache": fetch_cache.stats(),
+        "maintenance": maintenance.stats(),
+        "breakers": {
+            "gemini": gemini_breaker.stats(),
+            "backboard": backboard_breaker.stats(),
+        },
+    }
+
+
+_BREAKER_STATES = {"closed": 0, "half_open": 1, "open": 2}
+BREAKER_STATE = metrics.Gauge(
+    "realorrender_breaker_state",
+    "Circuit breaker state per upstream (0 closed, 1 half-open, 2 open).",
+    ("upstream",),
+)
+
+
+@app.get("/metrics")
+def prometheus_metrics():
+    """Prometheus text exposition of this worker's metrics registry."""
+    BREAKER_STATE.set(_BREAKER_STATES[gemini_breaker.state], upstream="gemini")
+    BREAKER_STATE.set(_BREAKER_STATES[backboard_breaker.state], upstream="backboard")
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
@@ -29,10 +29,15 @@ class ClaimResult(BaseModel):
     verdict: Literal["SUPPORTED", "CONTRADICTED", "INSUFFICIENT"]
     confidence: float  # 0-1
     evidence: list[EvidenceItem] = Field(default_factory=list)
+    timed_out: bool = False  # Not adjudicated within the time budget (verdict INSUFFICIENT)
+
+
+JobState = Literal["pending", "running", "done", "failed"]
 
 
 class VerificationReport(BaseModel):
     verification_id: str
+    status: JobState = "done"
     decision: Literal["ALLOW", "WARN", "BLOCK"]
     credibility_score: float  # 0-100
     ai_likelihood: Optional[float] = None  # 0-1
@@ -40,6 +45,8 @@ class VerificationReport(BaseModel):
     summary: str
     article: ArticleInfo
     claims: list[ClaimResult]
+    partial: bool = False  # Time budget ran out: some claims timed out
+    timings: Optional[dict[str, float]] = None  # Stage durations in ms (TRACE_IN_REPORT)
 
 
 # --- Post (matches frontend Post) ---
@@ -63,6 +70,26 @@ class VerifyArticleRequest(BaseModel):
     url: Optional[str] = None
     raw_text: Optional[str] = None  # Fallback when URL extraction fails
     comment: Optional[str] = None
+    force_refresh: bool = False  # Bypass the article cache
+    time_budget: Optional[float] = Field(default=None, gt=0, le=600)  # Seconds; default VERIFY_TIME_BUDGET
+
+
+class BulkVerifyRequest(BaseModel):
+    items: list[VerifyArticleRequest] = Field(min_length=1)
+
+
+class BulkVerifyResult(BaseModel):
+    """One NDJSON line of /verifyArticle/bulk: a report or an error for items[index]."""
+    index: int
+    status_code: int = 200
+    report: Optional[VerificationReport] = None
+    error: Optional[str] = None
+
+
+class JobStatus(BaseModel):
+    verification_id: str
+    status: JobState
+    error: Optional[str] = None
 
 
 class CreatePostRequest(BaseModel):
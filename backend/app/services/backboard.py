@@ -1,25 +1,58 @@
 """
 Backboard.io API client for claim verification via web search + LLM adjudication.
-Falls back to INSUFFICIENT (low confidence) when Backboard is unavailable.
-Uses local SQLite cache for claim fingerprints to avoid re-verifying identical claims.
+Falls back to INSUFFICIENT (low confidence) when Backboard is unavailable, and to
+INSUFFICIENT marked timed out when the request's time budget runs out first.
+Uses two-tier claim memory (LRU + SQLite) keyed by claim fingerprint to avoid re-verifying identical claims.
 """
 
+import asyncio
 import json
 import os
 import re
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Literal, Optional
 
-import requests
-
 from app.models import EvidenceItem
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.deadline import Deadline, expired, remaining, stage_timeout
 from app.utils.hashing import claim_hash
-from app.db import get_cached_claim, cache_claim
+from app.utils.metrics import STAGE_SECONDS, upstream_error
+from app.utils.http_client import get_session, request_async
+from app.utils.singleflight import SingleFlight, AsyncSingleFlight
+from app.services.claim_memory import (
+    get_claim,
+    get_claim_async,
+    get_similar_claim,
+    get_similar_claim_async,
+    put_claim,
+    put_claim_async,
+)
 
 BACKBOARD_API_KEY = os.getenv("BACKBOARD_API_KEY", "")
 BACKBOARD_BASE_URL = os.getenv("BACKBOARD_BASE_URL", "https://api.backboard.io/v1").rstrip("/")
 BACKBOARD_TIMEOUT = 30
+# Adjudicate all cache-missing claims of an article in one chat completion
+BACKBOARD_BATCH = os.getenv("BACKBOARD_BATCH", "true").lower() not in ("0", "false", "no")
+BACKBOARD_BATCH_MAX = int(os.getenv("BACKBOARD_BATCH_MAX", "10"))  # claims per batch call
 
 Verdict = Literal["SUPPORTED", "CONTRADICTED", "INSUFFICIENT"]
+# (verdict, confidence, evidence, cache_hit)
+ClaimVerification = tuple[Verdict, float, list[EvidenceItem], bool]
+
+UNAVAILABLE_SOURCE = "Verification unavailable"
+TIMED_OUT_SOURCE = "Verification timed out"
+
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+
+# In-flight Backboard calls keyed by claim_hash. A flight's result is None when it
+# has nothing to share (timed out, failed, or dropped by a batch): followers then
+# adjudicate under their own deadline.
+_claim_flights = SingleFlight()
+_async_claim_flights = AsyncSingleFlight()
+
+# Fast-fail to _unavailable_result while Backboard is down instead of waiting out timeouts
+backboard_breaker = CircuitBreaker("backboard")
 
 
 def _adjudication_prompt(claim: str) -> str:
@@ -46,35 +79,105 @@ Rules:
 JSON:"""
 
 
+def _batch_adjudication_prompt(claims: list[str]) -> str:
+    numbered = "\n".join(f'{i}. "{c}"' for i, c in enumerate(claims, 1))
+    return f"""You are a fact-checker. Given the following numbered claims and the web search results/context provided, determine a verdict for each claim independently.
+
+Claims:
+{numbered}
+
+Based on the retrieved sources, return ONLY valid JSON with one entry per claim:
+{{
+  "results": [
+    {{
+      "id": 1,
+      "verdict": "SUPPORTED" | "CONTRADICTED" | "INSUFFICIENT",
+      "confidence": 0.0 to 1.0,
+      "evidence": [
+        {{"source": "Source name", "url": "https://...", "stance": "supports|contradicts|neutral", "note": "1-2 sentence explanation"}}
+      ]
+    }}
+  ]
+}}
+
+Rules:
+- id: the claim's number from the list above
+- SUPPORTED: Reliable sources confirm the claim
+- CONTRADICTED: Reliable sources refute the claim
+- INSUFFICIENT: Not enough evidence either way
+- confidence: 0-1 based on source quality and consistency
+- evidence: list 1-3 most relevant sources with url and note
+
+JSON:"""
+
+
+def _parse_verdict_obj(data: dict) -> tuple[Verdict, float, list[dict]]:
+    """Normalize one {"verdict", "confidence", "evidence"} object. Raises on bad types."""
+    verdict = str(data.get("verdict", "INSUFFICIENT")).upper()
+    if verdict not in ("SUPPORTED", "CONTRADICTED", "INSUFFICIENT"):
+        verdict = "INSUFFICIENT"
+    confidence = float(data.get("confidence", 0.3))
+    confidence = max(0, min(1, confidence))
+    evidence = data.get("evidence", [])
+    if not isinstance(evidence, list):
+        evidence = []
+    return verdict, confidence, evidence[:5]
+
+
 def _parse_backboard_response(text: str) -> tuple[Verdict, float, list[dict]]:
     """Parse LLM response into verdict, confidence, evidence."""
     text = text.strip()
-    match = re.search(r"\{[\s\S]*\}", text)
+    match = _JSON_OBJECT_RE.search(text)
     if match:
         try:
-            data = json.loads(match.group())
-            verdict = data.get("verdict", "INSUFFICIENT").upper()
-            if verdict not in ("SUPPORTED", "CONTRADICTED", "INSUFFICIENT"):
-                verdict = "INSUFFICIENT"
-            confidence = float(data.get("confidence", 0.3))
-            confidence = max(0, min(1, confidence))
-            evidence = data.get("evidence", [])
-            if not isinstance(evidence, list):
-                evidence = []
-            return verdict, confidence, evidence[:5]
-        except (json.JSONDecodeError, (KeyError, TypeError, ValueError)):
+            return _parse_verdict_obj(json.loads(match.group()))
+        except (json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError):
             pass
     return "INSUFFICIENT", 0.3, []
 
 
-def _call_backboard(prompt: str, web_search: bool = True) -> Optional[str]:
+def _iter_verdict_objects(text: str):
     """
-    Call Backboard API (OpenAI-compatible chat completion).
-    Uses web_search parameter for real-time retrieval when available.
+    Yield every decodable JSON object carrying a "verdict", outermost first.
+    Objects inside a truncated or malformed wrapper are still found.
     """
-    if not BACKBOARD_API_KEY:
-        return None
+    decoder = json.JSONDecoder()
+    pos = text.find("{")
+    while pos >= 0:
+        try:
+            obj, end = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            pos = text.find("{", pos + 1)
+            continue
+        if isinstance(obj, dict) and isinstance(obj.get("results"), list):
+            yield from (r for r in obj["results"] if isinstance(r, dict) and "verdict" in r)
+        elif isinstance(obj, dict) and "verdict" in obj:
+            yield obj
+        else:
+            # Not a verdict: look inside it
+            end = pos + 1
+        pos = text.find("{", end)
+
 
+def _parse_backboard_batch_response(text: str, n_claims: int) -> dict[int, tuple[Verdict, float, list[dict]]]:
+    """
+    Parse a batched response into {claim_number: (verdict, confidence, evidence)}.
+    Unparseable, duplicate or out-of-range entries are skipped, so a partial
+    response still yields the claims it did cover.
+    """
+    results = {}
+    for obj in _iter_verdict_objects(text or ""):
+        try:
+            number = int(obj.get("id"))
+            if 1 <= number <= n_claims and number not in results:
+                results[number] = _parse_verdict_obj(obj)
+        except (TypeError, ValueError):
+            continue
+    return results
+
+
+def _build_request(prompt: str, web_search: bool = True, max_tokens: int = 1024) -> tuple[str, dict, dict]:
+    """Return (url, headers, payload) for an OpenAI-compatible chat completion."""
     url = f"{BACKBOARD_BASE_URL}/chat/completions"
     headers = {
         "Authorization": f"Bearer {BACKBOARD_API_KEY}",
@@ -83,93 +186,142 @@ def _call_backboard(prompt: str, web_search: bool = True) -> Optional[str]:
     payload = {
         "model": os.getenv("BACKBOARD_MODEL", "gpt-4o-mini"),  # or Backboard-specific model
         "messages": [{"role": "user", "content": prompt}],
-        "max_tokens": 1024,
+        "max_tokens": max_tokens,
         "temperature": 0.1,
     }
     # Backboard web search (if supported)
     if web_search:
         payload["web_search"] = "Auto"
+    return url, headers, payload
+
 
+def _response_content(data: dict) -> Optional[str]:
+    choice = data.get("choices", [{}])[0]
+    return choice.get("message", {}).get("content")
+
+
+def _call_backboard(
+    prompt: str,
+    web_search: bool = True,
+    max_tokens: int = 1024,
+    deadline: Optional[Deadline] = None,
+) -> Optional[str]:
+    """
+    Call Backboard API (OpenAI-compatible chat completion).
+    Uses web_search parameter for real-time retrieval when available.
+    The timeout is clipped to the deadline; no call is made once it has passed.
+    """
+    if not BACKBOARD_API_KEY or expired(deadline):
+        return None
+
+    if not backboard_breaker.allow():
+        upstream_error("backboard", kind="circuit_open")
+        return None
+
+    url, headers, payload = _build_request(prompt, web_search, max_tokens)
+    started = time.perf_counter()
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=BACKBOARD_TIMEOUT)
+        timeout = stage_timeout(deadline, BACKBOARD_TIMEOUT)
+        resp = get_session().post(url, headers=headers, json=payload, timeout=timeout)
         resp.raise_for_status()
-        data = resp.json()
-        choice = data.get("choices", [{}])[0]
-        return choice.get("message", {}).get("content")
+        content = _response_content(resp.json())
     except Exception as e:
+        upstream_error("backboard", e)
+        # A timeout clipped by the request's budget is not the upstream's fault
+        if not expired(deadline):
+            backboard_breaker.record_failure()
         print(f"Backboard API error: {e}")
         return None
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="backboard")
+    backboard_breaker.record_success()
+    return content
 
 
-def verify_claim(
-    claim_text: str,
-    claim_id: str,
-    use_cache: bool = True,
-) -> tuple[Verdict, float, list[EvidenceItem], bool]:
-    """
-    Verify a single claim via Backboard (or cache).
-    Returns (verdict, confidence, evidence_list, cache_hit).
-    """
-    ch = claim_hash(claim_text)
+async def _call_backboard_async(
+    prompt: str,
+    web_search: bool = True,
+    max_tokens: int = 1024,
+    deadline: Optional[Deadline] = None,
+) -> Optional[str]:
+    """Async variant of _call_backboard."""
+    if not BACKBOARD_API_KEY or expired(deadline):
+        return None
 
-    if use_cache:
-        cached = get_cached_claim(ch)
-        if cached:
-            def _norm_stance(s):
-                s = (s or "neutral").lower()
-                return s if s in ("supports", "contradicts", "neutral") else "neutral"
-            evidence = [
+    if not backboard_breaker.allow():
+        upstream_error("backboard", kind="circuit_open")
+        return None
+
+    url, headers, payload = _build_request(prompt, web_search, max_tokens)
+    started = time.perf_counter()
+    try:
+        timeout = stage_timeout(deadline, BACKBOARD_TIMEOUT)
+        resp = await request_async("POST", url, headers=headers, json=payload, timeout=timeout)
+        resp.raise_for_status()
+        content = _response_content(resp.json())
+    except Exception as e:
+        upstream_error("backboard", e)
+        # A timeout clipped by the request's budget is not the upstream's fault
+        if not expired(deadline):
+            backboard_breaker.record_failure()
+        print(f"Backboard API error: {e}")
+        return None
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="backboard")
+    backboard_breaker.record_success()
+    return content
+
+
+def _norm_stance(s) -> str:
+    s = (s or "neutral").lower()
+    return s if s in ("supports", "contradicts", "neutral") else "neutral"
+
+
+def _cached_result(cached: dict) -> ClaimVerification:
+    evidence = [
+        EvidenceItem(
+            source=e.get("source", "Unknown"),
+            url=e.get("url", ""),
+            stance=_norm_stance(e.get("stance")),
+            note=e.get("note", ""),
+        )
+        for e in cached.get("evidence", [])
+    ]
+    return (
+        cached["verdict"],
+        cached["confidence"],
+        evidence,
+        True,  # cache hit
+    )
+
+
+def _evidence_items(evidence_raw: list) -> list[EvidenceItem]:
+    evidence = []
+    for e in evidence_raw:
+        if isinstance(e, dict):
+            evidence.append(
                 EvidenceItem(
-                    source=e.get("source", "Unknown"),
-                    url=e.get("url", ""),
+                    source=str(e.get("source", "Unknown"))[:200],
+                    url=str(e.get("url", ""))[:500],
                     stance=_norm_stance(e.get("stance")),
-                    note=e.get("note", ""),
+                    note=str(e.get("note", ""))[:500],
                 )
-                for e in cached.get("evidence", [])
-            ]
-            return (
-                cached["verdict"],
-                cached["confidence"],
-                evidence,
-                True,  # cache hit
             )
+    return evidence
 
-    # Call Backboard
-    prompt = _adjudication_prompt(claim_text)
-    response = _call_backboard(prompt)
 
-    if response:
-        verdict, confidence, evidence_raw = _parse_backboard_response(response)
-        evidence = []
-        for e in evidence_raw:
-            if isinstance(e, dict):
-                stance = (e.get("stance") or "neutral").lower()
-                if stance not in ("supports", "contradicts", "neutral"):
-                    stance = "neutral"
-                evidence.append(
-                    EvidenceItem(
-                        source=str(e.get("source", "Unknown"))[:200],
-                        url=str(e.get("url", ""))[:500],
-                        stance=stance,
-                        note=str(e.get("note", ""))[:500],
-                    )
-                )
-        # Cache result
-        cache_claim(
-            ch,
-            verdict,
-            confidence,
-            [{"source": ev.source, "url": ev.url, "stance": ev.stance, "note": ev.note} for ev in evidence],
-        )
-        return verdict, confidence, evidence, False
+def _evidence_dicts(evidence: list[EvidenceItem]) -> list[dict]:
+    return [{"source": ev.source, "url": ev.url, "stance": ev.stance, "note": ev.note} for ev in evidence]
 
-    # Fallback: INSUFFICIENT, low confidence (Backboard unavailable)
+
+def _unavailable_result() -> ClaimVerification:
+    """Fallback: INSUFFICIENT, low confidence (Backboard unavailable)."""
     return (
         "INSUFFICIENT",
         0.2,
         [
             EvidenceItem(
-                source="Verification unavailable",
+                source=UNAVAILABLE_SOURCE,
                 url="",
                 stance="neutral",
                 note="External verification service was unavailable. Please verify manually.",
@@ -177,3 +329,292 @@ def verify_claim(
         ],
         False,
     )
+
+
+def timed_out_result() -> ClaimVerification:
+    """INSUFFICIENT, no confidence: the time budget ran out before the claim was adjudicated."""
+    return (
+        "INSUFFICIENT",
+        0.0,
+        [
+            EvidenceItem(
+                source=TIMED_OUT_SOURCE,
+                url="",
+                stance="neutral",
+                note="Verification did not finish within the time budget. Please verify manually.",
+            )
+        ],
+        False,
+    )
+
+
+def _failed_result(deadline: Optional[Deadline]) -> ClaimVerification:
+    return timed_out_result() if expired(deadline) else _unavailable_result()
+
+
+def verify_claim(
+    claim_text: str,
+    claim_id: str,
+    use_cache: bool = True,
+    deadline: Optional[Deadline] = None,
+) -> ClaimVerification:
+    """
+    Verify a single claim via Backboard (or cache).
+    Returns (verdict, confidence, evidence_list, cache_hit).
+    """
+    ch = claim_hash(claim_text)
+
+    if use_cache:
+        cached = get_claim(ch) or get_similar_claim(claim_text)
+        if cached:
+            return _cached_result(cached)
+
+    # Concurrent verifications of the same claim share one Backboard call
+    return _coalesced(ch, deadline, lambda: _adjudicate(claim_text, ch, deadline))
+
+
+def _is_timed_out(verification: ClaimVerification) -> bool:
+    return any(e.source == TIMED_OUT_SOURCE for e in verification[2])
+
+
+def _shareable(verification: Optional[ClaimVerification]) -> Optional[ClaimVerification]:
+    """What a flight leader hands its followers: never a timed-out result."""
+    return None if verification is None or _is_timed_out(verification) else verification
+
+
+def _join(fut, deadline: Optional[Deadline]) -> Optional[ClaimVerification]:
+    """Wait (within the caller's budget) for a flight's result; None if it has none to share."""
+    try:
+        return fut.result(timeout=remaining(deadline))
+    except FutureTimeoutError:
+        return timed_out_result()
+    except Exception:
+        return None
+
+
+def _coalesced(ch: str, deadline: Optional[Deadline], adjudicate) -> ClaimVerification:
+    """
+    Run adjudicate() as the flight for ch, or join one that finishes no earlier
+    than this caller's deadline. A follower given nothing to share adjudicates itself.
+    """
+    for _ in range(2):
+        fut, leader = _claim_flights.acquire(ch, deadline)
+        if leader:
+            result = None
+            try:
+                result = adjudicate()
+                return result
+            finally:
+                _claim_flights.finish(ch, fut, _shareable(result))
+        shared = _join(fut, deadline)
+        if shared is not None:
+            return shared
+    return adjudicate()
+
+
+def _adjudicate(claim_text: str, ch: str, deadline: Optional[Deadline] = None) -> ClaimVerification:
+    response = _call_backboard(_adjudication_prompt(claim_text), deadline=deadline)
+
+    if response:
+        verdict, confidence, evidence_raw = _parse_backboard_response(response)
+        evidence = _evidence_items(evidence_raw)
+        # Cache result
+        put_claim(ch, verdict, confidence, _evidence_dicts(evidence), claim_text)
+        return verdict, confidence, evidence, False
+
+    return _failed_result(deadline)
+
+
+async def verify_claim_async(
+    claim_text: str,
+    claim_id: str,
+    use_cache: bool = True,
+    deadline: Optional[Deadline] = None,
+) -> ClaimVerification:
+    """Async variant of verify_claim (aiosqlite cache, async HTTP)."""
+    ch = claim_hash(claim_text)
+
+    if use_cache:
+        cached = await get_claim_async(ch) or await get_similar_claim_async(claim_text)
+        if cached:
+            return _cached_result(cached)
+
+    return await _coalesced_async(ch, deadline, lambda: _adjudicate_async(claim_text, ch, deadline))
+
+
+async def _join_async(fut, deadline: Optional[Deadline]) -> Optional[ClaimVerification]:
+    try:
+        return await asyncio.wait_for(asyncio.shield(fut), remaining(deadline))
+    except asyncio.TimeoutError:
+        return timed_out_result()
+
+
+async def _coalesced_async(ch: str, deadline: Optional[Deadline], adjudicate) -> ClaimVerification:
+    """Async variant of _coalesced."""
+    for _ in range(2):
+        fut, leader = _async_claim_flights.acquire(ch, deadline)
+        if leader:
+            result = None
+            try:
+                result = await adjudicate()
+                return result
+            finally:
+                _async_claim_flights.finish(ch, fut, _shareable(result))
+        shared = await _join_async(fut, deadline)
+        if shared is not None:
+            return shared
+    return await adjudicate()
+
+
+async def _adjudicate_async(claim_text: str, ch: str, deadline: Optional[Deadline] = None) -> ClaimVerification:
+    response = await _call_backboard_async(_adjudication_prompt(claim_text), deadline=deadline)
+
+    if response:
+        verdict, confidence, evidence_raw = _parse_backboard_response(response)
+        evidence = _evidence_items(evidence_raw)
+        await put_claim_async(ch, verdict, confidence, _evidence_dicts(evidence), claim_text)
+        return verdict, confidence, evidence, False
+
+    return _failed_result(deadline)
+
+
+# --- Batched adjudication (one Backboard call per article) ---
+
+def _batch_max_tokens(n_claims: int) -> int:
+    return min(1024 + 512 * (n_claims - 1), 4096)
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    size = max(1, size)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _batch_outcomes(
+    chunk: list[tuple[str, str, list[int]]],
+    response: Optional[str],
+    deadline: Optional[Deadline] = None,
+) -> tuple[dict[int, ClaimVerification], list[tuple[str, str, Verdict, float, list[EvidenceItem]]]]:
+    """
+    Map one batch response back onto its claims.
+    chunk items are (claim_hash, text, positions). Returns results by position and
+    the adjudications to store. Claims a response left out get no result, so the
+    caller retries them one by one; so does every claim of a failed call while time
+    is left and the breaker is not open. Otherwise a failed call marks every claim
+    unavailable (timed out if the deadline has passed).
+    """
+    results: dict[int, ClaimVerification] = {}
+    to_store = []
+    if response is None:
+        if not expired(deadline) and backboard_breaker.state != "open":
+            return results, to_store
+        for _, _, positions in chunk:
+            for p in positions:
+                results[p] = _failed_result(deadline)
+        return results, to_store
+
+    parsed = _parse_backboard_batch_response(response, len(chunk))
+    for number, (ch, text, positions) in enumerate(chunk, 1):
+        if number not in parsed:
+            continue
+        verdict, confidence, evidence_raw = parsed[number]
+        evidence = _evidence_items(evidence_raw)
+        to_store.append((ch, text, verdict, confidence, evidence))
+        for p in positions:
+            results[p] = (verdict, confidence, evidence, False)
+    return results, to_store
+
+
+def _group_misses(texts: list[str], misses: list[int]) -> list[tuple[str, str, list[int]]]:
+    """Group cache-missing positions by claim_hash so duplicates are adjudicated once."""
+    groups: dict[str, tuple[str, str, list[int]]] = {}
+    for p in misses:
+        ch = claim_hash(texts[p])
+        groups.setdefault(ch, (ch, texts[p], []))[2].append(p)
+    return list(groups.values())
+
+
+def verify_claims_batch(texts: list[str], deadline: Optional[Deadline] = None) -> dict[int, ClaimVerification]:
+    """
+    Verify an article's claims with cache lookups plus one batched Backboard call
+    per BACKBOARD_BATCH_MAX cache misses. Misses go through the per-claim flights:
+    claims another caller is already adjudicating are awaited rather than batched.
+    Returns results keyed by position in texts; positions absent from the result
+    got no usable answer and should be verified with verify_claim(use_cache=False).
+    """
+    results: dict[int, ClaimVerification] = {}
+    misses = []
+    for p, text in enumerate(texts):
+        cached = get_claim(claim_hash(text)) or get_similar_claim(text)
+        if cached:
+            results[p] = _cached_result(cached)
+        else:
+            misses.append(p)
+
+    led, joined = [], []
+    for group in _group_misses(texts, misses):
+        fut, leader = _claim_flights.acquire(group[0], deadline)
+        (led if leader else joined).append((group, fut))
+
+    try:
+        for chunk in _chunks([group for group, _ in led], BACKBOARD_BATCH_MAX):
+            if len(chunk) == 1:
+                continue  # a batch of one is just a per-claim call
+            prompt = _batch_adjudication_prompt([text for _, text, _ in chunk])
+            response = _call_backboard(prompt, max_tokens=_batch_max_tokens(len(chunk)), deadline=deadline)
+            chunk_results, to_store = _batch_outcomes(chunk, response, deadline)
+            results.update(chunk_results)
+            for ch, text, verdict, confidence, evidence in to_store:
+                put_claim(ch, verdict, confidence, _evidence_dicts(evidence), text)
+    finally:
+        for (ch, _, positions), fut in led:
+            _claim_flights.finish(ch, fut, _shareable(results.get(positions[0])))
+
+    for (_, _, positions), fut in joined:
+        shared = _join(fut, deadline)
+        if shared is not None:
+            for p in positions:
+                results[p] = shared
+    return results
+
+
+async def verify_claims_batch_async(
+    texts: list[str],
+    deadline: Optional[Deadline] = None,
+) -> dict[int, ClaimVerification]:
+    """Async variant of verify_claims_batch."""
+    results: dict[int, ClaimVerification] = {}
+    misses = []
+    for p, text in enumerate(texts):
+        cached = await get_claim_async(claim_hash(text)) or await get_similar_claim_async(text)
+        if cached:
+            results[p] = _cached_result(cached)
+        else:
+            misses.append(p)
+
+    led, joined = [], []
+    for group in _group_misses(texts, misses):
+        fut, leader = _async_claim_flights.acquire(group[0], deadline)
+        (led if leader else joined).append((group, fut))
+
+    try:
+        for chunk in _chunks([group for group, _ in led], BACKBOARD_BATCH_MAX):
+            if len(chunk) == 1:
+                continue
+            prompt = _batch_adjudication_prompt([text for _, text, _ in chunk])
+            response = await _call_backboard_async(
+                prompt, max_tokens=_batch_max_tokens(len(chunk)), deadline=deadline
+            )
+            chunk_results, to_store = _batch_outcomes(chunk, response, deadline)
+            results.update(chunk_results)
+            for ch, text, verdict, confidence, evidence in to_store:
+                await put_claim_async(ch, verdict, confidence, _evidence_dicts(evidence), text)
+    finally:
+        for (ch, _, positions), fut in led:
+            _async_claim_flights.finish(ch, fut, _shareable(results.get(positions[0])))
+
+    for (_, _, positions), fut in joined:
+        shared = await _join_async(fut, deadline)
+        if shared is not None:
+            for p in positions:
+                results[p] = shared
+    return results
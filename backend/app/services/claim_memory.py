@@ -0,0 +1,256 @@
+"""
+Two-tier claim memory: in-process LRU in front of the SQLite claim_memory table.
+Entries expire per verdict (INSUFFICIENT is re-checked sooner than settled verdicts);
+a background sweeper deletes expired rows.
+Exact misses can fall back to a near-duplicate match (MinHash LSH over similarity tokens),
+reused only when numbers, dates and polarity words ("not", "against", "rejected", ...) agree.
+"""
+
+import datetime
+import os
+import threading
+import time
+from typing import Optional
+
+from app.db import (
+    get_cached_claim,
+    get_cached_claim_async,
+    cache_claim,
+    cache_claim_async,
+    delete_expired_claims,
+    bulk_cache_claims,
+    index_claim_similarity,
+    index_claim_similarity_async,
+    find_similar_candidates,
+    find_similar_candidates_async,
+)
+from app.utils.lru import LRUCache
+from app.utils.minhash import MIN_TOKENS, anchor_tokens, similarity_tokens, signature, lsh_buckets, jaccard
+
+CLAIM_LRU_SIZE = int(os.getenv("CLAIM_LRU_SIZE", "10000"))
+# Freshness per verdict (seconds)
+CLAIM_TTL = {
+    "SUPPORTED": int(os.getenv("CLAIM_TTL_SUPPORTED", str(30 * 86400))),
+    "CONTRADICTED": int(os.getenv("CLAIM_TTL_CONTRADICTED", str(30 * 86400))),
+    "INSUFFICIENT": int(os.getenv("CLAIM_TTL_INSUFFICIENT", str(86400))),
+}
+CLAIM_SWEEP_INTERVAL = int(os.getenv("CLAIM_SWEEP_INTERVAL", "3600"))  # seconds, 0 disables
+# Min Jaccard similarity for reusing a near-duplicate's verdict (0 disables)
+CLAIM_SIMILARITY_THRESHOLD = float(os.getenv("CLAIM_SIMILARITY_THRESHOLD", "0.8"))
+CLAIM_SIMILARITY_CANDIDATES = 100  # max LSH candidates scored per lookup
+
+_lru = LRUCache(CLAIM_LRU_SIZE)
+_sqlite_hits = 0
+_similar_hits = 0
+_swept = 0
+_sweeper: Optional[threading.Thread] = None
+_sweeper_stop = threading.Event()
+
+
+def _ttl(verdict: str) -> int:
+    return CLAIM_TTL.get(verdict, CLAIM_TTL["INSUFFICIENT"])
+
+
+def _expires_at(entry: dict) -> Optional[float]:
+    """Unix expiry for a stored entry, or None if created_at is unreadable."""
+    try:
+        created = datetime.datetime.fromisoformat(entry["created_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    created = created.replace(tzinfo=datetime.timezone.utc)
+    return created.timestamp() + _ttl(entry["verdict"])
+
+
+def _from_sqlite(ch: str, entry: Optional[dict]) -> Optional[dict]:
+    """Apply freshness to a SQLite row and promote it into the LRU tier."""
+    global _sqlite_hits
+    if not entry:
+        return None
+    expires_at = _expires_at(entry)
+    if expires_at is not None and expires_at <= time.time():
+        return None
+    _sqlite_hits += 1
+    _lru.set(ch, entry, expires_at)
+    return entry
+
+
+def _new_entry(verdict: str, confidence: float, evidence: list[dict]) -> tuple[dict, float]:
+    now = datetime.datetime.utcnow()
+    entry = {
+        "verdict": verdict,
+        "confidence": confidence,
+        "evidence": evidence,
+        "created_at": now.isoformat(),
+    }
+    return entry, time.time() + _ttl(verdict)
+
+
+def get_claim(ch: str) -> Optional[dict]:
+    """Fresh adjudication for a claim hash from the LRU, then SQLite; None on miss."""
+    entry = _lru.get(ch)
+    if entry is not None:
+        return entry
+    return _from_sqlite(ch, get_cached_claim(ch))
+
+
+async def get_claim_async(ch: str) -> Optional[dict]:
+    """Async variant of get_claim."""
+    entry = _lru.get(ch)
+    if entry is not None:
+        return entry
+    return _from_sqlite(ch, await get_cached_claim_async(ch))
+
+
+def put_claim(ch: str, verdict: str, confidence: float, evidence: list[dict], claim_text: str = ""):
+    """Store an adjudication in both tiers; index claim_text for near-duplicate lookups."""
+    entry, expires_at = _new_entry(verdict, confidence, evidence)
+    _lru.set(ch, entry, expires_at)
+    cache_claim(ch, verdict, confidence, evidence)
+    key = _similarity_key(claim_text)
+    if key:
+        index_claim_similarity(ch, " ".join(sorted(key[0])), key[1])
+
+
+async def put_claim_async(ch: str, verdict: str, confidence: float, evidence: list[dict], claim_text: str = ""):
+    """Async variant of put_claim."""
+    entry, expires_at = _new_entry(verdict, confidence, evidence)
+    _lru.set(ch, entry, expires_at)
+    await cache_claim_async(ch, verdict, confidence, evidence)
+    key = _similarity_key(claim_text)
+    if key:
+        await index_claim_similarity_async(ch, " ".join(sorted(key[0])), key[1])
+
+
+# --- Near-duplicate lookup ---
+
+def _similarity_key(claim_text: str) -> Optional[tuple[frozenset[str], list[int]]]:
+    """(tokens, LSH buckets) for a claim, or None if near-dup matching does not apply."""
+    if CLAIM_SIMILARITY_THRESHOLD <= 0 or not claim_text:
+        return None
+    tokens = similarity_tokens(claim_text)
+    if len(tokens) < MIN_TOKENS:
+        return None
+    return tokens, lsh_buckets(signature(tokens))
+
+
+def _ranked_matches(tokens: frozenset[str], candidates: list[tuple[str, str]]) -> list[str]:
+    """Candidate hashes at or above the threshold with the same anchor tokens, most similar first."""
+    anchors = anchor_tokens(tokens)
+    scored = []
+    for ch, cand_tokens in candidates:
+        cand = frozenset(cand_tokens.split())
+        if anchor_tokens(cand) != anchors:
+            continue  # e.g. "did not sign" vs "did sign", "3.5%" vs "7.5%"
+        score = jaccard(tokens, cand)
+        if score >= CLAIM_SIMILARITY_THRESHOLD:
+            scored.append((score, ch))
+    scored.sort(reverse=True)
+    return [ch for _, ch in scored]
+
+
+def get_similar_claim(claim_text: str) -> Optional[dict]:
+    """Fresh adjudication of the closest near-duplicate claim, or None."""
+    global _similar_hits
+    key = _similarity_key(claim_text)
+    if not key:
+        return None
+    tokens, buckets = key
+    for ch in _ranked_matches(tokens, find_similar_candidates(buckets, CLAIM_SIMILARITY_CANDIDATES)):
+        entry = get_claim(ch)
+        if entry:
+            _similar_hits += 1
+            return entry
+    return None
+
+
+async def get_similar_claim_async(claim_text: str) -> Optional[dict]:
+    """Async variant of get_similar_claim."""
+    global _similar_hits
+    key = _similarity_key(claim_text)
+    if not key:
+        return None
+    tokens, buckets = key
+    candidates = await find_similar_candidates_async(buckets, CLAIM_SIMILARITY_CANDIDATES)
+    for ch in _ranked_matches(tokens, candidates):
+        entry = await get_claim_async(ch)
+        if entry:
+            _similar_hits += 1
+            return entry
+    return None
+
+
+# --- Bulk load (python -m app.warmup) ---
+
+def bulk_put_claims(entries: list[dict]) -> tuple[int, int]:
+    """
+    Write many adjudications to SQLite in one transaction, bypassing the LRU.
+    Each entry has claim_hash, verdict, confidence, evidence_json, created_at and
+    either claim_text or precomputed tokens (space-joined) and buckets for the
+    near-duplicate index. Expired entries are dropped.
+    Returns (rows written, entries skipped as expired).
+    """
+    now = time.time()
+    claims, similarity, lsh = [], [], []
+    for e in entries:
+        expires_at = _expires_at(e)
+        if expires_at is not None and expires_at <= now:
+            continue
+        ch = e["claim_hash"]
+        claims.append((ch, e["verdict"], e["confidence"], e["evidence_json"], e["created_at"]))
+        tokens, buckets = e.get("tokens"), e.get("buckets")
+        if CLAIM_SIMILARITY_THRESHOLD > 0 and tokens and not buckets:
+            buckets = lsh_buckets(signature(frozenset(tokens.split())))
+        elif not tokens:
+            key = _similarity_key(e.get("claim_text", ""))
+            if key:
+                tokens, buckets = " ".join(sorted(key[0])), key[1]
+        if CLAIM_SIMILARITY_THRESHOLD > 0 and tokens:
+            similarity.append((ch, tokens))
+            lsh.extend((b, ch) for b in buckets)
+    written = bulk_cache_claims(claims, similarity, lsh) if claims else 0
+    return written, len(entries) - len(claims)
+
+
+def sweep_expired() -> int:
+    """Delete expired rows from SQLite and the LRU. Returns rows deleted from SQLite."""
+    global _swept
+    now = datetime.datetime.utcnow()
+    cutoffs = {
+        verdict: (now - datetime.timedelta(seconds=ttl)).isoformat()
+        for verdict, ttl in CLAIM_TTL.items()
+    }
+    _lru.prune_expired()
+    deleted = delete_expired_claims(cutoffs)
+    _swept += deleted
+    return deleted
+
+
+def _sweep_loop():
+    while not _sweeper_stop.wait(CLAIM_SWEEP_INTERVAL):
+        try:
+            sweep_expired()
+        except Exception as e:
+            print(f"Claim memory sweep failed: {e}")
+
+
+def start_sweeper():
+    """Start the background sweeper thread (no-op if disabled or already running)."""
+    global _sweeper
+    if CLAIM_SWEEP_INTERVAL <= 0 or (_sweeper and _sweeper.is_alive()):
+        return
+    _sweeper_stop.clear()
+    _sweeper = threading.Thread(target=_sweep_loop, name="claim-memory-sweeper", daemon=True)
+    _sweeper.start()
+
+
+def stop_sweeper():
+    _sweeper_stop.set()
+
+
+def stats() -> dict:
+    return {
+        "lru": _lru.stats(),
+        "sqlite_hits": _sqlite_hits,
+        "similar_hits": _similar_hits,
+        "swept": _swept,
+    }
@@ -1,19 +1,63 @@
 """
 Article content extraction from URL or raw text.
 Uses readability-lxml for URL extraction; falls back to raw_text from client.
+Downloads are streamed and capped at FETCH_MAX_BYTES; readability runs in a
+process pool (EXTRACT_PROCESSES) so parsing does not hold the server's GIL.
+Fetches go through the on-disk fetch cache (conditional revalidation) and are
+bounded by the request's time budget (Deadline), if any.
 """
 
+import asyncio
+import multiprocessing
+import os
 import re
-from typing import Optional
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Iterator, Optional, Union
+from dataclasses import asdict, dataclass
 
-import requests
+from lxml import etree
 from readability import Document
+from readability.cleaners import clean_attributes
 from urllib.parse import urlparse
 
+from app.services import fetch_cache
+from app.services.fetch_cache import CachedFetch
+from app.utils.deadline import Deadline, expired, stage_timeout
+from app.utils.http_client import get_session, request_async
+from app.utils.metrics import STAGE_SECONDS, upstream_error
+from app.utils.tracing import profile_path, run_profiled
+from app.utils.urls import canonical_url
+
 # Timeout for fetching URLs (seconds)
 FETCH_TIMEOUT = 15
 MAX_ARTICLE_LENGTH = 20_000  # Security limit
+FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; RealOrRender/1.0; +https://github.com/realorrender)"
+}
+# Bytes of (decompressed) body read per page; the rest is never downloaded
+FETCH_MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", str(5 * 1024 * 1024)))
+FETCH_CHUNK_SIZE = 64 * 1024
+# Responses with another declared type are rejected before the body is read
+HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+# Bump when _parse_html output changes: cached extractions are re-parsed from cached HTML
+EXTRACT_VERSION = "2"
+# Readability worker processes (0 = parse in a thread of the calling process)
+EXTRACT_PROCESSES = int(os.getenv("EXTRACT_PROCESSES", str(min(4, os.cpu_count() or 1))))
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_WHITESPACE_RE = re.compile(r"\s+")
+# Element boundaries that separate words; inline tags (<a>, <b>, <span>, ...) do not
+_BLOCK_TAGS = (
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+)
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
 
 
 @dataclass
@@ -49,52 +93,298 @@ def _clean_text(text: str) -> str:
     """Clean extracted text: normalize whitespace."""
     if not text:
         return ""
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text.strip()
 
 
-def extract_from_url(url: str) -> Optional[ExtractedArticle]:
+def html_to_text(node) -> str:
     """
-    Fetch URL and extract article content using readability-lxml.
-    Returns None if fetch or extraction fails.
+    Text of an lxml tree with entities decoded and a space at block boundaries.
+    Uses libxml2's text serializer; mutates node (padding block text/tails).
     """
+    for el in node.iter(*_BLOCK_TAGS):
+        el.text = " " + el.text if el.text else " "
+        el.tail = " " + el.tail if el.tail else " "
+    return etree.tostring(node, method="text", encoding="unicode", with_tail=False)
+
+
+class _TextDocument(Document):
+    """readability Document whose summary() returns the article's text instead of HTML."""
+
+    def __init__(self, input, **options):
+        super().__init__(input, **options)
+        self._html_retry_length = self.retry_length
+
+    def get_clean_html(self):
+        # readability's hook for DOM-to-text conversion: skip serializing HTML only to strip it again.
+        # summary() re-parses leniently when the result is shorter than retry_length, a threshold
+        # on the cleaned HTML. Text is never longer than that HTML, so only a short text needs the
+        # HTML measured; retry_length is then set so summary() decides as it would on the HTML.
+        short = len(self.html.xpath("string()")) < self._html_retry_length
+        if short:
+            short = len(clean_attributes(etree.tounicode(self.html, method="html"))) < self._html_retry_length
+        text = html_to_text(self.html)
+        self.retry_length = len(text) + 1 if short else 0
+        return text
+
+
+def _is_fetchable(url: Optional[str]) -> bool:
+    """Basic URL validation before fetching."""
     if not url or not url.strip():
+        return False
+    return url.startswith(("http://", "https://"))
+
+
+def _check_content_type(content_type: str) -> None:
+    mime = content_type.split(";", 1)[0].strip().lower()
+    # Missing Content-Type is let through; readability decides
+    if mime and mime not in HTML_CONTENT_TYPES:
+        raise ValueError(f"Unsupported content type: {mime}")
+
+
+def _read_capped(chunks: Iterator[bytes], deadline: Optional[Deadline] = None) -> bytes:
+    """
+    Read chunks until FETCH_MAX_BYTES; the remainder is left unread.
+    Read timeouts are per chunk, so a slow trickle is also cut off at the deadline.
+    """
+    body = bytearray()
+    for chunk in chunks:
+        body += chunk
+        if len(body) >= FETCH_MAX_BYTES:
+            break
+        if expired(deadline):
+            raise TimeoutError("Time budget exhausted while downloading")
+    return bytes(body[:FETCH_MAX_BYTES])
+
+
+async def _read_capped_async(chunks: AsyncIterator[bytes], deadline: Optional[Deadline] = None) -> bytes:
+    body = bytearray()
+    async for chunk in chunks:
+        body += chunk
+        if len(body) >= FETCH_MAX_BYTES:
+            break
+        if expired(deadline):
+            raise TimeoutError("Time budget exhausted while downloading")
+    return bytes(body[:FETCH_MAX_BYTES])
+
+
+def _decode(body: bytes, content_type: str) -> Union[str, bytes]:
+    """Decode with the declared charset; otherwise leave bytes for readability's <meta> sniffing."""
+    match = _CHARSET_RE.search(content_type)
+    if match:
+        try:
+            return body.decode(match.group(1), errors="replace")
+        except LookupError:
+            pass
+    return body
+
+
+def _parse_html(url: str, html: Union[str, bytes]) -> Optional[ExtractedArticle]:
+    """Run readability over fetched HTML. Returns None if no article text is found."""
+    doc = _TextDocument(html)
+    title = doc.title() or "Untitled"
+    text = _truncate(_clean_text(doc.summary())).rstrip()
+
+    if not text:
         return None
 
-    # Basic URL validation
-    if not url.startswith(("http://", "https://")):
+    return ExtractedArticle(
+        title=title[:500] if title else "Untitled",
+        text=text,
+        url=url,
+        publisher=_extract_domain(url),
+        published_date=None,  # readability doesn't extract date; newspaper3k would
+    )
+
+
+# --- Readability process pool ---
+
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    global _parse_pool
+    if EXTRACT_PROCESSES <= 0:
+        return None
+    if _parse_pool is None:
+        with _parse_pool_lock:
+            if _parse_pool is None:
+                # spawn: forking a threaded server process is unsafe
+                _parse_pool = ProcessPoolExecutor(
+                    max_workers=EXTRACT_PROCESSES,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _parse_pool
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    # A worker died (e.g. OOM on a pathological page); the next call starts a fresh pool
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _parse_html_profiled(path: Optional[str], url: str, html: Union[str, bytes]) -> Optional[ExtractedArticle]:
+    # Runs where the parse runs (pool worker or inline), so the profile covers readability itself
+    return run_profiled(path, _parse_html, url, html)
+
+
+def parse_html(url: str, html: Union[str, bytes]) -> Optional[ExtractedArticle]:
+    """_parse_html in the process pool (or inline when EXTRACT_PROCESSES=0)."""
+    path = profile_path("readability")
+    with STAGE_SECONDS.time(stage="readability"):
+        pool = _get_parse_pool()
+        if pool is None:
+            return _parse_html_profiled(path, url, html)
+        try:
+            return pool.submit(_parse_html_profiled, path, url, html).result()
+        except BrokenProcessPool:
+            _discard_parse_pool(pool)
+            return _parse_html_profiled(path, url, html)
+
+
+async def parse_html_async(url: str, html: Union[str, bytes]) -> Optional[ExtractedArticle]:
+    """Async variant of parse_html; without a pool, parses in a worker thread."""
+    path = profile_path("readability")
+    with STAGE_SECONDS.time(stage="readability"):
+        pool = _get_parse_pool()
+        if pool is None:
+            return await asyncio.to_thread(_parse_html_profiled, path, url, html)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, _parse_html_profiled, path, url, html)
+        except BrokenProcessPool:
+            _discard_parse_pool(pool)
+            return await asyncio.to_thread(_parse_html_profiled, path, url, html)
+
+
+def close_parse_pool() -> None:
+    global _parse_pool
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# --- Fetch cache glue ---
+
+def _usable(entry: Optional[CachedFetch]) -> Optional[CachedFetch]:
+    # An outdated extraction is only reusable if its HTML can be re-parsed
+    if entry and (entry.parser_version == EXTRACT_VERSION or entry.has_body):
+        return entry
+    return None
+
+
+def _article_dict(article: Optional[ExtractedArticle]) -> Optional[dict]:
+    return asdict(article) if article else None
+
+
+def _cached_article(url: str, entry: CachedFetch) -> Optional[ExtractedArticle]:
+    """Extraction for a cache entry; re-parses the cached HTML if the parser changed."""
+    if entry.parser_version == EXTRACT_VERSION:
+        return ExtractedArticle(**{**entry.article, "url": url}) if entry.article else None
+    body = fetch_cache.read_body(entry.url_key) or b""
+    article = parse_html(url, _decode(body, entry.content_type))
+    fetch_cache.update_article(entry.url_key, _article_dict(article), EXTRACT_VERSION)
+    return article
+
+
+async def _cached_article_async(url: str, entry: CachedFetch) -> Optional[ExtractedArticle]:
+    if entry.parser_version == EXTRACT_VERSION:
+        return ExtractedArticle(**{**entry.article, "url": url}) if entry.article else None
+    body = await asyncio.to_thread(fetch_cache.read_body, entry.url_key) or b""
+    article = await parse_html_async(url, _decode(body, entry.content_type))
+    await asyncio.to_thread(fetch_cache.update_article, entry.url_key, _article_dict(article), EXTRACT_VERSION)
+    return article
+
+
+def extract_from_url(url: str, deadline: Optional[Deadline] = None) -> Optional[ExtractedArticle]:
+    """
+    Fetch URL and extract article content using readability-lxml.
+    The body is streamed and capped at FETCH_MAX_BYTES; non-HTML responses are
+    rejected from their headers. A cached copy is reused when fresh or on 304.
+    Returns None if fetch or extraction fails, or the deadline passes first.
+    """
+    if not _is_fetchable(url) or expired(deadline):
         return None
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; RealOrRender/1.0; +https://github.com/realorrender)"
-        }
-        response = requests.get(url, timeout=FETCH_TIMEOUT, headers=headers)
-        response.raise_for_status()
-
-        doc = Document(response.text)
-        title = doc.title() or "Untitled"
-        text = doc.summary()
-        # readability returns HTML; strip tags crudely
-        text = re.sub(r"<[^>]+>", " ", text)
-        text = _clean_text(_truncate(text))
-
-        if not text:
-            return None
-
-        return ExtractedArticle(
-            title=title[:500] if title else "Untitled",
-            text=text,
-            url=url,
-            publisher=_extract_domain(url),
-            published_date=None,  # readability doesn't extract date; newspaper3k would
-        )
+        url_key = canonical_url(url)
+        entry = _usable(fetch_cache.lookup(url_key))
+        if entry and entry.fresh:
+            fetch_cache.hit(entry)
+            return _cached_article(url, entry)
+
+        headers = {**FETCH_HEADERS, **fetch_cache.conditional_headers(entry)}
+        timeout = stage_timeout(deadline, FETCH_TIMEOUT)
+        started = time.perf_counter()
+        with get_session().get(url, timeout=timeout, headers=headers, stream=True) as response:
+            not_modified = entry is not None and response.status_code == 304
+            if not not_modified:
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "")
+                _check_content_type(content_type)
+                body = _read_capped(response.iter_content(FETCH_CHUNK_SIZE), deadline)
+                validators = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="fetch")
+        if not_modified:
+            fetch_cache.revalidated(entry)
+            return _cached_article(url, entry)
+
+        article = parse_html(url, _decode(body, content_type))
+        fetch_cache.store(url_key, body, content_type, *validators, _article_dict(article), EXTRACT_VERSION)
+        return article
     except Exception as e:
+        upstream_error("fetch", e)
         # Log in production
         print(f"Extraction failed for {url}: {e}")
         return None
 
 
+async def extract_from_url_async(url: str, deadline: Optional[Deadline] = None) -> Optional[ExtractedArticle]:
+    """
+    Async variant of extract_from_url. The download does not hold a thread;
+    readability parsing runs in the process pool so the event loop stays free.
+    Fetch cache file I/O and compression run in a worker thread.
+    """
+    if not _is_fetchable(url) or expired(deadline):
+        return None
+
+    try:
+        url_key = canonical_url(url)
+        entry = _usable(await asyncio.to_thread(fetch_cache.lookup, url_key))
+        if entry and entry.fresh:
+            await asyncio.to_thread(fetch_cache.hit, entry)
+            return await _cached_article_async(url, entry)
+
+        headers = {**FETCH_HEADERS, **fetch_cache.conditional_headers(entry)}
+        timeout = stage_timeout(deadline, FETCH_TIMEOUT)
+        started = time.perf_counter()
+        response = await request_async("GET", url, headers=headers, timeout=timeout, stream=True)
+        try:
+            not_modified = entry is not None and response.status_code == 304
+            if not not_modified:
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "")
+                _check_content_type(content_type)
+                body = await _read_capped_async(response.aiter_bytes(FETCH_CHUNK_SIZE), deadline)
+                validators = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        finally:
+            await response.aclose()
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="fetch")
+        if not_modified:
+            await asyncio.to_thread(fetch_cache.revalidated, entry)
+            return await _cached_article_async(url, entry)
+
+        article = await parse_html_async(url, _decode(body, content_type))
+        await asyncio.to_thread(
+            fetch_cache.store, url_key, body, content_type, *validators, _article_dict(article), EXTRACT_VERSION
+        )
+        return article
+    except Exception as e:
+        upstream_error("fetch", e)
+        print(f"Extraction failed for {url}: {e}")
+        return None
+
+
 def extract_from_raw_text(raw_text: str, url: str = "", title: str = "Pasted Article") -> ExtractedArticle:
     """
     Use raw pasted text when URL extraction fails.
@@ -112,13 +402,34 @@ def extract_from_raw_text(raw_text: str, url: str = "", title: str = "Pasted Art
     )
 
 
-def extract_article(url: Optional[str] = None, raw_text: Optional[str] = None) -> Optional[ExtractedArticle]:
+def extract_article(
+    url: Optional[str] = None,
+    raw_text: Optional[str] = None,
+    deadline: Optional[Deadline] = None,
+) -> Optional[ExtractedArticle]:
     """
     Main entry: try URL extraction first, fall back to raw_text.
     Returns None if both fail.
     """
     if url:
-        result = extract_from_url(url)
+        result = extract_from_url(url, deadline)
+        if result:
+            return result
+
+    if raw_text and raw_text.strip():
+        return extract_from_raw_text(raw_text, url or "", title="Pasted Article")
+
+    return None
+
+
+async def extract_article_async(
+    url: Optional[str] = None,
+    raw_text: Optional[str] = None,
+    deadline: Optional[Deadline] = None,
+) -> Optional[ExtractedArticle]:
+    """Async variant of extract_article."""
+    if url:
+        result = await extract_from_url_async(url, deadline)
         if result:
             return result
 
@@ -0,0 +1,171 @@
+"""
+On-disk cache of fetched article pages: zlib-compressed HTML in FETCH_CACHE_DIR,
+validators and the compressed extraction in the SQLite fetch_cache table.
+Entries younger than FETCH_CACHE_FRESH are served without a request; older ones
+are revalidated with If-None-Match / If-Modified-Since. Total size is bounded by
+FETCH_CACHE_MAX_BYTES, evicting least recently used entries.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from app.db import (
+    DB_PATH,
+    get_fetch_entry,
+    save_fetch_entry,
+    touch_fetch_entry,
+    update_fetch_article,
+    evict_fetch_entries,
+)
+
+FETCH_CACHE_MAX_BYTES = int(os.getenv("FETCH_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))  # 0 disables
+FETCH_CACHE_DIR = Path(os.getenv("FETCH_CACHE_DIR", str(Path(DB_PATH).parent / "fetch_cache")))
+FETCH_CACHE_FRESH = int(os.getenv("FETCH_CACHE_FRESH", "300"))  # seconds served without revalidating
+
+_hits = 0
+_revalidations = 0
+_misses = 0
+_evictions = 0
+
+
+@dataclass
+class CachedFetch:
+    url_key: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_type: str
+    article: Optional[dict]  # ExtractedArticle fields, None if extraction found nothing
+    parser_version: str
+    fresh: bool  # validated within FETCH_CACHE_FRESH
+    has_body: bool  # compressed HTML still on disk (needed to re-parse)
+
+
+def enabled() -> bool:
+    return FETCH_CACHE_MAX_BYTES > 0
+
+
+def _body_path(url_key: str) -> Path:
+    digest = hashlib.sha256(url_key.encode("utf-8")).hexdigest()
+    return FETCH_CACHE_DIR / digest[:2] / f"{digest}.html.z"
+
+
+def _pack_article(article: Optional[dict]) -> Optional[bytes]:
+    return zlib.compress(json.dumps(article).encode("utf-8")) if article is not None else None
+
+
+def lookup(url_key: str) -> Optional[CachedFetch]:
+    """Cached entry for a canonical URL, or None. Does not count towards stats."""
+    if not enabled():
+        return None
+    row = get_fetch_entry(url_key)
+    if not row:
+        return None
+    validated = datetime.datetime.fromisoformat(row["validated_at"])
+    age = (datetime.datetime.utcnow() - validated).total_seconds()
+    blob = row["article_blob"]
+    return CachedFetch(
+        url_key=url_key,
+        etag=row["etag"],
+        last_modified=row["last_modified"],
+        content_type=row["content_type"] or "",
+        article=json.loads(zlib.decompress(blob)) if blob is not None else None,
+        parser_version=row["parser_version"],
+        fresh=age < FETCH_CACHE_FRESH,
+        has_body=_body_path(url_key).exists(),
+    )
+
+
+def conditional_headers(entry: Optional[CachedFetch]) -> dict:
+    """If-None-Match / If-Modified-Since for an entry (empty if nothing to revalidate)."""
+    if not entry:
+        return {}
+    headers = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+def hit(entry: CachedFetch):
+    """Record a fresh entry served without a request."""
+    global _hits
+    _hits += 1
+    touch_fetch_entry(entry.url_key)
+
+
+def revalidated(entry: CachedFetch):
+    """Record a 304 for an entry."""
+    global _revalidations
+    _revalidations += 1
+    touch_fetch_entry(entry.url_key, validated=True)
+
+
+def read_body(url_key: str) -> Optional[bytes]:
+    """Cached (capped) HTML bytes, or None if evicted or unreadable."""
+    try:
+        return zlib.decompress(_body_path(url_key).read_bytes())
+    except (OSError, zlib.error):
+        return None
+
+
+def store(
+    url_key: str,
+    body: bytes,
+    content_type: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    article: Optional[dict],
+    parser_version: str,
+):
+    """Cache a full (200) fetch and its extraction, then evict down to FETCH_CACHE_MAX_BYTES."""
+    global _misses
+    if not enabled():
+        return
+    _misses += 1
+    compressed = zlib.compress(body)
+    article_blob = _pack_article(article)
+    path = _body_path(url_key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(compressed)
+    os.replace(tmp, path)
+    size = len(compressed) + len(article_blob or b"")
+    save_fetch_entry(url_key, etag, last_modified, content_type, article_blob, parser_version, size)
+    _evict()
+
+
+def update_article(url_key: str, article: Optional[dict], parser_version: str):
+    """Replace an entry's extraction (after re-parsing its cached HTML with a newer parser)."""
+    article_blob = _pack_article(article)
+    try:
+        body_size = _body_path(url_key).stat().st_size
+    except OSError:
+        body_size = 0
+    update_fetch_article(url_key, article_blob, parser_version, body_size + len(article_blob or b""))
+
+
+def _evict():
+    global _evictions
+    for url_key in evict_fetch_entries(FETCH_CACHE_MAX_BYTES):
+        _evictions += 1
+        try:
+            _body_path(url_key).unlink()
+        except OSError:
+            pass
+
+
+def stats() -> dict:
+    return {
+        "hits": _hits,
+        "revalidations": _revalidations,
+        "misses": _misses,
+        "evictions": _evictions,
+    }
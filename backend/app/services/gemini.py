@@ -3,13 +3,22 @@ Gemini API integration: extract claims, manipulation signals, AI likelihood.
 Returns structured JSON matching our schema.
 """
 
+import asyncio
 import json
 import os
 import re
+import threading
+import time
 import warnings
 from typing import Optional
 
 from app.models import GeminiClaimOutput, GeminiOutput
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.deadline import Deadline, expired, remaining
+from app.utils.metrics import STAGE_SECONDS, upstream_error
+from app.utils.tracing import profiled
+from app.db import GEMINI_CACHE_TTL, get_cached_analysis, get_cached_analysis_async, cache_analysis, cache_analysis_async
+from app.utils.hashing import content_hash
 
 # Optional: use google-generativeai if available (suppress deprecation warning)
 with warnings.catch_warnings():
@@ -23,8 +32,23 @@ with warnings.catch_warnings():
 
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
 MAX_CLAIMS = 7
 MIN_CLAIMS = 3
+MAX_PROMPT_CHARS = 15000
+
+# Bump when GEMINI_PROMPT or _parse_gemini_json changes so cached analyses are not reused
+GEMINI_PROMPT_VERSION = "1"
+
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+
+_model = None
+_generation_config = None
+_model_lock = threading.Lock()
+
+# Fast-fail to get_gemini_fallback while Gemini is erroring instead of waiting on each call
+gemini_breaker = CircuitBreaker("gemini")
 
 
 GEMINI_PROMPT = """You are a fact-checking assistant. Analyze the following article text and extract atomic factual claims (not opinions).
@@ -60,7 +84,7 @@ def _parse_gemini_json(response_text: str) -> Optional[GeminiOutput]:
     """Parse Gemini response into GeminiOutput. Handle markdown code blocks."""
     text = response_text.strip()
     # Extract JSON from markdown code block if present
-    match = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
+    match = _CODE_BLOCK_RE.search(text)
     if match:
         text = match.group(1).strip()
     # Try to find JSON object
@@ -111,37 +135,155 @@ def _parse_gemini_json(response_text: str) -> Optional[GeminiOutput]:
         return None
 
 
-def run_gemini_analysis(article_text: str) -> Optional[GeminiOutput]:
-    """
-    Call Gemini API to extract claims and manipulation signals.
-    Returns None on failure (caller should use fallback).
-    """
+def _gemini_ready() -> bool:
     if not GEMINI_API_KEY:
         print("GEMINI_API_KEY not set")
-        return None
-
+        return False
     if not GEMINI_AVAILABLE:
         print("google-generativeai not installed")
-        return None
+        return False
+    return True
+
+
+def _get_model():
+    """Long-lived GenerativeModel + GenerationConfig, configured once per process."""
+    global _model, _generation_config
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                genai.configure(api_key=GEMINI_API_KEY)
+                _generation_config = genai.types.GenerationConfig(
+                    temperature=0.2,
+                    max_output_tokens=2048,
+                )
+                _model = genai.GenerativeModel(GEMINI_MODEL)
+    return _model, _generation_config
+
 
+def _truncate_for_prompt(article_text: str) -> str:
     # Truncate for token limits
-    text = article_text[:15000] if len(article_text) > 15000 else article_text
+    return article_text[:MAX_PROMPT_CHARS] if len(article_text) > MAX_PROMPT_CHARS else article_text
 
+
+def _build_prompt(text: str) -> str:
+    # str.format would trip over the JSON braces in the template
+    return GEMINI_PROMPT.replace("{text}", text)
+
+
+def analysis_cache_key(article_text: str) -> str:
+    """Cache key for an analysis: prompt version + model + truncated article text."""
+    text = _truncate_for_prompt(article_text)
+    return content_hash(f"{GEMINI_PROMPT_VERSION}\n{GEMINI_MODEL}\n{text}")
+
+
+def _from_cache(cached_json: Optional[str]) -> Optional[GeminiOutput]:
+    if not cached_json:
+        return None
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-1.5-flash")
+        return GeminiOutput.model_validate_json(cached_json)
+    except ValueError:
+        return None
+
+
+def _request_options(deadline: Optional[Deadline]) -> Optional[dict]:
+    # Gemini has no client-side timeout of its own; only a budget bounds the call
+    left = remaining(deadline)
+    return {"timeout": max(left, 0.05)} if left is not None else None
+
+
+def run_gemini_analysis(article_text: str, deadline: Optional[Deadline] = None) -> Optional[GeminiOutput]:
+    """
+    Call Gemini API to extract claims and manipulation signals.
+    Parsed results are cached by analysis_cache_key.
+    Returns None on failure or once the deadline has passed (caller should use fallback).
+    """
+    key = analysis_cache_key(article_text)
+    cached = _from_cache(get_cached_analysis(key, GEMINI_CACHE_TTL))
+    if cached:
+        return cached
+
+    if expired(deadline) or not _gemini_ready():
+        return None
+    if not gemini_breaker.allow():
+        upstream_error("gemini", kind="circuit_open")
+        return None
+
+    started = time.perf_counter()
+    try:
+        model, config = _get_model()
+        prompt = _build_prompt(_truncate_for_prompt(article_text))
         response = model.generate_content(
-            GEMINI_PROMPT.format(text=text),
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.2,
-                max_output_tokens=2048,
+            prompt, generation_config=config, request_options=_request_options(deadline)
+        )
+    except Exception as e:
+        upstream_error("gemini", e)
+        # Running out of budget is not the upstream's fault
+        if not expired(deadline):
+            gemini_breaker.record_failure()
+        print(f"Gemini API error: {e}")
+        return None
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="gemini")
+    gemini_breaker.record_success()
+
+    try:
+        # .text raises for blocked/empty candidates: the upstream answered, so not a breaker failure
+        text = response.text if response else None
+    except ValueError as e:
+        print(f"Gemini API error: {e}")
+        return None
+    if text:
+        result = profiled("gemini_json", _parse_gemini_json, text)
+        if result:
+            cache_analysis(key, result.model_dump_json())
+        return result
+    return None
+
+
+async def run_gemini_analysis_async(article_text: str, deadline: Optional[Deadline] = None) -> Optional[GeminiOutput]:
+    """Async variant of run_gemini_analysis using Gemini's async API."""
+    key = analysis_cache_key(article_text)
+    cached = _from_cache(await get_cached_analysis_async(key, GEMINI_CACHE_TTL))
+    if cached:
+        return cached
+
+    if expired(deadline) or not _gemini_ready():
+        return None
+    if not gemini_breaker.allow():
+        upstream_error("gemini", kind="circuit_open")
+        return None
+
+    started = time.perf_counter()
+    try:
+        model, config = _get_model()
+        prompt = _build_prompt(_truncate_for_prompt(article_text))
+        response = await asyncio.wait_for(
+            model.generate_content_async(
+                prompt, generation_config=config, request_options=_request_options(deadline)
             ),
+            timeout=remaining(deadline),
         )
-        if response and response.text:
-            return _parse_gemini_json(response.text)
     except Exception as e:
+        upstream_error("gemini", e)
+        if not expired(deadline):
+            gemini_breaker.record_failure()
         print(f"Gemini API error: {e}")
+        return None
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, stage="gemini")
+    gemini_breaker.record_success()
 
+    try:
+        # .text raises for blocked/empty candidates: the upstream answered, so not a breaker failure
+        text = response.text if response else None
+    except ValueError as e:
+        print(f"Gemini API error: {e}")
+        return None
+    if text:
+        result = profiled("gemini_json", _parse_gemini_json, text)
+        if result:
+            await cache_analysis_async(key, result.model_dump_json())
+        return result
     return None
 
 
@@ -150,8 +292,7 @@ def get_gemini_fallback(article_text: str) -> GeminiOutput:
     Deterministic fallback when Gemini is unavailable.
     Extracts simple "claims" by sentence splitting; no manipulation signals.
     """
-    import re
-    sentences = re.split(r"[.!?]+", article_text)
+    sentences = _SENTENCE_END_RE.split(article_text)
     sentences = [s.strip() for s in sentences if len(s.strip()) > 20][:MAX_CLAIMS]
     if len(sentences) < MIN_CLAIMS:
         sentences.append("This article makes several factual assertions.")  # placeholder
@@ -0,0 +1,153 @@
+"""
+Persistent verification job queue backed by SQLite (verification_jobs table).
+POST /api/verifyArticle/job enqueues; worker threads (python -m app.worker, or
+JOB_EMBEDDED_WORKERS inside the API process) claim jobs and run the sync pipeline.
+Each process heartbeats the jobs it is running; jobs whose heartbeat goes stale
+(the worker died) are requeued by any worker, on startup and periodically.
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Optional
+
+from app.db import (
+    create_job,
+    claim_next_job,
+    finish_job,
+    heartbeat_jobs,
+    requeue_stale_jobs,
+    save_report,
+)
+from app.services.verify import run_verification
+from app.utils.tracing import traced
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))  # threads per worker process
+JOB_EMBEDDED_WORKERS = int(os.getenv("JOB_EMBEDDED_WORKERS", "0"))  # threads inside each API process
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1.0"))  # seconds between polls when idle
+JOB_HEARTBEAT_INTERVAL = float(os.getenv("JOB_HEARTBEAT_INTERVAL", "10"))  # seconds between heartbeats
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "60"))  # no heartbeat for this long = interrupted
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# Label for worker_id (name:pid:thread) in verification_jobs; not used for recovery
+JOB_WORKER_NAME = os.getenv("JOB_WORKER_NAME", socket.gethostname())
+
+_stop = threading.Event()
+_threads: list[threading.Thread] = []
+_running: set[str] = set()  # verification_ids being run by this process
+_running_lock = threading.Lock()
+
+
+def enqueue_verification(
+    url: Optional[str] = None,
+    raw_text: Optional[str] = None,
+    force_refresh: bool = False,
+    time_budget: Optional[float] = None,
+) -> str:
+    """Queue a verification and return its verification_id. Its time budget starts when a worker runs it."""
+    verification_id = str(uuid.uuid4())
+    create_job(verification_id, {
+        "url": url,
+        "raw_text": raw_text,
+        "force_refresh": force_refresh,
+        "time_budget": time_budget,
+    })
+    return verification_id
+
+
+def run_job(job: dict) -> None:
+    """Run one claimed job and record its outcome."""
+    verification_id = job["verification_id"]
+    with _running_lock:
+        _running.add(verification_id)
+    try:
+        _run_job(job)
+    finally:
+        with _running_lock:
+            _running.discard(verification_id)
+
+
+def _run_job(job: dict) -> None:
+    verification_id = job["verification_id"]
+    try:
+        # Own trace per job: stage timings (TRACE_IN_REPORT) and profile sampling as for requests
+        with traced():
+            report = run_verification(**job["request"], verification_id=verification_id)
+    except Exception as e:
+        print(f"Verification job {verification_id} failed: {e}")
+        finish_job(verification_id, error=str(e)[:500] or "Verification failed")
+        return
+
+    if not report:
+        finish_job(verification_id, error="Could not extract article content. Check URL or provide raw_text.")
+        return
+    if report.verification_id != verification_id:
+        # Served from the article cache or a coalesced run: store it under the job's id too
+        save_report(verification_id, report.model_copy(update={"verification_id": verification_id}).model_dump_json())
+    finish_job(verification_id)
+
+
+def recover_jobs() -> int:
+    """Requeue (or fail) running jobs whose worker stopped heartbeating."""
+    return requeue_stale_jobs(JOB_LEASE_SECONDS, JOB_MAX_ATTEMPTS)
+
+
+def _heartbeat_loop():
+    while not _stop.wait(JOB_HEARTBEAT_INTERVAL):
+        with _running_lock:
+            running = list(_running)
+        try:
+            heartbeat_jobs(running)
+        except Exception as e:
+            print(f"Job heartbeat failed: {e}")
+
+
+def _worker_loop(worker_id: str, recovers: bool):
+    next_recovery = time.monotonic() + JOB_LEASE_SECONDS / 2
+    while not _stop.is_set():
+        if recovers and time.monotonic() >= next_recovery:
+            try:
+                recover_jobs()
+            except Exception as e:
+                print(f"Job recovery failed: {e}")
+            next_recovery = time.monotonic() + JOB_LEASE_SECONDS / 2
+        try:
+            job = claim_next_job(worker_id)
+        except Exception as e:
+            print(f"Job claim failed: {e}")
+            job = None
+        if job:
+            run_job(job)
+        else:
+            _stop.wait(JOB_POLL_INTERVAL)
+
+
+def start_workers(count: int = JOB_WORKERS, name: str = JOB_WORKER_NAME) -> list[threading.Thread]:
+    """Recover interrupted jobs, then start count daemon worker threads and a heartbeat thread."""
+    if count <= 0:
+        return []
+    recovered = recover_jobs()
+    if recovered:
+        print(f"Recovered {recovered} interrupted verification job(s)")
+    _stop.clear()
+    started = [threading.Thread(target=_heartbeat_loop, name="verify-job-heartbeat", daemon=True)]
+    for i in range(count):
+        started.append(threading.Thread(
+            target=_worker_loop,
+            args=(f"{name}:{os.getpid()}:{i}", i == 0),
+            name=f"verify-job-{i}",
+            daemon=True,
+        ))
+    for t in started:
+        t.start()
+    _threads.extend(started)
+    return started
+
+
+def stop_workers(timeout: Optional[float] = None) -> None:
+    """Signal workers to stop after their current job and wait for them."""
+    _stop.set()
+    for t in _threads:
+        t.join(timeout)
+    _threads.clear()
@@ -0,0 +1,214 @@
+"""
+Background retention and compaction for the SQLite store.
+
+Each pass, in small transactions with pauses in between so request traffic keeps
+the write lock most of the time:
+- archives reports older than REPORT_RETENTION_DAYS that no post references to
+  gzip JSONL files partitioned by the report's date, then deletes them
+  (with their article_cache rows and finished jobs);
+- deletes expired article_cache / gemini_cache rows and near-duplicate index
+  entries left without a claim_memory row;
+- returns free pages to the filesystem with PRAGMA incremental_vacuum.
+
+Archive files are fsynced before rows are deleted; a crash in between can leave
+a report in two archive files, never in none.
+
+    python -m app.services.maintenance [--enable-incremental-vacuum]
+"""
+
+import argparse
+import datetime
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+from app.db import (
+    ARTICLE_CACHE_TTL,
+    DB_PATH,
+    GEMINI_CACHE_TTL,
+    init_db,
+    get_archivable_reports,
+    delete_reports,
+    delete_stale_rows,
+    delete_orphan_claim_index,
+    get_auto_vacuum,
+    incremental_vacuum,
+    enable_incremental_vacuum,
+)
+
+REPORT_RETENTION_DAYS = int(os.getenv("REPORT_RETENTION_DAYS", "0"))  # 0 keeps reports forever
+REPORT_ARCHIVE_DIR = Path(os.getenv("REPORT_ARCHIVE_DIR", str(Path(DB_PATH).parent / "archive" / "reports")))
+MAINTENANCE_INTERVAL = int(os.getenv("MAINTENANCE_INTERVAL", "3600"))  # seconds, 0 disables
+MAINTENANCE_BATCH = int(os.getenv("MAINTENANCE_BATCH", "500"))  # rows per transaction
+MAINTENANCE_PAUSE = float(os.getenv("MAINTENANCE_PAUSE", "0.05"))  # seconds between transactions
+MAINTENANCE_VACUUM_PAGES = int(os.getenv("MAINTENANCE_VACUUM_PAGES", "1000"))  # pages freed per step
+
+_stats = {"runs": 0, "archived": 0, "deleted_cache_rows": 0, "deleted_index_rows": 0, "vacuumed_pages": 0}
+_last_run: Optional[dict] = None
+_run_lock = threading.Lock()
+_worker: Optional[threading.Thread] = None
+_worker_stop = threading.Event()
+
+
+def _cutoff(seconds: float) -> str:
+    return (datetime.datetime.utcnow() - datetime.timedelta(seconds=seconds)).isoformat()
+
+
+def _archive_path(day: str, run_id: str) -> Path:
+    """REPORT_ARCHIVE_DIR/YYYY/MM/YYYY-MM-DD.<run>.jsonl.gz (one file per day and run)."""
+    year, month, _ = day.split("-")
+    return REPORT_ARCHIVE_DIR / year / month / f"{day}.{run_id}.jsonl.gz"
+
+
+def _archive_line(verification_id: str, report_json: bytes, created_at: str) -> bytes:
+    if b"\n" in report_json:
+        report_json = json.dumps(json.loads(report_json)).encode("utf-8")
+    head = json.dumps({"verification_id": verification_id, "created_at": created_at})[:-1]
+    return head.encode("utf-8") + b', "report": ' + report_json + b"}\n"
+
+
+def _write_archive(rows: list[tuple[str, bytes, str]], run_id: str):
+    """Append rows to their day's archive file (one gzip member per batch) and fsync."""
+    by_day: dict[str, list[bytes]] = defaultdict(list)
+    for verification_id, report_json, created_at in rows:
+        by_day[created_at[:10]].append(_archive_line(verification_id, report_json, created_at))
+    for day, lines in by_day.items():
+        path = _archive_path(day, run_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as gz:
+                gz.write(b"".join(lines))
+            raw.flush()
+            os.fsync(raw.fileno())
+
+
+def archive_reports(run_id: str) -> int:
+    """Archive and delete expired unreferenced reports. Returns reports deleted."""
+    if REPORT_RETENTION_DAYS <= 0:
+        return 0
+    cutoff = _cutoff(REPORT_RETENTION_DAYS * 86400)
+    archived = 0
+    while not _worker_stop.is_set():
+        rows = get_archivable_reports(cutoff, MAINTENANCE_BATCH)
+        if not rows:
+            break
+        _write_archive(rows, run_id)
+        archived += delete_reports([r[0] for r in rows])
+        if len(rows) < MAINTENANCE_BATCH:
+            break
+        time.sleep(MAINTENANCE_PAUSE)
+    return archived
+
+
+def _delete_in_batches(delete, *args) -> int:
+    total = 0
+    while not _worker_stop.is_set():
+        n = delete(*args, MAINTENANCE_BATCH)
+        total += n
+        if n < MAINTENANCE_BATCH:
+            break
+        time.sleep(MAINTENANCE_PAUSE)
+    return total
+
+
+def compact() -> tuple[int, int]:
+    """Delete expired cache rows and orphaned claim index rows. Returns (cache rows, index rows)."""
+    cache_rows = _delete_in_batches(delete_stale_rows, "article_cache", _cutoff(ARTICLE_CACHE_TTL))
+    if GEMINI_CACHE_TTL > 0:
+        cache_rows += _delete_in_batches(delete_stale_rows, "gemini_cache", _cutoff(GEMINI_CACHE_TTL))
+    return cache_rows, _delete_in_batches(delete_orphan_claim_index)
+
+
+def vacuum_free_pages() -> int:
+    """Release free pages in MAINTENANCE_VACUUM_PAGES steps (needs auto_vacuum=INCREMENTAL). Returns pages released."""
+    if get_auto_vacuum() != 2:
+        return 0
+    released = 0
+    while not _worker_stop.is_set():
+        n = incremental_vacuum(MAINTENANCE_VACUUM_PAGES)
+        released += n
+        if MAINTENANCE_VACUUM_PAGES <= 0 or n < MAINTENANCE_VACUUM_PAGES:
+            break
+        time.sleep(MAINTENANCE_PAUSE)
+    return released
+
+
+def run_once() -> dict:
+    """One maintenance pass (skipped if another thread in this process is mid-pass)."""
+    global _last_run
+    if not _run_lock.acquire(blocking=False):
+        return {}
+    try:
+        started = time.perf_counter()
+        run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        archived = archive_reports(run_id)
+        cache_rows, index_rows = compact()
+        vacuumed = vacuum_free_pages()
+        result = {
+            "archived": archived,
+            "deleted_cache_rows": cache_rows,
+            "deleted_index_rows": index_rows,
+            "vacuumed_pages": vacuumed,
+        }
+        for key, value in result.items():
+            _stats[key] += value
+        _stats["runs"] += 1
+        _last_run = {
+            **result,
+            "seconds": round(time.perf_counter() - started, 3),
+            "finished_at": datetime.datetime.utcnow().isoformat(),
+        }
+        return result
+    finally:
+        _run_lock.release()
+
+
+def _maintenance_loop():
+    while not _worker_stop.wait(MAINTENANCE_INTERVAL):
+        try:
+            run_once()
+        except Exception as e:
+            print(f"Maintenance run failed: {e}")
+
+
+def start_maintenance():
+    """Start the background maintenance thread (no-op if disabled or already running)."""
+    global _worker
+    if MAINTENANCE_INTERVAL <= 0 or (_worker and _worker.is_alive()):
+        return
+    _worker_stop.clear()
+    _worker = threading.Thread(target=_maintenance_loop, name="db-maintenance", daemon=True)
+    _worker.start()
+
+
+def stop_maintenance():
+    _worker_stop.set()
+
+
+def stats() -> dict:
+    return {**_stats, "last_run": _last_run}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RealOrRender database maintenance (one pass)")
+    parser.add_argument(
+        "--enable-incremental-vacuum",
+        action="store_true",
+        help="first switch an existing database to auto_vacuum=INCREMENTAL (full VACUUM; run with the API stopped)",
+    )
+    args = parser.parse_args()
+
+    init_db()
+    if args.enable_incremental_vacuum and get_auto_vacuum() != 2:
+        print("Rebuilding database with auto_vacuum=INCREMENTAL...")
+        enable_incremental_vacuum()
+    print(json.dumps(run_once()))
+
+
+if __name__ == "__main__":
+    main()
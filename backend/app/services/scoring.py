@@ -8,6 +8,9 @@ Matches the exact policy specified:
 - manipulation_signals: -3 each, max -15
 - ai_likelihood: optional -0 to -10 (ai_likelihood * 10)
 - Clamp 0-100
+- Timed-out claims: -10 each (like INSUFFICIENT), max -35, so a report where every
+  claim timed out starts from the neutral 65; a partial report never scores above
+  the same report with its timed-out claims finished as SUPPORTED
 - >= 75 => ALLOW
 - 50-74 => WARN
 - < 50 => BLOCK
@@ -21,17 +24,23 @@ SUPPORTED_PENALTY = 0
 MANIPULATION_PENALTY_PER = 3
 MANIPULATION_MAX_PENALTY = 15
 AI_LIKELIHOOD_MAX_PENALTY = 10
+NEUTRAL_SCORE = 65.0  # "could not fully verify" (verification unavailable or timed out)
+TIMED_OUT_PENALTY = INSUFFICIENT_PENALTY
+TIMED_OUT_MAX_PENALTY = 100 - NEUTRAL_SCORE
 
 
 def compute_credibility_score(
     claim_verdicts: list[str],
     manipulation_signals: list[str],
     ai_likelihood: float | None,
+    timed_out: int = 0,
 ) -> float:
     """
     Compute credibility score 0-100 using the policy.
+    claim_verdicts holds the finished claims; timed_out counts the others.
     """
     score = 100.0
+    score -= min(timed_out * TIMED_OUT_PENALTY, TIMED_OUT_MAX_PENALTY)
 
     for v in claim_verdicts:
         v = (v or "").upper()
@@ -2,103 +2,640 @@
 Orchestrates the full verification pipeline:
 1. Extract article content
 2. Gemini: claims + manipulation + AI likelihood
-3. Backboard: verify each claim
+3. Backboard: verify claims (batched, then per-claim for leftovers)
 4. Scoring + decision
 5. Build VerificationReport
+Every stage shares one time budget (VERIFY_TIME_BUDGET or the request's time_budget);
+claims still unfinished when it runs out are reported as timed out.
 """
 
+import asyncio
+import contextlib
+import os
+import threading
 import uuid
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
 
 from app.models import (
     VerificationReport,
+    VerifyArticleRequest,
+    BulkVerifyResult,
     ArticleInfo,
     ClaimResult,
     EvidenceItem,
+    GeminiClaimOutput,
+    GeminiOutput,
 )
-from app.services.extract import extract_article, ExtractedArticle
-from app.services.gemini import run_gemini_analysis, get_gemini_fallback
-from app.services.backboard import verify_claim
-from app.services.scoring import compute_credibility_score, get_decision
-from app.db import save_report
+from app.services.extract import extract_article, extract_article_async, ExtractedArticle
+from app.services.gemini import run_gemini_analysis, run_gemini_analysis_async, get_gemini_fallback
+from app.services.backboard import (
+    BACKBOARD_BATCH,
+    TIMED_OUT_SOURCE,
+    UNAVAILABLE_SOURCE,
+    ClaimVerification,
+    timed_out_result,
+    verify_claim,
+    verify_claim_async,
+    verify_claims_batch,
+    verify_claims_batch_async,
+)
+from app.services.scoring import NEUTRAL_SCORE, compute_credibility_score, get_decision
+from app.db import (
+    ARTICLE_CACHE_TTL,
+    save_report,
+    save_report_async,
+    get_cached_article,
+    get_cached_article_async,
+    cache_article,
+    cache_article_async,
+)
+from app.utils import tracing
+from app.utils.deadline import Deadline, deadline_after, expired, remaining
+from app.utils.hashing import content_hash
+from app.utils.metrics import (
+    STAGE_SECONDS,
+    VERIFICATIONS,
+    VERIFICATIONS_IN_FLIGHT,
+    cache_lookup,
+    upstream_error,
+)
+from app.utils.singleflight import SingleFlight, AsyncSingleFlight
+from app.utils.urls import canonical_url
 
+# Max claims adjudicated in parallel for one article
+CLAIM_CONCURRENCY = int(os.getenv("CLAIM_CONCURRENCY", "4"))
+# Max claims adjudicated in parallel across all requests in this process
+CLAIM_GLOBAL_CONCURRENCY = int(os.getenv("CLAIM_GLOBAL_CONCURRENCY", "32"))
 
-def run_verification(
-    url: Optional[str] = None,
-    raw_text: Optional[str] = None,
-) -> Optional[VerificationReport]:
-    """
-    Full verification pipeline. Returns VerificationReport or None on extraction failure.
-    """
-    # 1. Extract article
-    article = extract_article(url=url, raw_text=raw_text)
-    if not article:
-        return None
+# End-to-end budget per verification unless the request sets time_budget (0 = unbounded)
+VERIFY_TIME_BUDGET = float(os.getenv("VERIFY_TIME_BUDGET", "60"))  # seconds
 
-    # 2. Gemini analysis
-    gemini_out = run_gemini_analysis(article.text)
-    if not gemini_out:
-        gemini_out = get_gemini_fallback(article.text)
+_claim_slots = threading.BoundedSemaphore(max(1, CLAIM_GLOBAL_CONCURRENCY))
+_article_flights = SingleFlight()
+
+
+def request_deadline(time_budget: Optional[float] = None) -> Optional[Deadline]:
+    """Deadline for a verification starting now: the request's budget, else VERIFY_TIME_BUDGET."""
+    return deadline_after(time_budget or VERIFY_TIME_BUDGET)
 
-    # 3. Backboard: verify each claim
-    claim_results: list[ClaimResult] = []
-    for gc in gemini_out.claims:
-        verdict, confidence, evidence, _cache_hit = verify_claim(
+
+def _claim_result(gc: GeminiClaimOutput, verification: ClaimVerification) -> ClaimResult:
+    verdict, confidence, evidence, cache_hit = verification
+    cache_lookup("claim", cache_hit)
+    timed_out = any(e.source == TIMED_OUT_SOURCE for e in evidence)
+    if timed_out:
+        upstream_error("backboard", kind="deadline")
+    return ClaimResult(
+        id=gc.id,
+        text=gc.text,
+        verdict=verdict,
+        confidence=confidence,
+        evidence=evidence,
+        timed_out=timed_out,
+    )
+
+
+def _verify_one(gc: GeminiClaimOutput, use_cache: bool, deadline: Optional[Deadline] = None) -> ClaimVerification:
+    """Verify one Gemini claim, holding a global slot while Backboard is called."""
+    with _claim_slots:
+        if expired(deadline):
+            return timed_out_result()
+        return verify_claim(
             claim_text=gc.text,
             claim_id=gc.id,
-            use_cache=True,
-        )
-        claim_results.append(
-            ClaimResult(
-                id=gc.id,
-                text=gc.text,
-                verdict=verdict,
-                confidence=confidence,
-                evidence=evidence,
-            )
+            use_cache=use_cache,
+            deadline=deadline,
         )
 
-    # 4. Scoring
-    # When Backboard is unavailable, all claims get INSUFFICIENT -> score drops to ~30.
-    # Use a neutral score instead so the UI doesn't look broken.
-    verification_unavailable = all(
-        e.source == "Verification unavailable"
+
+def verify_claims(claims: list[GeminiClaimOutput], deadline: Optional[Deadline] = None) -> list[ClaimResult]:
+    """
+    Verify claims: one batched Backboard call for the cache misses (BACKBOARD_BATCH),
+    then concurrent per-claim calls (bounded per request and per process) for
+    anything the batch did not return. Results keep the original claim order.
+    Claims not verified by the deadline are returned as timed out.
+    """
+    if not claims:
+        return []
+    verifications: dict[int, ClaimVerification] = {}
+    batched = BACKBOARD_BATCH and len(claims) > 1
+    if batched:
+        with _claim_slots:
+            verifications = verify_claims_batch([gc.text for gc in claims], deadline)
+
+    pending = [p for p in range(len(claims)) if p not in verifications]
+    workers = max(1, min(CLAIM_CONCURRENCY, len(pending)))
+    if workers == 1:
+        for p in pending:
+            verifications[p] = _verify_one(claims[p], not batched, deadline)
+    elif pending:
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="verify-claim")
+        futures = {pool.submit(_verify_one, claims[p], not batched, deadline): p for p in pending}
+        # Calls are clipped to the deadline, so stragglers finish shortly after it
+        wait(futures, timeout=remaining(deadline))
+        pool.shutdown(wait=False, cancel_futures=True)
+        for future, p in futures.items():
+            done = future.done() and not future.cancelled()
+            verifications[p] = future.result() if done else timed_out_result()
+
+    return [_claim_result(gc, verifications[p]) for p, gc in enumerate(claims)]
+
+
+def is_verification_unavailable(claim_results: list[ClaimResult]) -> bool:
+    """True when every claim fell back to the 'Verification unavailable' or 'timed out' evidence item."""
+    return all(
+        e.source in (UNAVAILABLE_SOURCE, TIMED_OUT_SOURCE)
         for c in claim_results for e in c.evidence
     ) if claim_results else False
 
-    if verification_unavailable:
-        credibility_score = 65.0  # Neutral "could not fully verify"
-        summary_suffix = " (Verification service unavailable - add GEMINI_API_KEY and BACKBOARD_API_KEY for full analysis.)"
+
+def _article_cache_key(url: Optional[str], raw_text: Optional[str]) -> str:
+    """Canonical URL key, or "" when the article cache does not apply."""
+    if ARTICLE_CACHE_TTL <= 0 or not url or raw_text:
+        return ""
+    return canonical_url(url)
+
+
+def _article_flight_key(url: Optional[str], raw_text: Optional[str]) -> tuple[str, str]:
+    """Key for coalescing identical in-flight articles: canonical URL + pasted-text hash."""
+    return (
+        canonical_url(url) if url else "",
+        content_hash(raw_text) if raw_text and raw_text.strip() else "",
+    )
+
+
+def _record_outcome(report: Optional[VerificationReport]):
+    if report is None:
+        outcome = "no_article"
+    else:
+        outcome = "partial" if report.partial else "complete"
+    VERIFICATIONS.inc(outcome=outcome)
+
+
+def _should_cache_article(url_key: str, report: VerificationReport) -> bool:
+    # Don't pin degraded or partial reports to a URL for the whole TTL
+    return bool(url_key) and not report.partial and not is_verification_unavailable(report.claims)
+
+
+def article_info(article: ExtractedArticle) -> ArticleInfo:
+    return ArticleInfo(
+        title=article.title,
+        url=article.url,
+        publisher=article.publisher,
+        published_date=article.published_date,
+    )
+
+
+def build_report(
+    article: ExtractedArticle,
+    gemini_out: GeminiOutput,
+    claim_results: list[ClaimResult],
+    verification_id: Optional[str] = None,
+) -> VerificationReport:
+    """Score adjudicated claims and assemble the VerificationReport (steps 4-5)."""
+    with STAGE_SECONDS.time(stage="scoring"), tracing.span("scoring"):
+        return tracing.profiled("build_report", _build_report, article, gemini_out, claim_results, verification_id)
+
+
+def _build_report(
+    article: ExtractedArticle,
+    gemini_out: GeminiOutput,
+    claim_results: list[ClaimResult],
+    verification_id: Optional[str],
+) -> VerificationReport:
+    # 4. Scoring
+    # When Backboard is unavailable, all claims get INSUFFICIENT -> score drops to ~30.
+    # Use a neutral score instead so the UI doesn't look broken. Timed-out claims are
+    # left out of the verdicts and get a capped per-claim penalty instead (see scoring).
+    timed_out = sum(c.timed_out for c in claim_results)
+    if is_verification_unavailable(claim_results) and not timed_out:
+        credibility_score = NEUTRAL_SCORE  # Neutral "could not fully verify"
     else:
-        verdicts = [c.verdict for c in claim_results]
         credibility_score = compute_credibility_score(
-            claim_verdicts=verdicts,
+            claim_verdicts=[c.verdict for c in claim_results if not c.timed_out],
             manipulation_signals=gemini_out.manipulation_signals,
             ai_likelihood=gemini_out.ai_likelihood if gemini_out.ai_likelihood else None,
+            timed_out=timed_out,
         )
-        summary_suffix = ""
+    summary_suffix = ""
+    if any(e.source == UNAVAILABLE_SOURCE for c in claim_results for e in c.evidence):
+        summary_suffix = " (Verification service unavailable - add GEMINI_API_KEY and BACKBOARD_API_KEY for full analysis.)"
+    if timed_out:
+        summary_suffix += f" (Partial report: {timed_out} of {len(claim_results)} claims timed out.)"
 
     decision = get_decision(credibility_score)
 
     # 5. Build report
-    verification_id = str(uuid.uuid4())
-    report = VerificationReport(
-        verification_id=verification_id,
+    return VerificationReport(
+        verification_id=verification_id or str(uuid.uuid4()),
         decision=decision,
         credibility_score=credibility_score,
         ai_likelihood=gemini_out.ai_likelihood,
         manipulation_signals=gemini_out.manipulation_signals or None,
         summary=gemini_out.short_summary + summary_suffix,
-        article=ArticleInfo(
-            title=article.title,
-            url=article.url,
-            publisher=article.publisher,
-            published_date=article.published_date,
-        ),
+        article=article_info(article),
         claims=claim_results,
+        partial=bool(timed_out),
+    )
+
+
+def run_verification(
+    url: Optional[str] = None,
+    raw_text: Optional[str] = None,
+    force_refresh: bool = False,
+    verification_id: Optional[str] = None,
+    time_budget: Optional[float] = None,
+) -> Optional[VerificationReport]:
+    """
+    Full verification pipeline. Returns VerificationReport or None on extraction failure.
+    A fresh report for the same canonical URL is returned as-is unless force_refresh,
+    so the result may carry a different id than the verification_id requested.
+    Concurrent requests for the same article share the first one's time budget.
+    """
+    deadline = request_deadline(time_budget)
+    url_key = _article_cache_key(url, raw_text)
+    if url_key and not force_refresh:
+        with tracing.span("cache"):
+            cached = get_cached_article(url_key, ARTICLE_CACHE_TTL)
+        cache_lookup("article", cached is not None)
+        if cached:
+            return VerificationReport.model_validate_json(cached)
+
+    # Concurrent requests for the same article share one pipeline run
+    return _article_flights.do(
+        _article_flight_key(url, raw_text), _verify_article, url, raw_text, url_key, verification_id, deadline
     )
 
+
+def _verify_article(
+    url: Optional[str],
+    raw_text: Optional[str],
+    url_key: str,
+    verification_id: Optional[str] = None,
+    deadline: Optional[Deadline] = None,
+) -> Optional[VerificationReport]:
+    with VERIFICATIONS_IN_FLIGHT.track():
+        try:
+            report = _run_pipeline(url, raw_text, url_key, verification_id, deadline)
+        except Exception:
+            VERIFICATIONS.inc(outcome="error")
+            raise
+    _record_outcome(report)
+    return report
+
+
+def _run_pipeline(
+    url: Optional[str],
+    raw_text: Optional[str],
+    url_key: str,
+    verification_id: Optional[str],
+    deadline: Optional[Deadline],
+) -> Optional[VerificationReport]:
+    # 1. Extract article
+    with tracing.span("extract"):
+        article = extract_article(url=url, raw_text=raw_text, deadline=deadline)
+    if not article:
+        return None
+
+    # 2. Gemini analysis
+    with tracing.span("gemini"):
+        gemini_out = run_gemini_analysis(article.text, deadline)
+    if not gemini_out:
+        gemini_out = get_gemini_fallback(article.text)
+
+    # 3. Backboard: verify claims concurrently (order preserved)
+    with tracing.span("claims"):
+        claim_results = verify_claims(gemini_out.claims, deadline)
+
+    report = build_report(article, gemini_out, claim_results, verification_id)
+    report.timings = tracing.timings()
+
     # Persist for GET /api/reports/{id}
-    save_report(verification_id, report.model_dump_json())
+    with tracing.span("save"):
+        save_report(report.verification_id, report.model_dump_json())
+        if _should_cache_article(url_key, report):
+            cache_article(url_key, report.verification_id)
+
+    return report
+
+
+# --- Async pipeline (used by POST /api/verifyArticle) ---
+
+# Binds to the serving event loop on first use
+_async_claim_slots = asyncio.Semaphore(max(1, CLAIM_GLOBAL_CONCURRENCY))
+_async_article_flights = AsyncSingleFlight()
+
+
+@dataclass
+class StageLimits:
+    """Optional per-stage semaphores for the async pipeline (None = unlimited)."""
+    extract: Optional[asyncio.Semaphore] = None
+    analyze: Optional[asyncio.Semaphore] = None
+    verify: Optional[asyncio.Semaphore] = None
+
+
+def _stage(limits: Optional[StageLimits], name: str):
+    sem = getattr(limits, name) if limits else None
+    return sem if sem is not None else contextlib.nullcontext()
+
+
+async def iter_claim_verifications_async(
+    claims: list[GeminiClaimOutput],
+    deadline: Optional[Deadline] = None,
+) -> AsyncIterator[tuple[int, ClaimVerification]]:
+    """
+    Yield (position, verification) for each claim as soon as it is resolved:
+    cached and batched results first, then per-claim calls in completion order.
+    Same batching and per-request/global limits as verify_claims. At the deadline
+    the claims still outstanding are yielded as timed out.
+    """
+    if not claims:
+        return
+    batched = BACKBOARD_BATCH and len(claims) > 1
+    done: dict[int, ClaimVerification] = {}
+    if batched:
+        async with _async_claim_slots:
+            done = await verify_claims_batch_async([gc.text for gc in claims], deadline)
+        for p, verification in done.items():
+            yield p, verification
+
+    request_slots = asyncio.Semaphore(max(1, CLAIM_CONCURRENCY))
+
+    async def _one(p: int) -> tuple[int, ClaimVerification]:
+        async with request_slots, _async_claim_slots:
+            if expired(deadline):
+                return p, timed_out_result()
+            return p, await verify_claim_async(
+                claim_text=claims[p].text,
+                claim_id=claims[p].id,
+                use_cache=not batched,
+                deadline=deadline,
+            )
 
+    tasks = [asyncio.ensure_future(_one(p)) for p in range(len(claims)) if p not in done]
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=remaining(deadline)):
+            try:
+                p, verification = await next_done
+            except asyncio.TimeoutError:
+                break
+            done[p] = verification
+            yield p, verification
+        for p in range(len(claims)):
+            if p not in done:
+                yield p, timed_out_result()
+    finally:
+        # Consumer went away (e.g. stream closed): stop outstanding calls
+        for t in tasks:
+            t.cancel()
+
+
+async def verify_claims_async(
+    claims: list[GeminiClaimOutput],
+    deadline: Optional[Deadline] = None,
+) -> list[ClaimResult]:
+    """
+    Async variant of verify_claims. Results keep the original claim order.
+    """
+    verifications = {p: v async for p, v in iter_claim_verifications_async(claims, deadline)}
+    return [_claim_result(gc, verifications[p]) for p, gc in enumerate(claims)]
+
+
+async def run_verification_async(
+    url: Optional[str] = None,
+    raw_text: Optional[str] = None,
+    force_refresh: bool = False,
+    limits: Optional[StageLimits] = None,
+    time_budget: Optional[float] = None,
+) -> Optional[VerificationReport]:
+    """
+    Async variant of run_verification. No thread is held while waiting on
+    the article host, Gemini, Backboard or SQLite. Time spent waiting for
+    stage limits counts against the budget.
+    """
+    deadline = request_deadline(time_budget)
+    url_key = _article_cache_key(url, raw_text)
+    if url_key and not force_refresh:
+        with tracing.span("cache"):
+            cached = await get_cached_article_async(url_key, ARTICLE_CACHE_TTL)
+        cache_lookup("article", cached is not None)
+        if cached:
+            return VerificationReport.model_validate_json(cached)
+
+    return await _async_article_flights.do(
+        _article_flight_key(url, raw_text), _verify_article_async, url, raw_text, url_key, limits, deadline
+    )
+
+
+async def _verify_article_async(
+    url: Optional[str],
+    raw_text: Optional[str],
+    url_key: str,
+    limits: Optional[StageLimits] = None,
+    deadline: Optional[Deadline] = None,
+) -> Optional[VerificationReport]:
+    report = None
+    async for event, value in _pipeline_events_async(url, raw_text, url_key, limits, deadline):
+        if event == "report":
+            report = value
     return report
+
+
+async def _pipeline_events_async(
+    url: Optional[str],
+    raw_text: Optional[str],
+    url_key: str,
+    limits: Optional[StageLimits] = None,
+    deadline: Optional[Deadline] = None,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Run the async pipeline, yielding each stage as it finishes:
+    ("article", ArticleInfo), ("analysis", GeminiOutput), ("claim", ClaimResult)
+    per claim in completion order, then ("report", VerificationReport) once saved.
+    Yields nothing if no article could be extracted. Each stage waits for its
+    slot in limits, if given, and is bounded by the deadline.
+    """
+    report = None
+    VERIFICATIONS_IN_FLIGHT.inc()
+    try:
+        async for event in _pipeline_stages_async(url, raw_text, url_key, limits, deadline):
+            if event[0] == "report":
+                report = event[1]
+            yield event
+    except Exception:
+        VERIFICATIONS.inc(outcome="error")
+        raise
+    else:
+        _record_outcome(report)
+    finally:
+        # Also reached when the consumer stops early (stream closed)
+        VERIFICATIONS_IN_FLIGHT.dec()
+
+
+async def _pipeline_stages_async(
+    url: Optional[str],
+    raw_text: Optional[str],
+    url_key: str,
+    limits: Optional[StageLimits],
+    deadline: Optional[Deadline],
+) -> AsyncIterator[tuple[str, Any]]:
+    # Spans include any wait for the stage's slot in limits
+    with tracing.span("extract"):
+        async with _stage(limits, "extract"):
+            article = await extract_article_async(url=url, raw_text=raw_text, deadline=deadline)
+    if not article:
+        return
+    yield "article", article_info(article)
+
+    with tracing.span("gemini"):
+        async with _stage(limits, "analyze"):
+            gemini_out = await run_gemini_analysis_async(article.text, deadline)
+    if not gemini_out:
+        gemini_out = get_gemini_fallback(article.text)
+    yield "analysis", gemini_out
+
+    claims = gemini_out.claims
+    results: dict[int, ClaimResult] = {}
+    with tracing.span("claims"):
+        async with _stage(limits, "verify"):
+            async for p, verification in iter_claim_verifications_async(claims, deadline):
+                results[p] = _claim_result(claims[p], verification)
+                yield "claim", results[p]
+    claim_results = [results[p] for p in range(len(claims))]
+
+    report = build_report(article, gemini_out, claim_results)
+    report.timings = tracing.timings()
+
+    with tracing.span("save"):
+        await save_report_async(report.verification_id, report.model_dump_json())
+        if _should_cache_article(url_key, report):
+            await cache_article_async(url_key, report.verification_id)
+
+    yield "report", report
+
+
+async def stream_verification(
+    url: Optional[str] = None,
+    raw_text: Optional[str] = None,
+    force_refresh: bool = False,
+    time_budget: Optional[float] = None,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Streaming variant of run_verification_async (see _pipeline_events_async for events).
+    A fresh cached report is yielded directly as the only event.
+    """
+    deadline = request_deadline(time_budget)
+    url_key = _article_cache_key(url, raw_text)
+    if url_key and not force_refresh:
+        with tracing.span("cache"):
+            cached = await get_cached_article_async(url_key, ARTICLE_CACHE_TTL)
+        cache_lookup("article", cached is not None)
+        if cached:
+            yield "report", VerificationReport.model_validate_json(cached)
+            return
+
+    async for event in _pipeline_events_async(url, raw_text, url_key, deadline=deadline):
+        yield event
+
+
+# --- Bulk verification (POST /api/verifyArticle/bulk) ---
+
+# Articles in flight per bulk request
+BULK_CONCURRENCY = int(os.getenv("BULK_CONCURRENCY", "32"))
+# Per-stage limits shared by all bulk requests in this process
+BULK_EXTRACT_CONCURRENCY = int(os.getenv("BULK_EXTRACT_CONCURRENCY", "16"))
+BULK_GEMINI_CONCURRENCY = int(os.getenv("BULK_GEMINI_CONCURRENCY", "4"))
+BULK_VERIFY_CONCURRENCY = int(os.getenv("BULK_VERIFY_CONCURRENCY", "8"))
+
+# Binds to the serving event loop on first use
+_bulk_limits = StageLimits(
+    extract=asyncio.Semaphore(max(1, BULK_EXTRACT_CONCURRENCY)),
+    analyze=asyncio.Semaphore(max(1, BULK_GEMINI_CONCURRENCY)),
+    verify=asyncio.Semaphore(max(1, BULK_VERIFY_CONCURRENCY)),
+)
+
+
+def _dedupe_items(
+    items: list[tuple[int, VerifyArticleRequest]],
+) -> list[tuple[VerifyArticleRequest, list[int]]]:
+    """
+    Group (index, item) pairs by canonical URL / pasted-text hash: (representative, input indexes).
+    Items without a usable key (e.g. a non-http URL and no text) are never grouped.
+    """
+    groups: dict[tuple[str, str], tuple[VerifyArticleRequest, list[int]]] = {}
+    ungrouped: list[tuple[VerifyArticleRequest, list[int]]] = []
+    for i, item in items:
+        key = _article_flight_key(item.url, item.raw_text)
+        if key == ("", ""):
+            ungrouped.append((item, [i]))
+        elif key in groups:
+            first, indexes = groups[key]
+            indexes.append(i)
+            if item.force_refresh and not first.force_refresh:
+                groups[key] = (first.model_copy(update={"force_refresh": True}), indexes)
+        else:
+            groups[key] = (item, [i])
+    return list(groups.values()) + ungrouped
+
+
+async def _bulk_one(item: VerifyArticleRequest) -> BulkVerifyResult:
+    try:
+        report = await run_verification_async(
+            url=item.url,
+            raw_text=item.raw_text,
+            force_refresh=item.force_refresh,
+            limits=_bulk_limits,
+            time_budget=item.time_budget,
+        )
+    except Exception as e:
+        print(f"Bulk verification failed for {item.url or 'raw_text'}: {e}")
+        return BulkVerifyResult(index=-1, status_code=500, error=str(e)[:500] or "Verification failed")
+    if not report:
+        return BulkVerifyResult(
+            index=-1,
+            status_code=422,
+            error="Could not extract article content. Check URL or provide raw_text.",
+        )
+    return BulkVerifyResult(index=-1, report=report)
+
+
+async def verify_bulk(items: list[VerifyArticleRequest]) -> AsyncIterator[BulkVerifyResult]:
+    """
+    Verify many articles through the async pipeline, pipelined: up to
+    BULK_CONCURRENCY articles in flight, each stage bounded by the BULK_*
+    limits. Duplicate inputs run once. Yields one result per input index,
+    in completion order. Items without url or raw_text get a 400 result.
+    """
+    pending: asyncio.Queue = asyncio.Queue()
+    finished: asyncio.Queue = asyncio.Queue()
+    valid = []
+    for i, item in enumerate(items):
+        if not item.url and not item.raw_text:
+            yield BulkVerifyResult(index=i, status_code=400, error="Provide either 'url' or 'raw_text'")
+        else:
+            valid.append((i, item))
+    groups = 0
+    for item, indexes in _dedupe_items(valid):
+        pending.put_nowait((item, indexes))
+        groups += 1
+
+    async def _worker():
+        while True:
+            try:
+                item, indexes = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await finished.put((indexes, await _bulk_one(item)))
+
+    workers = [asyncio.ensure_future(_worker()) for _ in range(min(max(1, BULK_CONCURRENCY), groups))]
+    try:
+        for _ in range(groups):
+            indexes, result = await finished.get()
+            for i in indexes:
+                yield result.model_copy(update={"index": i})
+    finally:
+        # Client went away: stop outstanding articles
+        for w in workers:
+            w.cancel()
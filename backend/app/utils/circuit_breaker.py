@@ -0,0 +1,128 @@
+"""
+Per-upstream circuit breaker. Tracks the failure rate over a rolling window;
+opens when it crosses the threshold, fast-fails while open, then lets a few
+probe calls through (half-open) after a cooldown to decide whether to close.
+Thread-safe and cheap enough to call from the event loop.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+BREAKER_FAILURE_RATE = float(os.getenv("BREAKER_FAILURE_RATE", "0.5"))  # open at this failure ratio
+BREAKER_MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", "5"))  # ...once the window has this many calls
+BREAKER_WINDOW = float(os.getenv("BREAKER_WINDOW", "60"))  # seconds of history considered
+BREAKER_COOLDOWN = float(os.getenv("BREAKER_COOLDOWN", "30"))  # seconds open before probing
+BREAKER_HALF_OPEN_CALLS = int(os.getenv("BREAKER_HALF_OPEN_CALLS", "1"))  # concurrent probes
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = BREAKER_FAILURE_RATE,
+        min_calls: int = BREAKER_MIN_CALLS,
+        window: float = BREAKER_WINDOW,
+        cooldown: float = BREAKER_COOLDOWN,
+        half_open_calls: int = BREAKER_HALF_OPEN_CALLS,
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, min_calls)
+        self.window = window
+        self.cooldown = cooldown
+        self.half_open_calls = max(1, half_open_calls)
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._calls: deque[tuple[float, bool]] = deque()  # (monotonic time, failed)
+        self._failures = 0  # failures currently in _calls
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probing_since = 0.0
+        self._rejected = 0
+        self._times_opened = 0
+
+    def _prune(self, now: float):
+        cutoff = now - self.window
+        while self._calls and self._calls[0][0] < cutoff:
+            _, failed = self._calls.popleft()
+            self._failures -= failed
+
+    def _open(self, now: float):
+        self._state = OPEN
+        self._opened_at = now
+        self._probes = 0
+        self._times_opened += 1
+
+    def allow(self) -> bool:
+        """True if a call may go out; False means fail fast to the fallback."""
+        if self.failure_rate <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            if self._state == OPEN and now - self._opened_at >= self.cooldown:
+                self._state = HALF_OPEN
+                self._probes = 0
+                self._probing_since = now
+            elif self._state == HALF_OPEN and now - self._probing_since >= self.cooldown:
+                # Probes that never reported back (e.g. cancelled) must not wedge the breaker
+                self._probes = 0
+                self._probing_since = now
+            if self._state == HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                return True
+            if self._state == CLOSED:
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state == HALF_OPEN:
+                # Upstream is back: start over with a clean window
+                self._state = CLOSED
+                self._calls.clear()
+                self._failures = 0
+                return
+            now = time.monotonic()
+            self._calls.append((now, False))
+            self._prune(now)
+
+    def record_failure(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._state == HALF_OPEN:
+                self._open(now)
+                return
+            if self._state == OPEN:
+                return
+            self._calls.append((now, True))
+            self._failures += 1
+            self._prune(now)
+            if len(self._calls) >= self.min_calls and self._failures / len(self._calls) >= self.failure_rate:
+                self._open(now)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                return HALF_OPEN
+            return self._state
+
+    def stats(self) -> dict:
+        state = self.state
+        with self._lock:
+            self._prune(time.monotonic())
+            calls = len(self._calls)
+            return {
+                "state": state,
+                "window_calls": calls,
+                "window_failure_rate": round(self._failures / calls, 3) if calls else 0.0,
+                "rejected": self._rejected,
+                "times_opened": self._times_opened,
+            }
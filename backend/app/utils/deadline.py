@@ -0,0 +1,45 @@
+"""
+End-to-end time budget for one verification. Created when the request starts and
+passed to every stage, which clips its own timeout to what is left and skips
+upstream calls once it has run out. None (or a zero budget) means unbounded.
+"""
+
+import time
+from typing import Optional
+
+# Floor for a clipped timeout, so a nearly spent budget still yields a valid value
+MIN_STAGE_TIMEOUT = 0.05  # seconds
+
+
+class Deadline:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+def deadline_after(seconds: Optional[float]) -> Optional[Deadline]:
+    """Deadline `seconds` from now, or None for an unbounded request."""
+    return Deadline(seconds) if seconds and seconds > 0 else None
+
+
+def expired(deadline: Optional[Deadline]) -> bool:
+    return deadline is not None and deadline.expired
+
+
+def remaining(deadline: Optional[Deadline]) -> Optional[float]:
+    """Seconds left, or None if unbounded."""
+    return deadline.remaining() if deadline is not None else None
+
+
+def stage_timeout(deadline: Optional[Deadline], default: float) -> float:
+    """A stage's own timeout, clipped to the time left in the budget."""
+    if deadline is None:
+        return default
+    return max(MIN_STAGE_TIMEOUT, min(default, deadline.remaining()))
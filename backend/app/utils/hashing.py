@@ -5,13 +5,15 @@ Hashing utilities for claim fingerprints (used in Backboard memory / cache).
 import hashlib
 import re
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def normalize_claim_text(text: str) -> str:
     """Normalize claim text for consistent hashing."""
     if not text or not isinstance(text, str):
         return ""
     # Lowercase, collapse whitespace, strip
-    normalized = re.sub(r"\s+", " ", text.lower().strip())
+    normalized = _WHITESPACE_RE.sub(" ", text.lower().strip())
     return normalized
 
 
@@ -19,3 +21,9 @@ def claim_hash(text: str) -> str:
     """SHA256 hash of normalized claim text. Used as cache key."""
     normalized = normalize_claim_text(text)
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def content_hash(text: str) -> str:
+    """SHA256 of whitespace-collapsed article text. Used to key work on pasted articles."""
+    normalized = _WHITESPACE_RE.sub(" ", (text or "").strip())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
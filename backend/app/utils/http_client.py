@@ -0,0 +1,121 @@
+"""
+Shared HTTP clients for upstream calls (article hosts, Backboard).
+Pooled keep-alive connections per host, bounded retries with backoff.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "20"))  # distinct hosts kept pooled
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "50"))  # connections kept per host
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))  # seconds (async client)
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", "0.5"))  # seconds, doubled per attempt
+
+# Statuses worth retrying; only for idempotent methods
+RETRY_STATUSES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def _retry_policy() -> Retry:
+    # Connection errors are retried for every method (request never reached the server);
+    # read errors and retryable statuses only for idempotent methods.
+    return Retry(
+        total=HTTP_MAX_RETRIES,
+        connect=HTTP_MAX_RETRIES,
+        read=HTTP_MAX_RETRIES,
+        status=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=IDEMPOTENT_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide requests.Session (created on first use)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=HTTP_POOL_MAXSIZE,
+                    max_retries=_retry_policy(),
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient for the serving event loop."""
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        limits = httpx.Limits(
+            max_connections=HTTP_POOL_CONNECTIONS * HTTP_POOL_MAXSIZE,
+            max_keepalive_connections=HTTP_POOL_MAXSIZE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        )
+        _async_client = httpx.AsyncClient(
+            follow_redirects=True,
+            # Transport-level retries cover connection failures only
+            transport=httpx.AsyncHTTPTransport(limits=limits, retries=HTTP_MAX_RETRIES),
+        )
+    return _async_client
+
+
+async def request_async(method: str, url: str, stream: bool = False, **kwargs) -> httpx.Response:
+    """
+    Send a request on the shared async client. Idempotent methods are retried
+    with exponential backoff on read errors and RETRY_STATUSES.
+    With stream=True the body is not read; the caller must aclose() the response.
+    """
+    client = get_async_client()
+    method = method.upper()
+    retries = HTTP_MAX_RETRIES if method in IDEMPOTENT_METHODS else 0
+    attempt = 0
+    while True:
+        try:
+            if stream:
+                resp = await client.send(client.build_request(method, url, **kwargs), stream=True)
+            else:
+                resp = await client.request(method, url, **kwargs)
+        except (httpx.ReadError, httpx.RemoteProtocolError):
+            if attempt >= retries:
+                raise
+        else:
+            if resp.status_code not in RETRY_STATUSES or attempt >= retries:
+                return resp
+            await resp.aclose()
+        await asyncio.sleep(HTTP_RETRY_BACKOFF * (2 ** attempt))
+        attempt += 1
+
+
+def close_session() -> None:
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+async def close_async_client() -> None:
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
@@ -0,0 +1,197 @@
+"""
+In-process metrics registry rendered in the Prometheus text format (GET /metrics).
+Counters, gauges and histograms with fixed label names; updating one is a dict
+lookup under a short lock. Each process keeps its own registry, so with several
+uvicorn workers every scrape sees one worker.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import httpx
+import requests
+
+# Seconds; spans a cached SQLite read up to a slow Backboard call
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry: list["_Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(labels[n] for n in self.labelnames)
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+        return header + "".join(line + "\n" for line in self._samples())
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    @contextmanager
+    def track(self, **labels):
+        """Count the block as in progress while it runs."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (last is +Inf), sum, count]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the block's wall time (also fine around awaits)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1], v[2])) for k, v in self._values.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                cumulative += n
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+def render() -> str:
+    """All registered metrics in the Prometheus text exposition format."""
+    return "".join(m.render() for m in _registry)
+
+
+# --- Application metrics ---
+
+STAGE_SECONDS = Histogram(
+    "realorrender_stage_seconds",
+    "Time spent per pipeline stage (fetch, readability, gemini, backboard, scoring, db).",
+    ("stage",),
+)
+CACHE_LOOKUPS = Counter(
+    "realorrender_cache_lookups_total",
+    "Claim and article cache lookups by result.",
+    ("cache", "result"),
+)
+UPSTREAM_ERRORS = Counter(
+    "realorrender_upstream_errors_total",
+    "Failed upstream calls by upstream and kind (error, timeout, circuit_open, deadline).",
+    ("upstream", "kind"),
+)
+VERIFICATIONS = Counter(
+    "realorrender_verifications_total",
+    "Finished pipeline runs by outcome (complete, partial, no_article, error).",
+    ("outcome",),
+)
+VERIFICATIONS_IN_FLIGHT = Gauge(
+    "realorrender_verifications_in_flight",
+    "Pipeline runs currently in progress.",
+)
+
+_TIMEOUT_ERRORS = (requests.Timeout, httpx.TimeoutException, asyncio.TimeoutError, TimeoutError)
+
+
+def upstream_error(upstream: str, exc: Optional[BaseException] = None, kind: Optional[str] = None):
+    """Count a failed upstream call; the kind is derived from the exception if not given."""
+    if kind is None:
+        kind = "timeout" if isinstance(exc, _TIMEOUT_ERRORS) else "error"
+    UPSTREAM_ERRORS.inc(upstream=upstream, kind=kind)
+
+
+def cache_lookup(cache: str, hit: bool):
+    CACHE_LOOKUPS.inc(cache=cache, result="hit" if hit else "miss")
@@ -0,0 +1,126 @@
+"""
+Near-duplicate claim fingerprints: similarity normalization, MinHash signatures
+and LSH band buckets. Pure functions; storage lives in app.db.
+"""
+
+import hashlib
+import re
+import struct
+
+# 8 bands x 4 rows: a pair with Jaccard 0.8 shares a bucket with p ~= 0.985
+LSH_BANDS = 8
+LSH_ROWS = 4
+NUM_PERM = LSH_BANDS * LSH_ROWS
+MIN_TOKENS = 4  # shorter claims are too coarse for set similarity
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _permutations(n: int) -> list[tuple[int, int]]:
+    # Deterministic (a, b) pairs so signatures are stable across processes
+    perms = []
+    for i in range(n):
+        digest = hashlib.blake2b(f"minhash-perm-{i}".encode(), digest_size=16).digest()
+        a, b = struct.unpack("<QQ", digest)
+        perms.append((a % (_MERSENNE_PRIME - 1) + 1, b % _MERSENNE_PRIME))
+    return perms
+
+
+_PERMS = _permutations(NUM_PERM)
+
+_ATTRIBUTION_PREFIX_RE = re.compile(
+    r"^(?:according to|as reported by|as per|per|reports say|officials say)\b[^,]{0,80},\s*"
+)
+_ATTRIBUTION_SUFFIX_RE = re.compile(r",?\s*(?:according to|as reported by|per)\s+[^,.;]{1,80}[.!]?$")
+_THOUSANDS_RE = re.compile(r"(?<=\d),(?=\d{3}\b)")
+_SCALED_NUMBER_RE = re.compile(r"\b(\d+(?:\.\d+)?)\s*(thousand|million|billion|trillion|bn)\b")
+# "k" / "m" only as money shorthand ("$5m", "£3k"); elsewhere they are units (300 m, 5k run)
+_SCALED_AMOUNT_RE = re.compile(r"(?<=[$£€¥])(\d+(?:\.\d+)?)(k|m|bn)\b")
+_PUNCT_RE = re.compile(r"[^\w\s.]")  # keep "." for decimals; stripped from token ends below
+_SCALES = {
+    "thousand": 10**3, "k": 10**3,
+    "million": 10**6, "m": 10**6,
+    "billion": 10**9, "bn": 10**9,
+    "trillion": 10**12,
+}
+_STOPWORDS = frozenset(
+    "a an the of to in on at and or is are was were be been by with that this it its as from has have had".split()
+)
+_NEGATED_CONTRACTION_RE = re.compile(r"n['’]t\b")  # "didn't" -> "did not"
+
+# Words that flip or pin a claim's meaning; near-duplicates must agree on these exactly
+POLARITY_WORDS = frozenset(
+    "not no never without none nor neither nobody nothing against for pro anti "
+    "approved approve approves rejected reject rejects passed pass passes failed fail fails "
+    "won win wins lost lose loses increased increase increases decreased decrease decreases "
+    "rose rise rises fell fall falls raised raise raises cut cuts higher lower more less "
+    "above below before after up down true false".split()
+)
+_MONTHS = frozenset(
+    "january february march april may june july august september october november december "
+    "jan feb mar apr jun jul aug sep sept oct nov dec".split()
+)
+
+
+def _expand_number(match: re.Match) -> str:
+    value = float(match.group(1)) * _SCALES[match.group(2)]
+    return str(int(value)) if value.is_integer() else str(value)
+
+
+def similarity_tokens(text: str) -> frozenset[str]:
+    """
+    Token set used for near-duplicate matching. Drops attribution ("According to X, ..."),
+    punctuation, word order and stopwords; "5 million", "$5m" and "5,000,000" all become "5000000".
+    """
+    if not text or not isinstance(text, str):
+        return frozenset()
+    t = text.lower().strip()
+    t = _ATTRIBUTION_PREFIX_RE.sub("", t)
+    t = _ATTRIBUTION_SUFFIX_RE.sub("", t)
+    t = _NEGATED_CONTRACTION_RE.sub(" not", t)
+    t = _THOUSANDS_RE.sub("", t)
+    t = _SCALED_NUMBER_RE.sub(_expand_number, t)
+    t = _SCALED_AMOUNT_RE.sub(_expand_number, t)
+    t = t.replace("%", " percent ")
+    t = _PUNCT_RE.sub(" ", t)
+    tokens = (tok.strip(".") for tok in t.split())
+    return frozenset(tok for tok in tokens if tok and tok not in _STOPWORDS)
+
+
+def anchor_tokens(tokens: frozenset[str]) -> frozenset[str]:
+    """Numbers, dates and polarity words: tokens two claims must share to count as near-duplicates."""
+    return frozenset(
+        t for t in tokens if t in POLARITY_WORDS or t in _MONTHS or any(c.isdigit() for c in t)
+    )
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def signature(tokens: frozenset[str]) -> list[int]:
+    """MinHash signature (NUM_PERM values) of a token set."""
+    hashes = [_token_hash(t) for t in tokens]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERM
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMS
+    ]
+
+
+def lsh_buckets(sig: list[int]) -> list[int]:
+    """One signed 64-bit bucket id per band (fits a SQLite INTEGER)."""
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = sig[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(struct.pack(f"<I{LSH_ROWS}I", band, *rows), digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, "little", signed=True))
+    return buckets
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
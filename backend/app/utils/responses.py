@@ -0,0 +1,32 @@
+"""
+Response helpers that skip FastAPI's response_model validation and
+jsonable_encoder pass: pydantic models are serialized once by pydantic-core,
+stored JSON is sent as-is, and other payloads use orjson when installed.
+"""
+
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+# Optional: orjson encodes dicts/lists several times faster than json
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:
+    FastJSONResponse = JSONResponse
+
+
+def json_bytes_response(content: bytes, status_code: int = 200, headers: Optional[dict] = None) -> Response:
+    """Send already-serialized JSON (e.g. a stored report) without parsing it."""
+    return Response(content=content, status_code=status_code, headers=headers, media_type="application/json")
+
+
+def model_response(model: BaseModel, status_code: int = 200, headers: Optional[dict] = None) -> Response:
+    """Serialize a pydantic model directly (model_dump_json), bypassing response_model re-validation."""
+    return json_bytes_response(model.model_dump_json().encode("utf-8"), status_code, headers)
+
+
+def fast_json_response(content: Any, status_code: int = 200, headers: Optional[dict] = None) -> Response:
+    """Plain dict/list payload through orjson (or json if orjson is missing)."""
+    return FastJSONResponse(content=content, status_code=status_code, headers=headers)
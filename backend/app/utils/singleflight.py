@@ -0,0 +1,107 @@
+"""
+In-flight request coalescing: concurrent calls with the same key share one
+upstream computation instead of each starting their own.
+
+do() runs fn for the first caller. acquire()/finish() are the manual form, for a
+leader that resolves several keys at once (e.g. one batched call) or decides
+what followers get. With a deadline, a caller only joins a flight whose own
+deadline is no earlier, so it never waits under a shorter budget than its own;
+otherwise it leads a new flight for the key.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from app.utils.deadline import Deadline
+
+
+def _covers(flight: Optional[Deadline], caller: Optional[Deadline]) -> bool:
+    """True if a flight bounded by `flight` finishes no earlier than `caller` needs."""
+    if flight is None:
+        return True
+    return caller is not None and flight.expires_at >= caller.expires_at
+
+
+class SingleFlight:
+    """Thread-based single-flight. The first caller runs fn; duplicates wait for its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, tuple[Future, Optional[Deadline]]] = {}
+
+    def acquire(self, key: Hashable, deadline: Optional[Deadline] = None) -> tuple[Future, bool]:
+        """
+        (future, leader). Followers wait on the future; a leader must call
+        finish(key, future, ...) exactly once, whatever happens.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and _covers(call[1], deadline):
+                return call[0], False
+            fut = Future()
+            self._calls[key] = (fut, deadline)
+            return fut, True
+
+    def finish(self, key: Hashable, fut: Future, result: Any = None, exc: Optional[BaseException] = None) -> None:
+        with self._lock:
+            if self._calls.get(key, (None,))[0] is fut:
+                del self._calls[key]
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        fut, leader = self.acquire(key)
+        if not leader:
+            return fut.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self.finish(key, fut, exc=e)
+            raise
+        self.finish(key, fut, result)
+        return result
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """asyncio single-flight. The shared task survives cancellation of any one waiter."""
+
+    def __init__(self):
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self._manual: dict[Hashable, tuple[asyncio.Future, Optional[Deadline]]] = {}
+
+    def acquire(self, key: Hashable, deadline: Optional[Deadline] = None) -> tuple[asyncio.Future, bool]:
+        """Manual flight, as SingleFlight.acquire; followers await asyncio.shield(future)."""
+        flight = self._manual.get(key)
+        if flight is not None and _covers(flight[1], deadline):
+            return flight[0], False
+        fut = asyncio.get_running_loop().create_future()
+        self._manual[key] = (fut, deadline)
+        return fut, True
+
+    def finish(self, key: Hashable, fut: asyncio.Future, result: Any = None) -> None:
+        if self._manual.get(key, (None,))[0] is fut:
+            del self._manual[key]
+        if not fut.done():
+            fut.set_result(result)
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    def in_flight(self) -> int:
+        return len(self._tasks) + len(self._manual)
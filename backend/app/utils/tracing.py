@@ -0,0 +1,161 @@
+"""
+Per-request stage timing and opt-in profiling.
+
+Each HTTP request (and each queued job) gets a Trace in a contextvar; span()
+blocks add to it, and the totals go out as a Server-Timing header. Outside a
+trace, span() is a no-op.
+
+Profiling: 1 in PROFILE_SAMPLE_RATE traces (or requests sending X-Profile: 1
+when PROFILE_HEADER is on) run the hot paths wrapped in profiled() under
+cProfile, dumping one .prof file per path to PROFILE_DIR. cProfile sees the
+calling thread only, so on the event loop a profile also includes other
+requests' coroutines running at the same time.
+"""
+
+import contextvars
+import cProfile
+import itertools
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional
+
+from app.db import DB_PATH
+
+SERVER_TIMING = os.getenv("SERVER_TIMING", "true").lower() not in ("0", "false", "no")
+# Store stage timings (ms) in the report JSON as "timings"
+TRACE_IN_REPORT = os.getenv("TRACE_IN_REPORT", "false").lower() in ("1", "true", "yes")
+PROFILE_SAMPLE_RATE = int(os.getenv("PROFILE_SAMPLE_RATE", "0"))  # profile 1 in N traces, 0 disables
+PROFILE_HEADER = os.getenv("PROFILE_HEADER", "false").lower() in ("1", "true", "yes")  # honor X-Profile: 1
+PROFILE_DIR = Path(os.getenv("PROFILE_DIR", str(Path(DB_PATH).parent / "profiles")))
+
+_current: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("trace", default=None)
+_sample_counter = itertools.count(1)
+_profiling = threading.local()  # cProfile cannot nest within a thread
+
+
+class Trace:
+    def __init__(self, profile: bool = False):
+        self.id = uuid.uuid4().hex[:12]
+        self.profile = profile
+        self.started = time.perf_counter()
+        self.spans: list[tuple[str, float]] = []  # (name, seconds), in completion order
+
+    def add(self, name: str, seconds: float):
+        self.spans.append((name, seconds))
+
+    def timings(self) -> dict[str, float]:
+        """Milliseconds per span name (repeated spans are summed), in first-seen order."""
+        totals: dict[str, float] = {}
+        for name, seconds in list(self.spans):
+            totals[name] = totals.get(name, 0.0) + seconds
+        return {name: round(seconds * 1000, 1) for name, seconds in totals.items()}
+
+    def server_timing(self) -> str:
+        parts = [f"{name};dur={ms}" for name, ms in self.timings().items()]
+        parts.append(f"total;dur={round((time.perf_counter() - self.started) * 1000, 1)}")
+        return ", ".join(parts)
+
+
+def current() -> Optional[Trace]:
+    return _current.get()
+
+
+def _should_profile(force: bool) -> bool:
+    if force:
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and next(_sample_counter) % PROFILE_SAMPLE_RATE == 0
+
+
+@contextmanager
+def traced(force_profile: bool = False):
+    """Run the block under a new Trace (sampled for profiling per PROFILE_SAMPLE_RATE)."""
+    trace = Trace(profile=_should_profile(force_profile))
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def span(name: str):
+    """Time the block into the current trace, if any."""
+    trace = _current.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, time.perf_counter() - start)
+
+
+def timings() -> Optional[dict[str, float]]:
+    """Current trace's timings for storing in a report (TRACE_IN_REPORT), else None."""
+    trace = _current.get()
+    return trace.timings() if TRACE_IN_REPORT and trace is not None else None
+
+
+# --- Profiling ---
+
+def profile_path(name: str) -> Optional[str]:
+    """Where to dump a profile of `name` for the current trace, or None if it is not sampled."""
+    trace = _current.get()
+    if trace is None or not trace.profile:
+        return None
+    return str(PROFILE_DIR / f"{time.strftime('%Y%m%dT%H%M%S')}-{trace.id}-{name}.prof")
+
+
+def run_profiled(path: Optional[str], fn: Callable, *args):
+    """Call fn(*args) under cProfile and dump the stats to path (plain call if path is None)."""
+    if path is None or getattr(_profiling, "active", False):
+        return fn(*args)
+    profiler = cProfile.Profile()
+    _profiling.active = True
+    try:
+        return profiler.runcall(fn, *args)
+    finally:
+        _profiling.active = False
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(path)
+        except OSError as e:
+            print(f"Could not write profile {path}: {e}")
+
+
+def profiled(name: str, fn: Callable, *args):
+    """fn(*args), profiled to PROFILE_DIR when the current trace is sampled."""
+    return run_profiled(profile_path(name), fn, *args)
+
+
+# --- ASGI middleware ---
+
+class TraceMiddleware:
+    """
+    Opens a Trace per HTTP request and adds its spans as a Server-Timing header.
+    Streamed responses send headers first, so they carry only the spans done by then.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        force = PROFILE_HEADER and (b"x-profile", b"1") in scope.get("headers", [])
+
+        with traced(force_profile=force) as trace:
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start" and SERVER_TIMING and trace.spans:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
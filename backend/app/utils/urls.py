@@ -0,0 +1,55 @@
+"""
+URL canonicalization for article-level cache keys.
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query params that only track the click, never change the article
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "twclid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "ref", "ref_src", "ref_url", "cmpid", "smid",
+})
+TRACKING_PREFIXES = ("utm_",)
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonical_url(url: str) -> str:
+    """
+    Canonical form of an article URL: lowercase scheme/host, no "www.",
+    no default port, no fragment, no tracking params, sorted query,
+    no trailing slash. Returns "" for non-http(s) input.
+    """
+    if not url or not isinstance(url, str):
+        return ""
+    try:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            return ""
+        host = (parts.hostname or "").lower()
+        if host.startswith("www."):
+            host = host[4:]
+        if not host:
+            return ""
+        port = parts.port
+    except ValueError:
+        return ""
+
+    netloc = host
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        netloc = f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(k)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
@@ -0,0 +1,219 @@
+"""
+Warm claim_memory so a new node does not pay for its first Backboard calls.
+
+    python -m app.warmup load corpus.jsonl [--confidence 0.9] [--batch 10000]
+    python -m app.warmup export snapshot.jsonl.gz
+    python -m app.warmup import snapshot.jsonl.gz
+
+load: one fact-check per line, e.g.
+    {"claim": "...", "verdict": "false", "source": "PolitiFact", "url": "https://...", "note": "..."}
+  verdict takes SUPPORTED / CONTRADICTED / INSUFFICIENT or common ratings
+  (true, false, unproven, ...); "evidence" may replace source/url/note with a list
+  of {"source", "url", "stance", "note"}. Entries are stamped with the load time.
+
+export / import: gzip JSONL snapshot of claim_memory with its near-duplicate
+index, keeping created_at; on import a row only replaces an older local one.
+"""
+
+import argparse
+import datetime
+import gzip
+import json
+import sys
+import time
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from app.db import init_db, iter_claim_memory
+from app.services.claim_memory import bulk_put_claims
+from app.utils.hashing import claim_hash, normalize_claim_text
+from app.utils.minhash import LSH_BANDS, LSH_ROWS
+
+SNAPSHOT_FORMAT = "realorrender-claim-memory"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_COLUMNS = ("claim_hash", "verdict", "confidence", "evidence_json", "created_at", "tokens", "buckets")
+SNAPSHOT_REQUIRED = ("claim_hash", "verdict", "confidence", "evidence_json", "created_at")
+
+_VERDICT_ALIASES = {
+    "SUPPORTED": "SUPPORTED", "TRUE": "SUPPORTED", "CORRECT": "SUPPORTED", "ACCURATE": "SUPPORTED",
+    "CONTRADICTED": "CONTRADICTED", "FALSE": "CONTRADICTED", "INCORRECT": "CONTRADICTED",
+    "FAKE": "CONTRADICTED", "PANTS ON FIRE": "CONTRADICTED",
+    "INSUFFICIENT": "INSUFFICIENT", "UNPROVEN": "INSUFFICIENT", "UNVERIFIED": "INSUFFICIENT",
+    "MIXED": "INSUFFICIENT", "MIXTURE": "INSUFFICIENT",
+}
+_STANCE = {"SUPPORTED": "supports", "CONTRADICTED": "contradicts", "INSUFFICIENT": "neutral"}
+
+
+def _batches(items: Iterable, size: int) -> Iterator[list]:
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _evidence(record: dict, verdict: str) -> list[dict]:
+    raw = record.get("evidence")
+    if not isinstance(raw, list):
+        raw = [record] if record.get("source") or record.get("url") else []
+    evidence = []
+    for e in raw[:5]:
+        if not isinstance(e, dict):
+            continue
+        stance = str(e.get("stance") or _STANCE[verdict]).lower()
+        evidence.append({
+            "source": str(e.get("source") or "Unknown")[:200],
+            "url": str(e.get("url") or "")[:500],
+            "stance": stance if stance in ("supports", "contradicts", "neutral") else "neutral",
+            "note": str(e.get("note") or "")[:500],
+        })
+    return evidence
+
+
+def _corpus_entry(record: dict, confidence: float, created_at: str) -> Optional[dict]:
+    """claim_memory entry for one corpus record, or None if it has no usable claim or verdict."""
+    text = record.get("claim") or record.get("text")
+    verdict = _VERDICT_ALIASES.get(str(record.get("verdict") or "").strip().upper())
+    if not isinstance(text, str) or not normalize_claim_text(text) or verdict is None:
+        return None
+    try:
+        conf = max(0.0, min(1.0, float(record.get("confidence", confidence))))
+    except (TypeError, ValueError):
+        conf = confidence
+    return {
+        "claim_hash": claim_hash(text),
+        "verdict": verdict,
+        "confidence": conf,
+        "evidence_json": json.dumps(_evidence(record, verdict)),
+        "created_at": created_at,
+        "claim_text": text,
+    }
+
+
+def _read_corpus(path: str, confidence: float, stats: dict) -> Iterator[dict]:
+    created_at = datetime.datetime.utcnow().isoformat()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            entry = _corpus_entry(record, confidence, created_at) if isinstance(record, dict) else None
+            if entry is None:
+                stats["invalid"] += 1
+                continue
+            yield entry
+
+
+def _snapshot_entry(columns: list, values) -> Optional[dict]:
+    """claim_memory entry for one snapshot row, or None if it is malformed."""
+    if not isinstance(values, list) or len(values) != len(columns):
+        return None
+    entry = dict(zip(columns, values))
+    if any(entry.get(key) is None for key in SNAPSHOT_REQUIRED):
+        return None
+    if (
+        not isinstance(entry["claim_hash"], str)
+        or entry["verdict"] not in _STANCE
+        or not isinstance(entry["confidence"], (int, float))
+        or not isinstance(entry["evidence_json"], str)
+        or not isinstance(entry["created_at"], str)
+    ):
+        return None
+    if not isinstance(entry.get("tokens"), str):
+        entry["tokens"] = None
+    buckets = entry.get("buckets")
+    if not isinstance(buckets, list) or not all(isinstance(b, int) for b in buckets):
+        entry["buckets"] = None
+    return entry
+
+
+def _read_snapshot(path: str, stats: dict) -> Iterator[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        columns = header.get("columns")
+        if (
+            header.get("format") != SNAPSHOT_FORMAT
+            or header.get("version") != SNAPSHOT_VERSION
+            or not isinstance(columns, list)
+        ):
+            raise ValueError(f"{path} is not a v{SNAPSHOT_VERSION} claim memory snapshot")
+        # Buckets depend on the LSH layout; recompute them from tokens if it changed
+        same_lsh = header.get("lsh") == [LSH_BANDS, LSH_ROWS]
+        for line in f:
+            try:
+                entry = _snapshot_entry(columns, json.loads(line))
+            except json.JSONDecodeError:
+                entry = None
+            if entry is None:
+                stats["invalid"] += 1
+                continue
+            if not same_lsh:
+                entry["buckets"] = None
+            yield entry
+
+
+def _load(entries: Iterable[dict], batch_size: int, stats: dict):
+    for batch in _batches(entries, batch_size):
+        written, expired = bulk_put_claims(batch)
+        stats["read"] += len(batch)
+        stats["written"] += written
+        stats["expired"] += expired
+        print(f"  {stats['read']} read, {stats['written']} written", file=sys.stderr)
+
+
+def export_snapshot(path: str, batch_size: int) -> int:
+    """Write claim_memory to a gzip JSONL snapshot. Returns rows written."""
+    count = 0
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as f:
+        header = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "exported_at": datetime.datetime.utcnow().isoformat(),
+            "lsh": [LSH_BANDS, LSH_ROWS],
+            "columns": SNAPSHOT_COLUMNS,
+        }
+        f.write(json.dumps(header) + "\n")
+        for rows in iter_claim_memory(batch_size):
+            for r in rows:
+                buckets = [int(b) for b in r["buckets"].split(",")] if r["buckets"] else None
+                values = (r["claim_hash"], r["verdict"], r["confidence"], r["evidence_json"], r["created_at"], r["tokens"], buckets)
+                f.write(json.dumps(values, separators=(",", ":")) + "\n")
+            count += len(rows)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="RealOrRender claim memory warm-up", formatter_class=argparse.RawDescriptionHelpFormatter, epilog=__doc__
+    )
+    parser.add_argument("--batch", type=int, default=10000, help="rows per transaction (default 10000)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    load = commands.add_parser("load", help="bulk-load a JSONL fact-check corpus")
+    load.add_argument("path")
+    load.add_argument("--confidence", type=float, default=0.9, help="confidence for records without one (default 0.9)")
+    commands.add_parser("export", help="write a claim memory snapshot").add_argument("path")
+    commands.add_parser("import", help="import a claim memory snapshot").add_argument("path")
+    args = parser.parse_args()
+
+    init_db()
+    started = time.perf_counter()
+    if args.command == "export":
+        count = export_snapshot(args.path, args.batch)
+        print(f"Exported {count} claims to {args.path} in {time.perf_counter() - started:.1f}s")
+        return
+
+    stats = {"read": 0, "written": 0, "expired": 0, "invalid": 0}
+    if args.command == "load":
+        entries = _read_corpus(args.path, args.confidence, stats)
+    else:
+        entries = _read_snapshot(args.path, stats)
+    _load(entries, max(1, args.batch), stats)
+    print(
+        f"{args.command.capitalize()}ed {stats['read']} claims from {args.path} in {time.perf_counter() - started:.1f}s: "
+        f"{stats['written']} written, {stats['expired']} expired, {stats['invalid']} invalid"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Standalone verification job worker, scaled separately from the web workers.
+
+    python -m app.worker [--workers N]
+"""
+
+import argparse
+import signal
+import threading
+
+from app.db import init_db
+from app.services import claim_memory, maintenance
+from app.services.extract import close_parse_pool
+from app.services.jobs import JOB_WORKERS, start_workers, stop_workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RealOrRender verification job worker")
+    parser.add_argument("--workers", type=int, default=JOB_WORKERS, help="worker threads (default: JOB_WORKERS)")
+    args = parser.parse_args()
+
+    init_db()
+    claim_memory.start_sweeper()
+    maintenance.start_maintenance()
+    start_workers(args.workers)
+    print(f"Verification worker running with {args.workers} thread(s)")
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    stop.wait()
+
+    print("Stopping verification worker...")
+    stop_workers()
+    claim_memory.stop_sweeper()
+    maintenance.stop_maintenance()
+    close_parse_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Micro-benchmark: article text extraction over a corpus of saved HTML pages.
+
+Compares the previous path (readability summary() HTML, tag-strip regex,
+whitespace regex) with _parse_html (text serialized straight from the
+readability tree). Reports end-to-end parse time, the HTML-to-text step alone,
+and how many pages summary() re-parsed leniently (should match; include short
+articles in the corpus, since they are the pages near readability's retry_length).
+
+    python -m bench.extract_text PAGES_DIR_OR_FILES... [--repeat N]
+"""
+
+import argparse
+import copy
+import re
+import statistics
+import time
+from pathlib import Path
+
+from lxml import etree
+from readability import Document
+
+from app.services.extract import _TextDocument, _clean_text, _parse_html, _truncate, html_to_text
+
+_ENTITY_RE = re.compile(r"&(?:[a-zA-Z]+|#\d+|#x[0-9a-fA-F]+);")
+
+
+def _baseline_parse(html: str) -> str:
+    """Text extraction as done before html_to_text (kept for comparison)."""
+    doc = Document(html)
+    doc.title()
+    text = re.sub(r"<[^>]+>", " ", doc.summary())
+    return _clean_text(_truncate(re.sub(r"\s+", " ", text)))
+
+
+def _baseline_to_text(tree) -> str:
+    # What Document.get_clean_html + the tag strip did with the article tree
+    from readability.cleaners import clean_attributes
+    html = clean_attributes(etree.tounicode(tree, method="html"))
+    return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", html)).strip()
+
+
+class _CaptureDocument(Document):
+    def get_clean_html(self):
+        self.article_tree = copy.deepcopy(self.html)
+        return super().get_clean_html()
+
+
+def _lenient_reparses(cls, htmls: list[str]) -> int:
+    """Pages where summary() cleaned an article twice (ruthless pass too short, then lenient)."""
+    count = 0
+    for html in htmls:
+        calls = []
+
+        class Counting(cls):
+            def get_clean_html(self):
+                calls.append(1)
+                return super().get_clean_html()
+
+        Counting(html).summary()
+        count += len(calls) > 1
+    return count
+
+
+def _load(paths: list[str]) -> list[tuple[str, str]]:
+    pages = []
+    for p in map(Path, paths):
+        files = sorted(p.rglob("*.htm*")) if p.is_dir() else [p]
+        for f in files:
+            pages.append((f.name, f.read_text(encoding="utf-8", errors="replace")))
+    return pages
+
+
+def _time_ms(fn, items, repeat: int) -> list[float]:
+    """Best-of-repeat milliseconds per item."""
+    best = []
+    for item in items:
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(item)
+            runs.append((time.perf_counter() - start) * 1000)
+        best.append(min(runs))
+    return best
+
+
+def _report(name: str, old: list[float], new: list[float]):
+    print(
+        f"{name:<14} baseline {sum(old):9.1f} ms  new {sum(new):9.1f} ms  "
+        f"speedup x{sum(old) / max(sum(new), 1e-9):.2f}  "
+        f"(median page {statistics.median(old):.2f} -> {statistics.median(new):.2f} ms)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="HTML files or directories of saved pages")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per page, best is kept (default 5)")
+    args = parser.parse_args()
+
+    pages = _load(args.paths)
+    if not pages:
+        parser.error("no .html files found")
+    htmls = [html for _, html in pages]
+    print(f"{len(pages)} pages, {sum(len(h) for h in htmls) / 1e6:.1f} MB of HTML, best of {args.repeat}")
+
+    old = _time_ms(_baseline_parse, htmls, args.repeat)
+    new = _time_ms(lambda h: _parse_html("https://example.com/", h), htmls, args.repeat)
+    _report("end-to-end", old, new)
+
+    trees = []
+    for html in htmls:
+        doc = _CaptureDocument(html)
+        doc.summary()
+        trees.append(doc.article_tree)
+    old = _time_ms(_baseline_to_text, trees, args.repeat)
+    # html_to_text mutates its input, so each run gets a fresh copy (copy time excluded)
+    new = []
+    for tree in trees:
+        runs = []
+        for _ in range(args.repeat):
+            t = copy.deepcopy(tree)
+            start = time.perf_counter()
+            _clean_text(html_to_text(t))
+            runs.append((time.perf_counter() - start) * 1000)
+        new.append(min(runs))
+    _report("html-to-text", old, new)
+
+    old_leftover = sum(1 for h in htmls if _ENTITY_RE.search(_baseline_parse(h)))
+    new_articles = [_parse_html("https://example.com/", h) for h in htmls]
+    new_leftover = sum(1 for a in new_articles if a and _ENTITY_RE.search(a.text))
+    print(f"pages with undecoded entities: baseline {old_leftover}, new {new_leftover}")
+    print(f"lenient re-parses: baseline {_lenient_reparses(Document, htmls)}, new {_lenient_reparses(_TextDocument, htmls)}")
+
+
+if __name__ == "__main__":
+    main()
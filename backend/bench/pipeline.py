@@ -0,0 +1,240 @@
+"""
+End-to-end API benchmark against local stand-ins (no network, no API keys).
+
+Starts a Backboard stub and an article fixture server in this process, runs the
+API (bench.serve, fake Gemini) in a subprocess on a fresh SQLite database, then
+drives each endpoint at fixed concurrency:
+
+  verify   POST /api/verifyArticle   (fixture URLs, cycling over --articles pages)
+  reports  GET  /api/reports/{id}    (ids from the verify phase)
+  posts    GET  /api/posts           (after creating up to --posts posts)
+
+Prints JSON with p50/p95/p99/mean latency (ms), throughput and error counts per
+phase, plus peak RSS of the server and harness, for comparing commits:
+
+    python -m bench.pipeline --requests 300 --concurrency 16 --out before.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from bench.stubs import BackboardStub, FixtureServer, StubConfig
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(sorted_values: list[float], p: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return round(sorted_values[rank - 1], 2)
+
+
+def _peak_rss_kb(pid: int) -> Optional[int]:
+    """VmHWM of a live process (Linux /proc), None elsewhere."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _self_peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # bytes on macOS, KiB on Linux
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=5
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+async def _run_phase(client: httpx.AsyncClient, send, total: int, concurrency: int) -> tuple[dict, list]:
+    """Run send(client, i) for i in range(total) with `concurrency` in flight. Returns (summary, responses)."""
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    responses: list = [None] * total
+    indexes = iter(range(total))
+
+    async def _worker():
+        for i in indexes:
+            start = time.perf_counter()
+            try:
+                resp = await send(client, i)
+                statuses[resp.status_code] += 1
+                responses[i] = resp
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(max(1, concurrency))))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(n for status, n in statuses.items() if not (isinstance(status, int) and status < 400))
+    return {
+        "requests": total,
+        "errors": errors,
+        "statuses": {str(k): v for k, v in sorted(statuses.items(), key=str)},
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else None,
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "p99_ms": _percentile(latencies, 99),
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else None,
+    }, responses
+
+
+async def _wait_ready(base_url: str, server: subprocess.Popen, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited with {server.returncode}")
+            try:
+                if (await client.get(f"{base_url}/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+async def _drive(args, base_url: str, fixtures: FixtureServer) -> dict:
+    phases = {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        def verify(c, i):
+            body = {"url": fixtures.article_url(i % args.articles), "force_refresh": args.force_refresh}
+            return c.post("/api/verifyArticle", json=body)
+
+        phases["verify"], responses = await _run_phase(client, verify, args.requests, args.concurrency)
+        reports = [r.json() for r in responses if r is not None and r.status_code == 200]
+        ids = list(dict.fromkeys(r["verification_id"] for r in reports))
+        if not ids:
+            raise RuntimeError("no verification succeeded; nothing to read back")
+
+        phases["reports"], _ = await _run_phase(
+            client, lambda c, i: c.get(f"/api/reports/{ids[i % len(ids)]}"), args.requests, args.concurrency
+        )
+
+        # Setup, not timed: fill the feed
+        postable = [r for r in reports if r["decision"] in ("ALLOW", "WARN")]
+        for r in postable[: args.posts]:
+            mode = "normal" if r["decision"] == "ALLOW" else "warning_label"
+            await client.post("/api/posts", json={"verification_id": r["verification_id"], "post_mode": mode})
+
+        phases["posts"], _ = await _run_phase(
+            client, lambda c, i: c.get("/api/posts", params={"limit": 50}), args.requests, args.concurrency
+        )
+    return phases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="requests per phase (default 200)")
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight (default 16)")
+    parser.add_argument("--articles", type=int, default=50, help="distinct fixture pages (default 50)")
+    parser.add_argument("--posts", type=int, default=50, help="posts created before the posts phase (default 50)")
+    parser.add_argument("--force-refresh", action="store_true", help="bypass the article cache on every verify")
+    parser.add_argument("--timeout", type=float, default=120.0, help="client timeout per request (s)")
+    parser.add_argument("--out", help="also write the JSON result to this file")
+    for name, latency, payload in (("backboard", 0.2, 0), ("gemini", 0.5, 0), ("fixture", 0.05, 20000)):
+        parser.add_argument(f"--{name}-latency", type=float, default=latency, help=f"seconds (default {latency})")
+        parser.add_argument(f"--{name}-jitter", type=float, default=0.0)
+        parser.add_argument(f"--{name}-error-rate", type=float, default=0.0)
+        parser.add_argument(f"--{name}-payload", type=int, default=payload, help=f"bytes (default {payload})")
+    parser.add_argument("--gemini-claims", type=int, default=5, help="claims per fake analysis (default 5)")
+    args = parser.parse_args()
+
+    def stub_config(name: str) -> StubConfig:
+        return StubConfig(
+            getattr(args, f"{name}_latency"),
+            getattr(args, f"{name}_jitter"),
+            getattr(args, f"{name}_error_rate"),
+            getattr(args, f"{name}_payload"),
+        )
+
+    backboard = BackboardStub(stub_config("backboard")).start()
+    fixtures = FixtureServer(stub_config("fixture")).start()
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+
+    with tempfile.TemporaryDirectory(prefix="realorrender-bench-") as tmp:
+        env = {
+            **os.environ,
+            "SQLITE_DB_PATH": str(Path(tmp) / "bench.db"),
+            "BACKBOARD_API_KEY": "bench",
+            "BACKBOARD_BASE_URL": backboard.url,
+        }
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "bench.serve", "--port", str(port),
+                "--gemini-latency", str(args.gemini_latency),
+                "--gemini-jitter", str(args.gemini_jitter),
+                "--gemini-error-rate", str(args.gemini_error_rate),
+                "--gemini-payload", str(args.gemini_payload),
+                "--gemini-claims", str(args.gemini_claims),
+            ],
+            cwd=BACKEND_DIR,
+            env=env,
+            stdout=sys.stderr,  # keep this process's stdout pure JSON
+        )
+        try:
+            asyncio.run(_wait_ready(base_url, server))
+            phases = asyncio.run(_drive(args, base_url, fixtures))
+            server_rss = _peak_rss_kb(server.pid)
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                server.kill()
+            backboard.stop()
+            fixtures.stop()
+
+    result = {
+        "commit": _git_commit(),
+        "config": {k: v for k, v in vars(args).items() if k != "out"},
+        "phases": phases,
+        "upstream_requests": {"backboard": backboard.requests, "fixture": fixtures.requests},
+        "server_peak_rss_kb": server_rss,
+        "harness_peak_rss_kb": _self_peak_rss_kb(),
+    }
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.out:
+        Path(args.out).write_text(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
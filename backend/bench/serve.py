@@ -0,0 +1,36 @@
+"""
+Run the API under uvicorn with the fake Gemini model installed (see bench.stubs).
+Started as a subprocess by bench.pipeline; the rest of the configuration
+(SQLITE_DB_PATH, BACKBOARD_BASE_URL, ...) comes from the environment.
+
+    python -m bench.serve --port 8765 [--gemini-latency S] [--gemini-error-rate R] ...
+"""
+
+import argparse
+
+import uvicorn
+
+from bench.stubs import StubConfig, install_fake_gemini
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--gemini-latency", type=float, default=0.0)
+    parser.add_argument("--gemini-jitter", type=float, default=0.0)
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0)
+    parser.add_argument("--gemini-payload", type=int, default=0)
+    parser.add_argument("--gemini-claims", type=int, default=5)
+    args = parser.parse_args()
+
+    from app.main import app
+
+    install_fake_gemini(
+        StubConfig(args.gemini_latency, args.gemini_jitter, args.gemini_error_rate, args.gemini_payload),
+        claims=args.gemini_claims,
+    )
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
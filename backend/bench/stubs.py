@@ -0,0 +1,223 @@
+"""
+Local stand-ins for the pipeline's upstreams, for offline benchmarks:
+
+- BackboardStub: OpenAI-compatible /chat/completions (single and batched prompts)
+- FixtureServer: static article pages at /article/<n>.html
+- FakeGeminiModel / install_fake_gemini: replaces the google-generativeai model
+
+Each takes a StubConfig: added latency (with jitter), error rate and payload size.
+All responses are deterministic per input, so repeated runs hit the same caches.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_NUMBERED_CLAIM_RE = re.compile(r'^(\d+)\. "', re.M)
+_ARTICLE_PATH_RE = re.compile(r"^/article/(\d+)\.html$")
+
+
+@dataclass
+class StubConfig:
+    latency: float = 0.0  # seconds added per response
+    jitter: float = 0.0  # +/- uniform seconds on top of latency
+    error_rate: float = 0.0  # share of requests answered with 503 (or raised, for Gemini)
+    payload_bytes: int = 0  # approximate response size (padding), 0 = minimal
+
+    def delay(self) -> float:
+        return max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+
+    def fails(self) -> bool:
+        return self.error_rate > 0 and random.random() < self.error_rate
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=4).digest(), "big")
+
+
+def _pad(payload_bytes: int, used: int) -> str:
+    return "x" * max(0, payload_bytes - used)
+
+
+class _StubServer:
+    """ThreadingHTTPServer on 127.0.0.1:<free port>, served from a daemon thread."""
+
+    handler: type
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self.requests = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "_StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real upstreams
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _prelude(self) -> bool:
+        """Count, delay, maybe fail. False if an error response was sent."""
+        stub = self.server.stub
+        stub.requests += 1
+        time.sleep(stub.config.delay())
+        if stub.config.fails():
+            self._send(503, b'{"error": "stub failure"}', "application/json")
+            return False
+        return True
+
+
+def _verdict(claim: str, padding: str) -> dict:
+    # Mostly SUPPORTED so benchmark reports can be posted
+    verdict = ("SUPPORTED", "SUPPORTED", "SUPPORTED", "INSUFFICIENT")[_digest(claim) % 4]
+    return {
+        "verdict": verdict,
+        "confidence": 0.85,
+        "evidence": [{
+            "source": "Bench Wire",
+            "url": "https://example.com/source",
+            "stance": "supports" if verdict == "SUPPORTED" else "neutral",
+            "note": "Stub adjudication." + padding,
+        }],
+    }
+
+
+class _BackboardHandler(_Handler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self._prelude():
+            return
+        prompt = (body.get("messages") or [{}])[-1].get("content", "")
+        padding = _pad(self.server.stub.config.payload_bytes, 300)
+        numbers = _NUMBERED_CLAIM_RE.findall(prompt)
+        if numbers:
+            content = {"results": [{"id": int(n), **_verdict(prompt + n, padding)} for n in numbers]}
+        else:
+            content = _verdict(prompt, padding)
+        response = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": json.dumps(content)}}],
+        }
+        self._send(200, json.dumps(response).encode("utf-8"), "application/json")
+
+
+class BackboardStub(_StubServer):
+    """Point BACKBOARD_BASE_URL at .url (any BACKBOARD_API_KEY)."""
+    handler = _BackboardHandler
+
+
+def article_html(n: int, payload_bytes: int) -> str:
+    paragraphs = []
+    size = 0
+    i = 0
+    while size < max(payload_bytes, 2000):
+        p = (
+            f"<p>In report {n}, section {i}, the river council said the bridge was rebuilt in {1900 + (n + i) % 120}, "
+            f"and that about {(n * 7 + i * 13) % 900 + 100} residents attended the meeting, according to the minutes.</p>"
+        )
+        paragraphs.append(p)
+        size += len(p)
+        i += 1
+    return (
+        f"<html><head><title>Bench article {n}</title></head><body>"
+        f"<nav><a href='/'>Home</a></nav><article><h1>Bench article {n}</h1>{''.join(paragraphs)}</article>"
+        f"<footer>Bench fixtures</footer></body></html>"
+    )
+
+
+class _FixtureHandler(_Handler):
+    def do_GET(self):
+        match = _ARTICLE_PATH_RE.match(self.path.split("?", 1)[0])
+        if not match:
+            self._send(404, b"not found", "text/plain")
+            return
+        if not self._prelude():
+            return
+        html = article_html(int(match.group(1)), self.server.stub.config.payload_bytes)
+        self._send(200, html.encode("utf-8"), "text/html; charset=utf-8")
+
+
+class FixtureServer(_StubServer):
+    """Static article pages: .article_url(n) for n = 0, 1, 2, ..."""
+    handler = _FixtureHandler
+
+    def article_url(self, n: int) -> str:
+        return f"{self.url}/article/{n}.html"
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGeminiModel:
+    """Stands in for genai.GenerativeModel: claims derived from the prompt's article text."""
+
+    def __init__(self, config: StubConfig, claims: int = 5):
+        self.config = config
+        self.claims = claims
+        self.requests = 0
+
+    def _respond(self, prompt: str) -> _FakeResponse:
+        self.requests += 1
+        if self.config.fails():
+            raise RuntimeError("stub Gemini failure")
+        seed = _digest(prompt)
+        data = {
+            "claims": [
+                {"id": f"c{i + 1}", "text": f"Bench claim {seed}-{i}: the bridge was rebuilt in {1900 + i}.", "importance": "high"}
+                for i in range(self.claims)
+            ],
+            "manipulation_signals": [],
+            "ai_likelihood": 0.1,
+            "short_summary": "Benchmark article." + _pad(self.config.payload_bytes, 600),
+        }
+        return _FakeResponse("```json\n" + json.dumps(data) + "\n```")
+
+    def generate_content(self, prompt, generation_config=None, request_options=None):
+        time.sleep(self.config.delay())
+        return self._respond(prompt)
+
+    async def generate_content_async(self, prompt, generation_config=None, request_options=None):
+        await asyncio.sleep(self.config.delay())
+        return self._respond(prompt)
+
+
+def install_fake_gemini(config: StubConfig, claims: int = 5) -> FakeGeminiModel:
+    """Make app.services.gemini use a FakeGeminiModel (call before serving requests)."""
+    from app.services import gemini
+
+    model = FakeGeminiModel(config, claims)
+    gemini.GEMINI_API_KEY = gemini.GEMINI_API_KEY or "bench"
+    gemini.GEMINI_AVAILABLE = True
+    gemini._model = model
+    gemini._generation_config = None
+    return model
@@ -0,0 +1,17 @@
+import os
+import tempfile
+
+# app.db reads SQLITE_DB_PATH at import time: point it at a throwaway database first
+_tmp = tempfile.mkdtemp(prefix="realorrender-tests-")
+os.environ.setdefault("SQLITE_DB_PATH", os.path.join(_tmp, "test.db"))
+os.environ.setdefault("MAINTENANCE_INTERVAL", "0")
+os.environ.setdefault("CLAIM_SWEEP_INTERVAL", "0")
+
+import pytest  # noqa: E402
+
+from app.db import init_db  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def db():
+    init_db()
@@ -0,0 +1,24 @@
+from fastapi.testclient import TestClient
+
+from app.db import create_job, finish_job
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_failed_job_report_is_200_with_failed_status():
+    create_job("job-failed", {"url": "https://example.com/failed"})
+    finish_job("job-failed", error="Could not extract article content.")
+    res = client.get("/api/reports/job-failed")
+    assert res.status_code == 200
+    assert res.json() == {
+        "verification_id": "job-failed",
+        "status": "failed",
+        "error": "Could not extract article content.",
+    }
+
+
+def test_pending_job_report_is_202():
+    create_job("job-pending", {"url": "https://example.com/pending"})
+    res = client.get("/api/reports/job-pending")
+    assert res.status_code == 202 and res.json()["status"] == "pending"
@@ -0,0 +1,91 @@
+import threading
+import time
+
+from app.services import backboard
+from app.utils.deadline import Deadline
+from app.utils.singleflight import SingleFlight
+
+
+def test_caller_only_joins_a_flight_that_outlasts_its_deadline():
+    flights = SingleFlight()
+    short, long = Deadline(1), Deadline(30)
+    fut, leader = flights.acquire("k", short)
+    assert leader
+    other, leader = flights.acquire("k", long)
+    assert leader and other is not fut
+    joined, leader = flights.acquire("k", Deadline(5))
+    assert not leader and joined is other
+    flights.finish("k", fut)
+    assert flights.in_flight() == 1
+    flights.finish("k", other, "done")
+    assert joined.result() == "done" and flights.in_flight() == 0
+
+
+def test_timed_out_result_is_not_shared_with_followers(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fake_adjudicate(claim_text, ch, deadline=None):
+        calls.append(deadline)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+            return backboard.timed_out_result()
+        return ("SUPPORTED", 0.9, [], False)
+
+    monkeypatch.setattr(backboard, "_adjudicate", fake_adjudicate)
+    results = {}
+    leader = threading.Thread(
+        target=lambda: results.update(leader=backboard.verify_claim("Water boils at 100C", "c1", use_cache=False))
+    )
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(
+        target=lambda: results.update(follower=backboard.verify_claim("Water boils at 100C", "c2", use_cache=False))
+    )
+    follower.start()
+    time.sleep(0.1)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert backboard._is_timed_out(results["leader"])
+    assert results["follower"][0] == "SUPPORTED"
+    assert len(calls) == 2
+
+
+def test_batch_awaits_claims_already_in_flight(monkeypatch):
+    texts = ["The bridge opened in 1932", "The tower is 300 m tall", "The river is 80 km long"]
+    prompts = []
+
+    def fake_call(prompt, web_search=True, max_tokens=1024, deadline=None):
+        prompts.append(prompt)
+        return None
+
+    monkeypatch.setattr(backboard, "_call_backboard", fake_call)
+    held = backboard.claim_hash(texts[0])
+    fut, leader = backboard._claim_flights.acquire(held)
+    assert leader
+    shared = ("SUPPORTED", 0.8, [], False)
+    threading.Timer(0.1, backboard._claim_flights.finish, (held, fut, shared)).start()
+
+    results = backboard.verify_claims_batch(texts)
+
+    assert results[0] == shared
+    assert len(prompts) == 1 and texts[0] not in prompts[0]
+    assert backboard._claim_flights.in_flight() == 0
+
+
+def test_failed_batch_is_left_for_per_claim_calls(monkeypatch):
+    chunk = [("h1", "a", [0]), ("h2", "b", [1, 2])]
+    results, to_store = backboard._batch_outcomes(chunk, None, Deadline(30))
+    assert results == {} and to_store == []
+
+    results, _ = backboard._batch_outcomes(chunk, None, Deadline(0))
+    assert sorted(results) == [0, 1, 2]
+    assert all(backboard._is_timed_out(v) for v in results.values())
+
+    monkeypatch.setattr(type(backboard.backboard_breaker), "state", property(lambda self: "open"))
+    results, _ = backboard._batch_outcomes(chunk, None, Deadline(30))
+    assert sorted(results) == [0, 1, 2]
+    assert not any(backboard._is_timed_out(v) for v in results.values())
@@ -0,0 +1,26 @@
+import asyncio
+
+from app.models import VerifyArticleRequest
+from app.services.verify import _dedupe_items, verify_bulk
+
+
+async def _collect(items):
+    return {r.index: r async for r in verify_bulk(items)}
+
+
+def test_invalid_items_get_their_own_400():
+    items = [VerifyArticleRequest(url="ftp://example.com/x"), VerifyArticleRequest()]
+    results = asyncio.run(_collect(items))
+    assert results[1].status_code == 400
+    assert results[0].status_code != 400
+
+
+def test_items_without_a_key_are_never_grouped():
+    items = [
+        VerifyArticleRequest(url="ftp://example.com/a"),
+        VerifyArticleRequest(url="ftp://example.com/b"),
+        VerifyArticleRequest(url="https://example.com/story?utm_source=x"),
+        VerifyArticleRequest(url="https://example.com/story"),
+    ]
+    groups = _dedupe_items(list(enumerate(items)))
+    assert sorted(indexes for _, indexes in groups) == [[0], [1], [2, 3]]
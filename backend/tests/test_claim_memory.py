@@ -0,0 +1,64 @@
+import pytest
+
+from app.services.claim_memory import get_similar_claim, put_claim
+from app.utils.hashing import claim_hash
+from app.utils.minhash import anchor_tokens, similarity_tokens
+
+EVIDENCE = [{"source": "Test", "url": "", "stance": "supports", "note": ""}]
+
+CONTRADICTING_PAIRS = [
+    ("Senator Jane Smith did not sign the infrastructure bill last week",
+     "Senator Jane Smith did sign the infrastructure bill last week"),
+    ("Senator Jane Smith didn't sign the farm bill last week",
+     "Senator Jane Smith did sign the farm bill last week"),
+    ("The national unemployment rate reached 3.5% in the third quarter",
+     "The national unemployment rate reached 7.5% in the third quarter"),
+    ("The city council approved the new downtown stadium proposal on Monday",
+     "The city council rejected the new downtown stadium proposal on Monday"),
+    ("Representative John Doe voted against the clean water protection act",
+     "Representative John Doe voted for the clean water protection act"),
+    ("The regional hospital opened its new cancer wing in March 2021",
+     "The regional hospital opened its new cancer wing in May 2021"),
+    ("The new observation tower in the harbour district is 300 m tall",
+     "The new observation tower in the harbour district is 300 million tall"),
+    ("The national sprint champion ran 100 m in 9.58 seconds at the stadium",
+     "The national sprint champion ran 100 million in 9.58 seconds at the stadium"),
+]
+
+
+def _store(text: str):
+    put_claim(claim_hash(text), "SUPPORTED", 0.9, EVIDENCE, claim_text=text)
+
+
+@pytest.mark.parametrize("stored, asked", CONTRADICTING_PAIRS)
+def test_contradicting_claims_are_not_near_duplicates(stored, asked):
+    _store(stored)
+    assert get_similar_claim(asked) is None
+
+
+def test_rephrased_claim_is_a_near_duplicate():
+    _store("The state legislature passed the education budget of 5 million dollars in 2022")
+    entry = get_similar_claim(
+        "According to local reports, in 2022 the state legislature passed the education budget of 5,000,000 dollars."
+    )
+    assert entry is not None and entry["verdict"] == "SUPPORTED"
+
+
+@pytest.mark.parametrize("text, anchors", [
+    ("The tower is 300 m tall", {"300"}),
+    ("He ran 100 m in 9.58 seconds", {"100", "9.58"}),
+    ("Runners finished the 5k course", {"5k"}),
+    ("The startup received $5m", {"5000000"}),
+    ("The startup received $5 million", {"5000000"}),
+    ("The fine was £3k", {"3000"}),
+    ("The fine was £3,000", {"3000"}),
+    ("The budget is €2.5bn", {"2500000000"}),
+])
+def test_scale_suffixes_only_expand_for_amounts(text, anchors):
+    assert anchor_tokens(similarity_tokens(text)) == anchors
+
+
+def test_currency_shorthand_is_a_near_duplicate():
+    _store("The county sold the old municipal airport land for $12m last spring")
+    entry = get_similar_claim("The county sold the old municipal airport land for $12 million last spring")
+    assert entry is not None
@@ -0,0 +1,35 @@
+import pytest
+from readability import Document
+
+from app.services.extract import _TextDocument
+
+_SENTENCE = "The harbour bridge reopened to traffic on Monday after repairs. "
+
+
+def _page(chars: int) -> str:
+    text = (_SENTENCE * (chars // len(_SENTENCE) + 1))[:chars]
+    return (
+        "<html><head><title>T</title></head><body>"
+        '<div class="nav"><a href="/">Home</a></div>'
+        f'<article class="story"><p class="lead">{text}</p><p>&copy; Example &amp; Co</p></article>'
+        "</body></html>"
+    )
+
+
+def _passes(cls, html: str) -> int:
+    """How many times summary() cleaned an article (2 = it re-parsed leniently)."""
+    calls = []
+
+    class Counting(cls):
+        def get_clean_html(self):
+            calls.append(1)
+            return super().get_clean_html()
+
+    Counting(html).summary()
+    return len(calls)
+
+
+@pytest.mark.parametrize("chars", [0, 40, 120, 160, 180, 200, 220, 260, 400, 2000])
+def test_lenient_retry_matches_readability_html_length_check(chars):
+    html = _page(chars)
+    assert _passes(_TextDocument, html) == _passes(Document, html)
@@ -0,0 +1,40 @@
+import datetime
+
+from app.db import claim_next_job, create_job, get_connection, get_job, heartbeat_jobs
+from app.services import jobs
+
+
+def _claim(worker_id: str) -> str:
+    job = claim_next_job(worker_id)
+    assert job is not None
+    return job["verification_id"]
+
+
+def _age_heartbeat(verification_id: str, seconds: float):
+    old = (datetime.datetime.utcnow() - datetime.timedelta(seconds=seconds)).isoformat()
+    with get_connection() as conn:
+        conn.execute(
+            "UPDATE verification_jobs SET started_at = ?, heartbeat_at = ? WHERE verification_id = ?",
+            (old, old, verification_id),
+        )
+
+
+def test_recovery_leaves_jobs_of_live_processes_alone():
+    # Another process on the same host (same JOB_WORKER_NAME) is running a long job
+    create_job("job-live", {"url": "https://example.com/live"})
+    vid = _claim(f"{jobs.JOB_WORKER_NAME}:99999:0")
+    _age_heartbeat(vid, jobs.JOB_LEASE_SECONDS * 10)
+    heartbeat_jobs([vid])
+
+    jobs.recover_jobs()
+    assert get_job(vid)["status"] == "running"
+
+
+def test_recovery_requeues_jobs_without_heartbeat():
+    create_job("job-dead", {"url": "https://example.com/dead"})
+    vid = _claim(f"{jobs.JOB_WORKER_NAME}:99998:0")
+    _age_heartbeat(vid, jobs.JOB_LEASE_SECONDS + 5)
+
+    assert jobs.recover_jobs() >= 1
+    job = get_job(vid)
+    assert job["status"] == "pending" and job["worker_id"] is None
@@ -0,0 +1,83 @@
+import itertools
+
+import pytest
+
+from app.models import ClaimResult, EvidenceItem, GeminiOutput
+from app.services.backboard import timed_out_result, _unavailable_result
+from app.services.extract import ExtractedArticle
+from app.services.verify import build_report
+
+ARTICLE = ExtractedArticle(title="Test", text="Body", url="https://example.com/a")
+N_CLAIMS = 7
+RANK = {"BLOCK": 0, "WARN": 1, "ALLOW": 2}
+MANIPULATIVE = dict(ai_likelihood=1.0, signals=["a", "b", "c", "d", "e"])
+
+
+def _gemini(ai_likelihood: float = 0.0, signals: list[str] = ()) -> GeminiOutput:
+    return GeminiOutput(claims=[], manipulation_signals=list(signals), ai_likelihood=ai_likelihood, short_summary="S.")
+
+
+def _claim(i: int, verdict: str) -> ClaimResult:
+    stance = {"SUPPORTED": "supports", "CONTRADICTED": "contradicts"}.get(verdict, "neutral")
+    evidence = [EvidenceItem(source="Wire", url="https://example.com", stance=stance, note="")]
+    return ClaimResult(id=f"c{i}", text=f"Claim {i}", verdict=verdict, confidence=0.9, evidence=evidence)
+
+
+def _timed_out(i: int) -> ClaimResult:
+    verdict, confidence, evidence, _ = timed_out_result()
+    return ClaimResult(
+        id=f"c{i}", text=f"Claim {i}", verdict=verdict, confidence=confidence, evidence=evidence, timed_out=True
+    )
+
+
+def _unavailable(i: int) -> ClaimResult:
+    verdict, confidence, evidence, _ = _unavailable_result()
+    return ClaimResult(id=f"c{i}", text=f"Claim {i}", verdict=verdict, confidence=confidence, evidence=evidence)
+
+
+def _report(verdicts: list[str], gemini: GeminiOutput):
+    """verdicts[i] for claim i; None marks a timed-out claim."""
+    claims = [_timed_out(i) if v is None else _claim(i, v) for i, v in enumerate(verdicts)]
+    return build_report(ARTICLE, gemini, claims)
+
+
+@pytest.mark.parametrize("gemini", [_gemini(), _gemini(**MANIPULATIVE)])
+@pytest.mark.parametrize("finished", [[], ["CONTRADICTED"], ["CONTRADICTED", "CONTRADICTED"], ["INSUFFICIENT"]])
+def test_score_is_monotonic_in_adjudicated_claims(gemini, finished):
+    """With `finished` already adjudicated, each further claim finishing as SUPPORTED never lowers the score."""
+    rest = N_CLAIMS - len(finished)
+    reports = [_report(finished + ["SUPPORTED"] * k + [None] * (rest - k), gemini) for k in range(rest + 1)]
+    scores = [r.credibility_score for r in reports]
+    assert scores == sorted(scores), scores
+    decisions = [RANK[r.decision] for r in reports]
+    assert decisions == sorted(decisions)
+    assert all(r.partial for r in reports[:-1]) and not reports[-1].partial
+
+
+@pytest.mark.parametrize("gemini", [_gemini(), _gemini(**MANIPULATIVE)])
+def test_partial_report_never_beats_its_finished_report(gemini):
+    for verdicts in itertools.product(["SUPPORTED", "CONTRADICTED", "INSUFFICIENT", None], repeat=4):
+        verdicts = list(verdicts)
+        partial = _report(verdicts, gemini)
+        finished = _report([v or "SUPPORTED" for v in verdicts], gemini)
+        assert partial.credibility_score <= finished.credibility_score, verdicts
+        assert RANK[partial.decision] <= RANK[finished.decision], verdicts
+
+
+def test_timed_out_claims_do_not_lift_a_block():
+    gemini = _gemini(**MANIPULATIVE)
+    finished = _report(["CONTRADICTED", "CONTRADICTED"], gemini)
+    assert finished.decision == "BLOCK"
+    partial = _report(["CONTRADICTED", "CONTRADICTED"] + [None] * 5, gemini)
+    assert partial.decision == "BLOCK" and partial.credibility_score <= finished.credibility_score
+
+
+def test_one_supported_claim_does_not_block():
+    report = _report(["SUPPORTED"] + [None] * (N_CLAIMS - 1), _gemini())
+    assert report.decision != "BLOCK" and report.partial
+
+
+def test_unavailable_note_is_kept_when_other_claims_timed_out():
+    report = build_report(ARTICLE, _gemini(), [_unavailable(0), _timed_out(1)])
+    assert "Verification service unavailable" in report.summary
+    assert report.summary.index("unavailable") < report.summary.index("Partial report")
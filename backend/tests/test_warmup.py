@@ -0,0 +1,29 @@
+import datetime
+import gzip
+import json
+
+from app.warmup import SNAPSHOT_COLUMNS, SNAPSHOT_FORMAT, SNAPSHOT_VERSION, _load, _read_snapshot
+
+
+def test_malformed_snapshot_rows_are_skipped_as_invalid(tmp_path):
+    now = datetime.datetime.utcnow().isoformat()
+    good = ["h-good", "SUPPORTED", 0.9, "[]", now, "bridge opened 1932", None]
+    rows = [
+        good,
+        ["h-short", "SUPPORTED", 0.9, "[]"],
+        ["h-null", "SUPPORTED", None, "[]", now, None, None],
+        ["h-verdict", "MAYBE", 0.9, "[]", now, None, None],
+        {"claim_hash": "h-dict"},
+    ]
+    path = tmp_path / "snapshot.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        header = {"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_VERSION, "lsh": [0, 0], "columns": SNAPSHOT_COLUMNS}
+        f.write(json.dumps(header) + "\n")
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+        f.write("not json\n")
+
+    stats = {"read": 0, "written": 0, "expired": 0, "invalid": 0}
+    _load(_read_snapshot(str(path), stats), 100, stats)
+
+    assert stats == {"read": 1, "written": 1, "expired": 0, "invalid": 5}
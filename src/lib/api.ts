@@ -1,4 +1,4 @@
-import type { Post, VerificationReport } from "@/types";
+import type { JobStatus, Post, VerificationReport } from "@/types";
 import { MOCK_ALLOW_REPORT, MOCK_WARN_REPORT, MOCK_BLOCK_REPORT } from "./mockData";
 import { getPostsFromStorage, savePostToStorage } from "./postStore";
 import { getReportFromStorage, saveReportToStorage } from "./reportStore";
@@ -123,13 +123,31 @@ export async function clearFeed(): Promise<void> {
   }
 }
 
-export async function fetchReport(verificationId: string): Promise<VerificationReport | null> {
-  try {
+// Queued verifications: GET /reports/{id} answers 202 with a JobStatus until the job finishes
+const REPORT_POLL_INTERVAL_MS = 1000;
+const REPORT_POLL_TIMEOUT_MS = 5 * 60 * 1000;
+
+function isJobStatus(data: VerificationReport | JobStatus): data is JobStatus {
+  return !("decision" in data);
+}
+
+async function pollReport(verificationId: string): Promise<VerificationReport | JobStatus> {
+  const giveUpAt = Date.now() + REPORT_POLL_TIMEOUT_MS;
+  for (;;) {
     const res = await fetch(`${API_PREFIX}/reports/${verificationId}`);
     if (!res.ok) {
       throw new Error(`Fetch report failed: ${res.status}`);
     }
-    return res.json();
+    const data: VerificationReport | JobStatus = await res.json();
+    if (res.status !== 202 || Date.now() >= giveUpAt) return data;
+    await new Promise((resolve) => setTimeout(resolve, REPORT_POLL_INTERVAL_MS));
+  }
+}
+
+export async function fetchReport(verificationId: string): Promise<VerificationReport | null> {
+  let data: VerificationReport | JobStatus;
+  try {
+    data = await pollReport(verificationId);
   } catch (error) {
     // Fallback: check localStorage, then mock if ID matches
     const stored = getReportFromStorage(verificationId);
@@ -139,4 +157,12 @@ export async function fetchReport(verificationId: string): Promise<VerificationR
     if (verificationId.includes("mock-block")) return MOCK_BLOCK_REPORT;
     return null;
   }
+  if (isJobStatus(data)) {
+    throw new Error(
+      data.status === "failed"
+        ? `Verification failed: ${data.error || "unknown error"}`
+        : "Verification is still running. Try again in a moment."
+    );
+  }
+  return data;
 }
@@ -1,5 +1,15 @@
+export type JobState = "pending" | "running" | "done" | "failed";
+
+/** Returned instead of a report while a queued verification is unfinished, or after it failed. */
+export interface JobStatus {
+  verification_id: string;
+  status: JobState;
+  error?: string | null;
+}
+
 export interface VerificationReport {
   verification_id: string;
+  status?: JobState;
   decision: "ALLOW" | "WARN" | "BLOCK";
   credibility_score: number;
   ai_likelihood?: number;
@@ -16,6 +26,7 @@ export interface VerificationReport {
     text: string;
     verdict: "SUPPORTED" | "CONTRADICTED" | "INSUFFICIENT";
     confidence: number;
+    timed_out?: boolean;
     evidence: Array<{
       source: string;
       url: string;
@@ -23,6 +34,8 @@ export interface VerificationReport {
       note: string;
     }>;
   }>;
+  partial?: boolean;
+  timings?: Record<string, number>;
 }
 
 export interface Post {